@@ -1,16 +1,19 @@
+import json
 import pandas as pd
-from SESAMI.SESAMI_1.betan import BETAn
+from SESAMI.SESAMI_1.betan import BETAn, SUMMARY_VERSION
+from SESAMI.metrics import count, stage
+from SESAMI.result_cache import COMPUTE_OPTIONS, PLOT_OPTIONS, canonical_options, isotherm_digest, result_key
+from SESAMI.workspace import as_files, open_file
 
+# The files calculation_runner saves for a set of figures: the multiplot, and what the individual figures are drawn from.
+# The individual figures are drawn when they are first asked for (see figures.render_on_request).
+PLOT_FILES = ["multiplot_{}.png", "panels_{}.pickle"]
+RENDER_RECORD = "rendered.json" # Which plot number each set of figures in a user's folder was rendered with. See reuse_plots.
+MAX_RENDER_RECORDS = 16
 
-def calculation_runner(MAIN_PATH, user_options, USER_ID, plot_number):
-    # This function runs SESAMI 1 code.
-    # It generates 6 different types of plots (BET, BET Linear, BET+ESW, ESW, Isotherm, and a Multiplot which shows the previous five types of plots all combined in different panes).
-    # It also generates SESAMI 1 BET and BET+ESW information to display on the website.
 
-    # The function takes the main path to the SESAMI web folder, the user-selected plotting information, the user's unique ID so that the correct isotherm (input.txt) is read and 
-    # figures can be placed in the appropriate folder, and the plot number so that plots can all be named uniquely.
-
-    minlinelength = 4 # Minimum number of points required for a group of points to be considered a line
+def adsorbate_conditions(user_options):
+    # This function returns the adsorbate, temperature (K), and saturation pressure (Pa) selected in user_options.
 
     if user_options['custom adsorbate'] == 'Yes':
         p0 = float(user_options['custom saturation pressure'])
@@ -24,27 +27,144 @@ def calculation_runner(MAIN_PATH, user_options, USER_ID, plot_number):
         elif gas == 'Nitrogen':
             temperature = 77 # K
 
+    return gas, temperature, p0
+
+
+def read_isotherm(isotherm_data_path, sep="\t"):
+    # This function reads an isotherm file (e.g. a user's input.txt) into a DataFrame with columns "Pressure" and "Loading".
+    # The first row of the file holds the column titles, and is skipped.
+
+    column_names = ["Pressure", "Loading"]
+    return pd.read_table(
+        isotherm_data_path, skiprows=1, sep=sep, names=column_names, encoding="utf-8-sig"
+    ) # utf-8-sig, since CSVs saved by Excel start with a byte order mark.
+
+
+def clean_isotherm(data):
+    # This function prepares an isotherm read by read_isotherm for BETAn.prepdata.
+
+    # Preventing issues with zero pressure in the first row
+    if data["Pressure"].iloc[0] == 0: # Zero pressure in the first row
+        data = data.copy()
+        data.loc[data.index[0], 'Pressure'] = data["Pressure"].iloc[1] / 2 # Set the first row's entry to something non-zero (half of the second row's Pressure)
+
+    return data
+
+
+def reuse_plots(sumpath, render_key, plot_number, files=PLOT_FILES):
+    # This function copies the figures of an earlier calculation with the same isotherm, settings, and plot settings (render_key) to the names for plot_number,
+    # so that they do not have to be drawn again. Returns True if it did, and False if the figures still have to be rendered.
+
+    sumfiles = as_files(sumpath) # A folder, or the files of a session (see SESAMI/workspace.py).
+    try:
+        rendered = json.loads(sumfiles.read(RENDER_RECORD))
+    except (TypeError, ValueError):
+        return False
+    previous = rendered.get(render_key)
+    if previous is None:
+        return False
+    sources = [file.format(previous) for file in files]
+    if not all(sumfiles.exists(source) for source in sources): # e.g. cleaned up since, or saved before the figures were made on request.
+        return False
+    for file, source in zip(files, sources):
+        destination = file.format(plot_number)
+        if source != destination:
+            sumfiles.copy(source, destination)
+    return True
+
+
+def record_plots(sumpath, render_key, plot_number):
+    # This function notes that the figures for render_key were saved with plot_number, for reuse_plots.
+
+    sumfiles = as_files(sumpath)
+    try:
+        rendered = json.loads(sumfiles.read(RENDER_RECORD))
+    except (TypeError, ValueError):
+        rendered = {}
+    rendered.pop(render_key, None)
+    rendered[render_key] = plot_number
+    rendered = dict(list(rendered.items())[-MAX_RENDER_RECORDS:]) # Only the most recent ones.
+    sumfiles.write(RENDER_RECORD, json.dumps(rendered).encode())
+
+
+def calculation_summary(MAIN_PATH, user_options, USER_ID, isotherm_data=None, result_cache=None, user_files=None):
+    # This function runs the SESAMI 1 calculation, without making any plots. Returns the BETAn used and the summary from BETAn.computesummary.
+    # The arguments are as for calculation_runner. The calculation options in user_options are cast to numbers in place.
+
+    minlinelength = 4 # Minimum number of points required for a group of points to be considered a line
+
+    gas, temperature, p0 = adsorbate_conditions(user_options)
+
     # changing some variable types
-    user_options["font size"] = int(user_options["font size"])
     user_options["R2 cutoff"] = float(user_options["R2 cutoff"])
     user_options["R2 min"] = float(user_options["R2 min"])
-    user_options["dpi"] = float(user_options["dpi"])
 
     b = BETAn(gas, temperature, minlinelength, user_options)
 
-    column_names = ["Pressure", "Loading"]
-    data = pd.read_table(
-        f"{MAIN_PATH}user_{USER_ID}/input.txt", skiprows=1, sep="\t", names=column_names
-    )
-    # Preventing issues with zero pressure in the first row
-    if data["Pressure"].iloc[0] == 0: # Zero pressure in the first row
-        data.loc[0, 'Pressure'] = data["Pressure"].iloc[1] / 2 # Set the first row's entry to something non-zero (half of the second row's Pressure)
+    if isotherm_data is None:
+        with stage("read_isotherm"):
+            data = read_isotherm(open_file(as_files(user_files or f"{MAIN_PATH}user_{USER_ID}/"), "input.txt"))
+    else:
+        data = isotherm_data
+
+    summary = None
+    if result_cache is not None:
+        key = result_key("SESAMI 1", isotherm_digest(data), canonical_options(user_options, COMPUTE_OPTIONS), version=SUMMARY_VERSION)
+        summary = result_cache.get(key)
+
+    if summary is None:
+        with stage("prepdata"):
+            data = clean_isotherm(data)
+            data = b.prepdata(data, p0=p0)
+
+        # This command generates BET and BET+ESW information.
+        with stage("computesummary"):
+            summary = b.computesummary(data, user_options)
+        if result_cache is not None:
+            result_cache.set(key, summary)
+    else:
+        count("cached_summaries")
+
+    return b, summary
+
+
+def calculation_runner(MAIN_PATH, user_options, USER_ID, plot_number, makeplots="Yes", isotherm_data=None, result_cache=None, user_files=None):
+    # This function runs SESAMI 1 code.
+    # It generates 6 different types of plots (BET, BET Linear, BET+ESW, ESW, Isotherm, and a Multiplot which shows the previous five types of plots all combined in different panes).
+    # It also generates SESAMI 1 BET and BET+ESW information to display on the website.
+
+    # The function takes the main path to the SESAMI web folder, the user-selected plotting information, the user's unique ID so that the correct isotherm (input.txt) is read and
+    # figures can be placed in the appropriate folder, and the plot number so that plots can all be named uniquely.
+    # If makeplots is "No", only the BET and BET+ESW information is generated, and matplotlib is not used.
+    # If isotherm_data (a DataFrame with columns "Pressure" and "Loading") is given, it is used instead of reading the user's input.txt again.
+    # If result_cache (a SESAMI.result_cache.ResultCache) is given, the BET and BET+ESW results are looked up in it before they are calculated, and
+    # figures that were already drawn for the same isotherm and settings are copied instead of drawn again.
+    # Only the multiplot is saved. The other figures are drawn when they are first asked for (see figures.render_on_request).
+    # user_files is where the user's input.txt and figures are, if not in f"{MAIN_PATH}user_{USER_ID}/": a folder, or the files of a session (see SESAMI/workspace.py).
+
+    if makeplots == "Yes":
+        user_options["font size"] = int(user_options["font size"])
+        user_options["dpi"] = float(user_options["dpi"])
+
+    b, summary = calculation_summary(MAIN_PATH, user_options, USER_ID, isotherm_data=isotherm_data, result_cache=result_cache, user_files=user_files)
 
-    data = b.prepdata(data, p0=p0)
+    if summary["status"] != "OK":
+        return summary["status"], summary["status"]
 
-    # This command generates BET and BET+ESW information and figures.
-    BET_dict, BET_ESW_dict = b.generatesummary(
-        data, user_options, MAIN_PATH, plot_number, sumpath=f"{MAIN_PATH}user_{USER_ID}/"
-    )
+    # Making the figures.
+    if makeplots == "Yes":
+        sumpath = as_files(user_files or f"{MAIN_PATH}user_{USER_ID}/")
+        if result_cache is None:
+            with stage("render"):
+                b.rendersummary(summary, user_options, MAIN_PATH, plot_number, sumpath, saveindividual="On request")
+        else:
+            # Keyed on the prepared isotherm the figures are drawn from.
+            render_key = result_key("SESAMI 1 plots", isotherm_digest(summary["data"]), canonical_options(user_options, COMPUTE_OPTIONS + PLOT_OPTIONS))
+            if reuse_plots(sumpath, render_key, plot_number):
+                count("reused_figures")
+            else:
+                with stage("render"):
+                    b.rendersummary(summary, user_options, MAIN_PATH, plot_number, sumpath, saveindividual="On request")
+            record_plots(sumpath, render_key, plot_number)
 
-    return BET_dict, BET_ESW_dict
+    return summary["BET_dict"], summary["BET_ESW_dict"]
@@ -1,12 +1,14 @@
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib import ticker
 import pandas as pd
+import copy
 import os
 import numpy as np
 import scipy
-import statsmodels.formula.api as smf
+import statsmodels.api as sm
 import scipy.stats as ss
+from SESAMI.SESAMI_1.regression import sliding_slopes, local_minima, window_linregs, window_extent
+from SESAMI.SESAMI_1.figures import savepng, savefigure, savepanelspec
+from SESAMI.metrics import count, stage
+from SESAMI.workspace import as_files
 
 """
 Created on Mon Apr  9 11:29:12 2018
@@ -16,10 +18,214 @@ Created on Mon Apr  9 11:29:12 2018
 Integrated for use with the SESAMI website by Gianmarco Terrones.
 """
 
-mpl.use("agg")
-mpl.rcParams["mathtext.default"] = "regular"  # preventing italics in axis labels
 pd.set_option("display.max_rows", 500)
 
+# matplotlib is only imported once a plot is made (see _load_matplotlib), so that calculations without plots do not pay for it.
+mpl = None
+plt = None
+ticker = None
+
+
+def _load_matplotlib():
+    # Imports matplotlib into the module globals mpl, plt, and ticker, if that has not happened yet.
+    global mpl, plt, ticker
+    if plt is None:
+        import matplotlib
+        matplotlib.use("agg")
+        matplotlib.rcParams["mathtext.default"] = "regular"  # preventing italics in axis labels
+        import matplotlib.pyplot
+        from matplotlib import ticker as mpl_ticker
+        mpl, plt, ticker = matplotlib, matplotlib.pyplot, mpl_ticker
+
+
+STYLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mplstyle")
+
+
+def useplotstyle(plotting_information, stylepath=STYLE_PATH):
+    # Sets the style, font size, and font family of the plots for the plotting settings from the front end.
+    _load_matplotlib()
+    plt.style.use(stylepath)
+    mpl.rcParams.update(
+        {"font.size": plotting_information["font size"]}
+    )  # changing the font size to be used in the figures
+    mpl.rcParams["font.family"] = plotting_information[
+        "font type"
+    ]  # setting the font family to be used in the figures
+
+
+
+# Changes whenever what BETAn.computesummary returns changes, so that summaries cached by an earlier version are not used (see SESAMI_1.calculation_summary).
+SUMMARY_VERSION = 2
+
+
+class IsothermArrays:
+    """
+    The columns of a prepared isotherm (see BETAn.prepdata) as read-only numpy arrays, for the candidate search in picklen.
+    The arrays are views of the DataFrame's columns, so making them does not copy the isotherm, and the isotherm is passed on by reference from then on.
+    Since the arrays can not be written to, no function can change the isotherm for its caller.
+    Lookups that every candidate region needs (see qmbounds and BETAn.con1pressure) are computed once per IsothermArrays and kept with it.
+
+    Attributes
+    ----------
+    index : numpy.ndarray
+        The index labels of the rows, as in the DataFrame (e.g. con1limit and eswminima are labels).
+    Pressure, Loading, P_rel, BETy, BET_y2, phi : numpy.ndarray
+        The columns of the same name.
+    """
+
+    __slots__ = ("index", "Pressure", "Loading", "P_rel", "BETy", "BET_y2", "phi", "lookups")
+    columns = __slots__[1:-1]
+
+    def __init__(self, index, Pressure, Loading, P_rel, BETy, BET_y2, phi):
+        for name, values in zip(self.__slots__, (index, Pressure, Loading, P_rel, BETy, BET_y2, phi)):
+            values = np.asarray(values).view()
+            values.flags.writeable = False
+            setattr(self, name, values)
+        self.lookups = {} # Computed from the arrays when first needed, by name.
+
+    @classmethod
+    def of(cls, data):
+        """
+        of returns data if it is an IsothermArrays already, and otherwise the IsothermArrays of the DataFrame data.
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(data.index.values, *(data[column].to_numpy(dtype=float) for column in cls.columns))
+
+    def head(self, n):
+        """
+        head returns the first n rows, as an IsothermArrays of views of these arrays.
+        """
+        return IsothermArrays(self.index[:n], *(getattr(self, column)[:n] for column in self.columns))
+
+    def qmbounds(self, qm):
+        """
+        qmbounds finds the data points on either side of each qm, for the third consistency criterion (see BETAn.linregauto):
+        the largest loading at most qm, the smallest loading above qm, the largest relative pressure among the points with a loading at most qm,
+        and the smallest relative pressure among those with a loading above qm. Each is NaN where there is no such point.
+        The points are sorted by loading once (and kept in lookups), so each qm is a binary search instead of a pass over all points.
+
+        Parameters
+        ----------
+        qm : float or numpy.ndarray
+            Monolayer loadings (mol/kg).
+
+        Returns
+        -------
+        lower_limit_y, upper_limit_y, lower_limit_x, upper_limit_x : numpy.ndarray
+            Shaped like qm.
+        """
+        if "qmbounds" not in self.lookups:
+            valid = np.flatnonzero(~np.isnan(self.Loading)) # As with masks, points without a loading are on neither side.
+            order = valid[np.argsort(self.Loading[valid], kind="stable")]
+            loading = self.Loading[order]
+            prel = self.P_rel[order]
+            # The largest relative pressure up to each point, and the smallest from each point on, in the order of loading. NaNs are skipped, as by pandas.
+            self.lookups["qmbounds"] = (loading, np.fmax.accumulate(prel), np.fmin.accumulate(prel[::-1])[::-1])
+        loading, prel_max, prel_min = self.lookups["qmbounds"]
+
+        qm = np.asarray(qm, dtype=float)
+        if len(loading) == 0:
+            nothing = np.full(qm.shape, np.nan)
+            return nothing, nothing, nothing, nothing
+        below = np.searchsorted(loading, qm, side="right") # The number of points with a loading at most qm.
+        has_below = (below > 0) & ~np.isnan(qm) # No loading is at most (or above) a qm of NaN.
+        has_above = (below < len(loading)) & ~np.isnan(qm)
+        last_below = np.clip(below - 1, 0, len(loading) - 1)
+        first_above = np.clip(below, 0, len(loading) - 1)
+        return (
+            np.where(has_below, loading[last_below], np.nan),
+            np.where(has_above, loading[first_above], np.nan),
+            np.where(has_below, prel_max[last_below], np.nan),
+            np.where(has_above, prel_min[first_above], np.nan),
+        )
+
+    def __len__(self):
+        return len(self.index)
+
+
+class BETFit:
+    """
+    The results of fitting the BET equation to a chosen linear region, as computed once by BETAn.linregauto.
+    The candidate search (BETAn.picklen), the plots (BETAn.makelinregplot) and the results shown on the website (BETFit.to_dict) are all made from it,
+    so the region is not fit again to draw it. Only numbers are kept, not the statsmodels results, so a BETFit is small to keep and to cache.
+
+    Attributes
+    ----------
+    p, q : int
+        The positions of the data points that start and end the linear region.
+    intercept, slope : float
+        The fitted line through BETy against P_rel.
+    C, qm, A_BET : float
+        See BETAn.linregauto.
+    x_max, x_BET3, x_BET4 : float
+        See BETAn.linregauto.
+    con1, con2, con3, con4 : str
+        "Yes" or "No", depending on whether each Rouquerol consistency criterion is satisfied.
+    R2 : float
+        The R² of the fitted line.
+    low_P, high_P : float
+        The pressures (Pa) at the start and end of the linear region.
+    R2_adj : float
+        The adjusted R² of the fitted line.
+    f_pvalue : float
+        The p-value of the F test of the fit.
+    t_pvalues : tuple
+        The p-values of the t tests of the intercept and the slope.
+    shapiro_pvalue : float
+        The p-value of the Shapiro-Wilk test of the normalized, externally studentized residuals.
+    outliers : tuple
+        The positions of the data points whose externally studentized residual is above 3.
+    """
+
+    __slots__ = (
+        "p", "q", "intercept", "slope", "C", "qm", "A_BET", "x_max", "x_BET3", "x_BET4", "con1", "con2", "con3", "con4", "R2", "low_P", "high_P",
+        "R2_adj", "f_pvalue", "t_pvalues", "shapiro_pvalue", "outliers",
+    )
+
+    def __init__(
+        self, p, q, intercept, slope, C, qm, A_BET, x_max, x_BET3, x_BET4, con1, con2, con3, con4, R2, low_P, high_P,
+        R2_adj=None, f_pvalue=None, t_pvalues=None, shapiro_pvalue=None, outliers=(),
+    ):
+        self.p = p
+        self.q = q
+        self.intercept = intercept
+        self.slope = slope
+        self.C = C
+        self.qm = qm
+        self.A_BET = A_BET
+        self.x_max = x_max
+        self.x_BET3 = x_BET3
+        self.x_BET4 = x_BET4
+        self.con1 = con1
+        self.con2 = con2
+        self.con3 = con3
+        self.con4 = con4
+        self.R2 = R2
+        self.low_P = low_P
+        self.high_P = high_P
+        self.R2_adj = R2_adj
+        self.f_pvalue = f_pvalue
+        self.t_pvalues = t_pvalues
+        self.shapiro_pvalue = shapiro_pvalue
+        self.outliers = outliers
+
+    def to_dict(self):
+        """
+        to_dict returns the results as shown on the website: the BET_dict or BET_ESW_dict of generatesummary.
+        """
+        return {
+            "C": self.C,
+            "qm": self.qm,
+            "A_BET": self.A_BET,
+            "con3": self.con3,
+            "con4": self.con4,
+            "length_linear_region": self.q - self.p,
+            "R2_linear_region": self.R2,
+            "low_P_linear_region": self.low_P,
+            "high_P_linear_region": self.high_P,
+        }
+
 
 class BETAn:
     def __init__(
@@ -109,13 +315,15 @@ class BETAn:
             # The first Rouquerol consistency criterion is as follows:
             # The linear region should only be a range of p/p0 in which the value of q(1-p/p0) monotonically increases with p/p0
             # Where q is loading and p/p0 is P_rel. So, the setting of con1limit below is the largest P_rel data point in the isotherm in the first region where q(1-p/p0) is monotonically increasing with p/p0
-            self.con1limit = self.getlocalextremum(
-                data, column="BET_y2", x="P_rel", how="Maxima", which=0, points=3
-            )[0]
+            with stage("con1limit"):
+                self.con1limit = self.getlocalextremum(
+                    data, column="BET_y2", x="P_rel", how="Maxima", which=0, points=3
+                )[0]
 
-            self.eswminima = self.getlocalextremum(
-                data, column="phi", x="P_rel", how="Minima", which=0, points=3
-            )[0]
+            with stage("eswminima"):
+                self.eswminima = self.getlocalextremum(
+                    data, column="phi", x="P_rel", how="Minima", which=0, points=3
+                )[0]
 
         return data
 
@@ -127,7 +335,7 @@ class BETAn:
         sign. In order to ensure that we are not selecting a point due to the noise, we compute the mean value of 'points' number of points
         before and after the chosen point and ensure that it is greater than the value at the chosen point (suggested by Li-Chiang).
 
-        This code may not be very efficient since it involves a lot of regression, but it works for a small quantum of data.
+        All of the slopes are computed at once (see sliding_slopes in regression.py), so this is cheap even for long isotherms.
 
         Parameters 
         ----------
@@ -150,14 +358,10 @@ class BETAn:
             Index of minima of the feature represented by `column`.
         targetvalue : numpy.float64
             Minima of the feature represented by `column`.
-        data[["x", "target", "slopes"]] : pandas.core.frame.DataFrame
+        frame : pandas.core.frame.DataFrame
             Contains information of interest for the independent and dependent variable, as well as the slopes at each data point for target vs x.
 
         """
-        data = data.copy(deep=True)
-        start = data.index.values[0]
-        end = data.index.values[-1]
-
         # Target is the name of the column that we will choose
         if column is None:
             target = data.columns[0]
@@ -166,62 +370,50 @@ class BETAn:
         if type(column) == str:
             target = column
 
-        data["target"] = data[target]
-        if how == "Maxima":
-            data["target"] = -data["target"]
-
+        frame = pd.DataFrame(index=data.index)
         if x is None:
-            data["x"] = data.index
+            frame["x"] = data.index
         elif type(x) == int:
-            data["x"] = data[data.columns[x]]
+            frame["x"] = data[data.columns[x]]
         elif type(x) == str:
-            data["x"] = data[x]
+            frame["x"] = data[x]
         else:
             raise ValueError
 
-        data["slopes"] = 0.0
+        frame["target"] = data[target]
+        if how == "Maxima":
+            frame["target"] = -frame["target"]
+
+        # The slope at every point comes from a line fit through 'points' number of points before and after the point.
+        # All of these fits are computed at once; see regression.py.
         points = int(points)  # Number of points before and after a chosen point.
-        for i in np.arange(start + points, end - points + 1, 1):
-            regdata = data[i - points : i + points + 1][["target", "x"]]
-            res = smf.ols("target ~ x", regdata).fit()
-            slope = res.params.iloc[1]
-            data.at[i, "slopes"] = slope
-        minimas = data.index[
-            (data["slopes"].shift(1).fillna(0) < 0)
-            & (data["slopes"].shift(-1).fillna(0) > 0)
-        ].values
-        # We thus have a list of potential minimas. But now, we need to discard the ones that are there because of the noise.
-        goodminimas = []
-        if minimas.shape[0] != 0:
-            for minimap in minimas:
-                if (
-                    data[minimap - points : minimap]["target"].mean()
-                    > data[data.index == minimap]["target"].values[0]
-                    and data[minimap + 1 : minimap + points + 1]["target"].mean()
-                    > data[data.index == minimap]["target"].values[0]
-                ):
-                    # This means that this is really a minimum and not just due to the noise.
-                    # The data points before the candidate minimum are greater on average than the candidate, and those after the candidate are greater on average.
-                    goodminimas.append(minimap)
-            if goodminimas != []:
-                # Now, we need to get the minima that we are really looking for.
-                if type(which) == int:
-                    minima = goodminimas[which]
-                    targetvalue = data[data.index == minima]["target"].values[0]
-                if type(which) == list:
-                    minima = [goodminimas[minima] for minima in which]
-                    targetvalue = [
-                        data[data.index == minima]["target"].values[0]
-                        for minima in minima
-                    ]
-            else:
-                minima = None
-                targetvalue = None
+        targets = frame["target"].to_numpy(dtype=float)
+        labels = frame.index.values
+        if labels.dtype.kind in "iu" and np.array_equal(np.sort(labels), np.arange(len(labels))):
+            # The line fit through the points at positions i-points to i+points is reported on the row with index i.
+            # These are the same row unless prepdata had to sort the isotherm.
+            positions = labels
+        else:
+            positions = np.arange(len(labels))
+        slopes = sliding_slopes(frame["x"].to_numpy(dtype=float), targets, points)
+        in_range = (positions >= positions[0] + points) & (positions <= positions[-1] - points)
+        frame["slopes"] = np.where(in_range, slopes[positions], 0.0)
+
+        # The minima are where the slope changes sign. The ones that are there because of the noise are discarded.
+        goodminimas = local_minima(targets, frame["slopes"].to_numpy(), points, positions=positions)
+        if goodminimas.shape[0] != 0:
+            # Now, we need to get the minima that we are really looking for.
+            if type(which) == int:
+                minima = frame.index.values[goodminimas[which]]
+                targetvalue = targets[goodminimas[which]]
+            if type(which) == list:
+                minima = [frame.index.values[goodminimas[minima]] for minima in which]
+                targetvalue = [targets[goodminimas[minima]] for minima in which]
         else:
             minima = None
             targetvalue = None
 
-        return minima, targetvalue, data[["x", "target", "slopes"]]
+        return minima, targetvalue, frame
 
     def th_loading(self, x, params):
         """
@@ -311,6 +503,8 @@ class BETAn:
         None
 
         """     
+        _load_matplotlib()
+
         scope = plotting_information['scope']
 
         # ax.errorbar essentially is ax.plot with the settings used below. Makes a scatter. Benefit is that it shows up last in the legend.
@@ -496,6 +690,8 @@ class BETAn:
         None
 
         """       
+        _load_matplotlib()
+
         ax3.xaxis.label.set_text("$p/p_0$")
         ax3.yaxis.label.set_text("$q(1-p/p_{0})$" + " / " + "$%s$" % self.loadunits)
         ax3.set_xscale("log")
@@ -549,7 +745,7 @@ class BETAn:
             ax3.legend(loc="upper left")
 
     def makelinregplot(
-        self, plotting_information, ax2, p, q, data, maketitle="Yes", mode="BET"
+        self, plotting_information, ax2, p, q, data, maketitle="Yes", mode="BET", fit=None
     ):
         """
         This function takes an axis as an input to make a plot summarizing information about a
@@ -571,6 +767,8 @@ class BETAn:
             If set to "Yes", the plot will be titled; otherwise, not.
         mode : str
             Either "BET" or "BET+ESW". This affects the title of the plot if one is made.
+        fit : BETFit
+            The fit of the region data[p:q], if it has been computed already (see regionfit). Otherwise, the region is fit here.
 
         Returns
         -------
@@ -578,8 +776,13 @@ class BETAn:
             Contains SESAMI 1.0 intermediate calculation results, and the predicted area A_BET. The keys are "C", "qm", "A_BET", "con3", "con4", "length_linear_region", "R2_linear_region", "low_P_linear_region", and "high_P_linear_region".
 
         """
+        _load_matplotlib()
+
         bbox_props = dict(boxstyle="square", ec="k", fc="w", lw=1.0)
 
+        if (p, q) != (None, None) and fit is None:
+            fit = self.regionfit(p, q, data)
+
         if (p, q) == (None, None):
             ax2.text(
                 0.97,
@@ -591,25 +794,8 @@ class BETAn:
                 transform=ax2.transAxes,
             )
         else:
-            [
-                linear,
-                stats,
-                C,
-                qm,
-                x_max,
-                x_BET3,
-                x_BET4,
-                con1,
-                con2,
-                con3,
-                con4,
-                A_BET,
-            ] = self.linregauto(p, q, data)
-            [ftest, ttest, outlierdata, shaptest, r2, r2adj, results] = stats
-            intercept, slope = results.params
-
-            low_p = data.iloc[p]["Pressure"]
-            high_p = data.iloc[q]["Pressure"]
+            linear = data[p:q] # The rows of the linear region, as in linregauto
+            intercept, slope = fit.intercept, fit.slope
 
             ax2.xaxis.label.set_text("$p/p_0$")
             ax2.yaxis.label.set_text(r"$\frac{p/p_0}{q(1-p/p_0)}$" + " / " + "kg/mol")
@@ -642,19 +828,8 @@ class BETAn:
             if plotting_information["legend"] == "Yes":  # Add a legend in this case.
                 ax2.legend()
 
-        # Returning stats to display in the website.
-        my_dict = {
-            "C": C,
-            "qm": qm,
-            "A_BET": A_BET,
-            "con3": con3,
-            "con4": con4,
-            "length_linear_region": q - p,
-            "R2_linear_region": results.rsquared,
-            "low_P_linear_region": low_p,
-            "high_P_linear_region": high_p
-        }  # This will be BET_dict or BET_ESW_dict
-        return my_dict
+        # Returning stats to display in the website. This will be BET_dict or BET_ESW_dict
+        return fit.to_dict()
 
     def eswdata(self, data, eswpoints=3):
         """
@@ -670,22 +845,22 @@ class BETAn:
             minima: numpy.int64. The index of 'Loading' value corresponding to a minima of 'phi' values.
             eswarea: numpy.float64. The surface area in m²/g corresponding to the 'Loading' at which 'phi' is minimum.
         """
-        data = data.copy(deep=True)
-
-        data["phi"] = (
-            data["Loading"] / 1000 * self.R * self.T * np.log(data["P_rel"])
-        )  # J/g ; equation 1 of https://doi.org/10.1021/acs.jpcc.9b02116. Factor of 1000 to convert from 1/kg to 1/g
+        # data is not changed (or copied); phi is a new Series.
+        loading = data["Loading"]
+        phi = (
+            loading / 1000 * self.R * self.T * np.log(data["P_rel"])
+        ).rename("phi")  # J/g ; equation 1 of https://doi.org/10.1021/acs.jpcc.9b02116. Factor of 1000 to convert from 1/kg to 1/g
 
         # Now, we will use our function to get minima.
         if self.eswminima is None:
             minima = self.getlocalextremum(
-                data, column="phi", x="P_rel", how="Minima", which=0, points=eswpoints
+                pd.DataFrame({"P_rel": data["P_rel"], "phi": phi}), column="phi", x="P_rel", how="Minima", which=0, points=eswpoints
             )[0]
         else:
             minima = self.eswminima
         if minima is not None:
             eswarea = (
-                data[data.index == minima]["Loading"].values[0]
+                loading.values[loading.index == minima][0]
                 / 1000
                 * self.N_A
                 * self.selected_gas_cs
@@ -693,7 +868,7 @@ class BETAn:
         else:
             eswarea = None
 
-        return [data["Loading"], data["phi"], minima, eswarea]
+        return [loading, phi, minima, eswarea]
 
     def makeeswplot(
         self,
@@ -733,6 +908,8 @@ class BETAn:
         None
 
         """
+        _load_matplotlib()
+
         [loading, phi, minima, eswarea] = self.eswdata(data, eswpoints)
 
         # ax.errorbar essentially is ax.plot with the settings used below. Makes a scatter. Benefit is that it shows up last in the legend.
@@ -842,6 +1019,7 @@ class BETAn:
         """
         This function computes all the statistical parameters associated with the fitting of a line. 
         It also checks which consistency criteria the linear region satisfies and which ones it does not.
+        The isotherm is not copied: the fit works on read-only views of its columns (see IsothermArrays).
 
         Parameters 
         ----------
@@ -849,76 +1027,43 @@ class BETAn:
             The index of the data point that is chosen as the start of the linear region.
         q : numpy.int64
             The index of the data point that is chosen as the end of the linear region.
-        data : pandas.core.frame.DataFrame
+        data : pandas.core.frame.DataFrame or IsothermArrays
             Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
 
 
         Returns
         -------
-        linear : pandas.core.frame.DataFrame
-            The initial data, but only the rows of the linear region.
-        stats : list
-            The results of various statistical tests.
-        C : float
-            See equation 6 of Fagerlund, G. (1973). Determination of specific surface by the BET method. Heat of adsorption in the first layer.
-        qm : float
-            See equation 5 of Fagerlund, G. (1973). Determination of specific surface by the BET method. Mass of adsorbate forming a monolayer on unit mass of adsorbent.
-        x_max : numpy.float64
-            The relative pressure at which BET_y2 is maximized. BET_y2 is defined in prepdata.
-        x_BET3 : numpy.float64
-            Value of relative pressure that corresponds to monolayer loading capacity.
-        x_BET4 : numpy.float64
-            Value used in the evaluation of the fourth Rouquerol consistency criterion.
-        con1 : str
-            "Yes" or "No", depending on whether the first consistency criterion is satisfied.
-        con2 : str
-            "Yes" or "No", depending on whether the second consistency criterion is satisfied.
-        con3 : str
-            "Yes" or "No", depending on whether the third consistency criterion is satisfied.
-        con4 : str
-            "Yes" or "No", depending on whether the fourth consistency criterion is satisfied.
-        A_BET : float
-            The predicted BET surface area.           
+        fit : BETFit
+            The fitted line, the results of the statistical tests, and:
+            C : See equation 6 of Fagerlund, G. (1973). Determination of specific surface by the BET method. Heat of adsorption in the first layer.
+            qm : See equation 5 of Fagerlund, G. (1973). Determination of specific surface by the BET method. Mass of adsorbate forming a monolayer on unit mass of adsorbent.
+            x_max : The relative pressure at which BET_y2 is maximized. BET_y2 is defined in prepdata.
+            x_BET3 : Value of relative pressure that corresponds to monolayer loading capacity.
+            x_BET4 : Value used in the evaluation of the fourth Rouquerol consistency criterion.
+            con1, con2, con3, con4 : "Yes" or "No", depending on whether each consistency criterion is satisfied.
+            A_BET : The predicted BET surface area.
 
         """        
-        data = data.copy(deep=True)
-        linear = data[p:q] # Grab the rows of the DataFrame that correspond to the data points in the chosen linear region
-        results = smf.ols("BETy ~ P_rel", linear).fit()
-        intercept, slope = results.params
+        isotherm = IsothermArrays.of(data)
+        # The data points in the chosen linear region
+        prel = isotherm.P_rel[p:q]
+        bety = isotherm.BETy[p:q]
+        results = sm.OLS(bety, np.column_stack([np.ones(len(prel)), prel])).fit() # The same design matrix as the formula "BETy ~ P_rel".
+        intercept, slope = results.params.tolist() # Python floats, so that C, qm and A_BET are too.
 
         # We will perform all the statistical tests here.
-        # First, the whole model ANOVA test.
-        ftest = (results.fvalue, results.f_pvalue)
-        # Then, we will do the parameter tests. We won't really do the effect test, since there is
+        # First, the whole model ANOVA test. Then, we will do the parameter tests. We won't really do the effect test, since there is
         # only one variable.
-        Ttest = results.t_test(np.array([[1, 0], [0, 1]]))
-        ttest = (Ttest.tvalue, Ttest.pvalue)
         influence = results.get_influence()
         # We are using externally studentized residuals.
         resid_stud = influence.get_resid_studentized_external()
         # If any studentized residual is above 3, we will flag this as an outlier. Different softwares have
         # different ways of flagging outliers, but we will use 3.0 (https://tinyurl.com/ycomecvg)
-        prel = linear["P_rel"].values
-        bety = linear["BETy"].values
-
-        isoutlier = "No"
-        preloutlier = False
-        betyoutlier = False
-        if np.absolute(resid_stud).max() > 3.0:
-            isoutlier = "Yes"
-            arrindexoutlier = np.where(resid_stud > 3.0)[0]
-            preloutlier = prel[arrindexoutlier]
-            betyoutlier = bety[arrindexoutlier]
-        outlierdata = [isoutlier, preloutlier, betyoutlier]
+        outliers = tuple(int(p + i) for i in np.flatnonzero(resid_stud > 3.0))
         # Ultimately, we would like to highlight the outlier points on the graph.
         # Now, we want to perform the Shapiro Wilk test on the residuals. We will perform it on normalized residuals.
         norm_res = (resid_stud - resid_stud.mean()) / resid_stud.std()
         shaptest = ss.shapiro(norm_res)
-        # Model adequacy
-        r2 = results.rsquared
-        r2adj = results.rsquared_adj
-        # Now, we want to pack the results of all these tests into a single list.
-        stats = [ftest, ttest, outlierdata, shaptest, r2, r2adj, results]
         if intercept == 0.0:
             intercept += 1e23
         C = slope / intercept + 1
@@ -926,13 +1071,9 @@ class BETAn:
         # To check for 1st consistency criterion
         # See https://doi.org/10.1021/acs.jpcc.9b02116 (3rd paragraph in introduction) for the consistency criteria
 
-        ind_max = self.con1limit
-        if ind_max is not None:
-            x_max = data[data.index == ind_max]["P_rel"].values[0]
-        else:
-            x_max = data["P_rel"][data["BET_y2"].idxmax()]
+        x_max = self.con1pressure(isotherm)
 
-        if linear["P_rel"].max() <= x_max:
+        if prel.max() <= x_max:
             con1 = "Yes"
         else:
             con1 = "No"
@@ -942,15 +1083,12 @@ class BETAn:
         else:
             con2 = "No"
         # Checking if third consistency criterion is satisfied
-        lower_limit_y = data["Loading"][data["Loading"] <= qm].max()
-        upper_limit_y = data["Loading"][data["Loading"] > qm].min()
-        lower_limit_x = data["P_rel"][data["Loading"] <= qm].max()
-        upper_limit_x = data["P_rel"][data["Loading"] > qm].min()
+        lower_limit_y, upper_limit_y, lower_limit_x, upper_limit_x = (bound[()] for bound in isotherm.qmbounds(qm))
 
         # Now I will do a linear interpolation to figure out x
         m = (upper_limit_y - lower_limit_y) / (upper_limit_x - lower_limit_x) # slope
         x_BET3 = upper_limit_x - (upper_limit_y - qm) / m
-        if linear["P_rel"].min() <= x_BET3 <= linear["P_rel"].max():
+        if prel.min() <= x_BET3 <= prel.max():
             con3 = "Yes"
         else:
             con3 = "No"
@@ -970,20 +1108,150 @@ class BETAn:
         # A_BET[=]m²/g
         A_BET = qm * self.N_A * self.selected_gas_cs / 1000  # m²/g
 
-        return [
-            linear,
-            stats,
-            C,
-            qm,
-            x_max,
-            x_BET3,
-            x_BET4,
-            con1,
-            con2,
-            con3,
-            con4,
-            A_BET,
-        ]
+        return BETFit(
+            p, q, intercept, slope, C, qm, A_BET, x_max, x_BET3, x_BET4, con1, con2, con3, con4,
+            results.rsquared, isotherm.Pressure[p], isotherm.Pressure[q],
+            R2_adj=results.rsquared_adj,
+            f_pvalue=results.f_pvalue,
+            t_pvalues=tuple(results.pvalues),
+            shapiro_pvalue=shaptest[1],
+            outliers=outliers,
+        )
+
+    def con1pressure(self, isotherm):
+        """
+        This function returns the relative pressure up to which the first consistency criterion is satisfied: that of con1limit (see prepdata),
+        or that of the largest BET_y2 if prepdata did not find con1limit.
+
+        Parameters 
+        ----------
+        isotherm : IsothermArrays
+            Represents an isotherm.
+
+        Returns
+        -------
+        x_max : numpy.float64
+            The relative pressure at which BET_y2 is maximized.
+
+        """
+        key = ("con1pressure", self.con1limit) # Found once per isotherm, rather than once per candidate region.
+        if key not in isotherm.lookups:
+            if self.con1limit is not None:
+                isotherm.lookups[key] = isotherm.P_rel[isotherm.index == self.con1limit][0]
+            else:
+                isotherm.lookups[key] = isotherm.P_rel[np.nanargmax(isotherm.BET_y2)]
+        return isotherm.lookups[key]
+
+    def regionfit(self, p, q, data):
+        """
+        This function fits a chosen linear region (with linregauto) and keeps the results needed for the website and the plots.
+
+        Parameters 
+        ----------
+        p : numpy.int64
+            The index of the data point that is chosen as the start of the linear region.
+        q : numpy.int64
+            The index of the data point that is chosen as the end of the linear region.
+        data : pandas.core.frame.DataFrame or IsothermArrays
+            Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
+
+        Returns
+        -------
+        fit: BETFit
+            The results of the fit.
+
+        """
+        return self.linregauto(p, q, data)
+
+    def regionsummary(self, p, q, data):
+        """
+        This function summarizes a chosen linear region without making any plots. It returns the same dictionary as makelinregplot.
+
+        Parameters 
+        ----------
+        p : numpy.int64
+            The index of the data point that is chosen as the start of the linear region.
+        q : numpy.int64
+            The index of the data point that is chosen as the end of the linear region.
+        data : pandas.core.frame.DataFrame
+            Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
+
+        Returns
+        -------
+        my_dict: dict
+            Contains SESAMI 1.0 intermediate calculation results, and the predicted area A_BET. The keys are "C", "qm", "A_BET", "con3", "con4", "length_linear_region", "R2_linear_region", "low_P_linear_region", and "high_P_linear_region".
+
+        """
+        return self.regionfit(p, q, data).to_dict()
+
+    def linregwindows(self, p, q, data):
+        """
+        This function is the vectorized counterpart of linregauto for the candidate search in picklen.
+        For every window data[p:q], it computes the fitted line, C, qm and the four consistency criteria at once,
+        without the statistical tests. The lines are fit from the centered sums of each window (see window_linregs in regression.py).
+
+        Parameters 
+        ----------
+        p : numpy.ndarray
+            The indices of the data points that start the windows.
+        q : numpy.ndarray
+            The indices of the data points that end the windows. As in linregauto, the point at q is not included.
+        data : pandas.core.frame.DataFrame or IsothermArrays
+            Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
+
+        Returns
+        -------
+        windows : dict
+            Arrays with one entry per window. The keys are "slope", "intercept", "R2", "C", "qm", "x_BET3", "x_BET4", "con1", "con2", "con3", "con4", and "A_BET".
+            The consistency criteria are booleans.
+
+        """
+        p = np.asarray(p, dtype=int)
+        q = np.asarray(q, dtype=int)
+        isotherm = IsothermArrays.of(data)
+        prel = isotherm.P_rel
+
+        slope, intercept, r2 = window_linregs(prel, isotherm.BETy, p, q)
+        intercept = np.where(intercept == 0.0, intercept + 1e23, intercept)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            C = slope / intercept + 1
+            qm = 1 / (slope + intercept)  # 1/(mol/kg framework)
+        low_prel, high_prel = window_extent(prel, p, q)
+
+        # First consistency criterion; see linregauto.
+        con1 = high_prel <= self.con1pressure(isotherm)
+
+        # Second consistency criterion
+        con2 = C > 0
+
+        # Third consistency criterion. The loading and relative pressure on either side of qm, for every window at once.
+        # They are NaN where there is no point on one side, and then so is x_BET3, since no interpolation is possible.
+        lower_limit_y, upper_limit_y, lower_limit_x, upper_limit_x = isotherm.qmbounds(qm)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = (upper_limit_y - lower_limit_y) / (upper_limit_x - lower_limit_x) # slope
+            x_BET3 = upper_limit_x - (upper_limit_y - qm) / m
+            con3 = (low_prel <= x_BET3) & (x_BET3 <= high_prel)
+
+            # Fourth consistency criterion
+            x_BET4 = 1 / (np.sqrt(C) + 1)
+            con4 = np.abs((x_BET4 - x_BET3) / x_BET3) < 0.2 # 20% tolerance
+
+        A_BET = qm * self.N_A * self.selected_gas_cs / 1000  # m²/g; see linregauto
+
+        return {
+            "slope": slope,
+            "intercept": intercept,
+            "R2": r2,
+            "C": C,
+            "qm": qm,
+            "x_BET3": x_BET3,
+            "x_BET4": x_BET4,
+            "con1": con1,
+            "con2": con2,
+            "con3": con3,
+            "con4": con4,
+            "A_BET": A_BET,
+        }
 
     def picklen(self, data, method="BET+ESW"):
         """
@@ -997,10 +1265,12 @@ class BETAn:
             1. No. of consistency criteria fulfilled (among the 3rd and 4th)
             2. Length of the region.
             3. R2 value (we will keep that as a lower limit)
+        The lines for all candidate regions are fit at once by linregwindows. Only the regions that can satisfy the first consistency criterion
+        and the minimum R2 go through linregauto and its statistical tests.
 
-        Parameters 
+        Parameters
         ----------
-        data : pandas.core.frame.DataFrame
+        data : pandas.core.frame.DataFrame or IsothermArrays
             Contains the data of the isotherm being analyzed. Keys are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", "phi".
         method : str
             Either "BET" or "BET+ESW". Indicates whether the Excess Sorption Work method will be used in choosing the linear monolayer loading region or not.
@@ -1013,15 +1283,16 @@ class BETAn:
             The index of the data point that is chosen as the end of the linear region.
 
         """  
-        data_og = data.copy(deep=True)
+        # The isotherm is only read, so it is not copied; the candidates are fit on read-only views of its columns.
+        isotherm = IsothermArrays.of(data)
         # We want to make sure that we always satisfy first consistency criterion, so we take the upper limit from the maxima function
         # we have defined.
         iddatamax = self.con1limit
         if iddatamax is None:
-            iddatamax = data["BET_y2"].idxmax()
+            iddatamax = isotherm.index[np.nanargmax(isotherm.BET_y2)]
         # Considering data points up to iddatamax+2 makes sense because that way, we can consider linear regions right up until the point
         # where BET_y2 is max.
-        data = data_og[: (iddatamax + 2)].copy(deep=True)
+        data = isotherm.head(iddatamax + 2)
 
         minlength = int(
             self.minlinelength - 1
@@ -1030,8 +1301,8 @@ class BETAn:
 
         R2cutoff = self.R2cutoff
 
-        start = data.index.values[0]
-        end = data.index.values[-1]
+        start = data.index[0]
+        end = data.index[-1]
 
         # Current best linear region
         # This is just a variable to initialize the list. It will likely get replaced.
@@ -1043,9 +1314,6 @@ class BETAn:
             0.0, # fR2
         ]  
 
-        satisflag = (
-            0  # Will be set to 1 if a region satisfying all our demands is found.
-        )
         # We will incorporate the ESW condition here.
         endlowlimit = start + minlength
         starthighlimit = end - minlength
@@ -1058,82 +1326,72 @@ class BETAn:
                     minima - 1
                 )  # So that the ESW minima is contained exactly within the chosen range.
 
-        # Looping through all possibilities of consecutive data points. 
-        for i in np.arange(end, endlowlimit, -1):
-            for j in np.arange(start, i - minlength, 1):
-                p, q = j, i # p is the starting point (data index) of the current region. q is the ending point of the current region.
-                if p > starthighlimit:
-                    """
-                    This means that the starting point is higher than the starting point is allowed to be.
-                    In the case of BET+ESW, this means that the ESW condition will be violated.
-                    """
-                    continue
-                if q - p > 10:
-                    """
-                    This condition is to ensure that we have a maximum limit on the length of the
-                    linear region length so that we don't end up selecting a really huge linear region.
-                    """
-                    continue
-                [
-                    linear,
-                    stats,
-                    C,
-                    qm,
-                    x_max,
-                    x_BET3,
-                    x_BET4,
-                    con1,
-                    con2,
-                    con3,
-                    con4,
-                    A_BET,
-                ] = self.linregauto(p, q, data)
-                [ftest, ttest, outlierdata, shaptest, r2, r2adj, results] = stats
-                # first, let's see if we can satisfy the first two consistency criteria, statistical significance and min R2 value of the line.
-                # As of 05/25/2018, we are doing away with all these wonderful statistical criteria to ensure consistency with the current practices in the field.
-                # So, we will replace 0.05 by 0.90 such that these consistency criteria essentially become absent.
-                if (
-                    con1 == "Yes"
-                    and con2 == "Yes"
-                    and ftest[1] < 0.99
-                    and ttest[1].max() < 0.99
-                    and shaptest[1] > 0.01
-                    and r2 > self.R2min
-                ):
-                    # Now this is a potential linear region. Now the race begins.
-                    scon3 = int(1) if con3 == "Yes" else int(0)
-                    scon4 = int(1) if con4 == "Yes" else int(0)
-                    conscore = (
-                        scon3 + scon4
-                    )  # Score based on the number of consistency criteria satisfied
-                    length = q - p
-                    R2 = r2
-                    # Will check if the chosen region satisfies our requirements for the "Best" region.
-                    if conscore == int(2) and length > minlength and R2 > R2cutoff:
-                        curbest = [p, q, conscore, length, R2]
-                        satisflag = 1
-                        break # Select this region and look no further. See bottom left of Figure S2 of the SI of the SESAMI 1 paper: https://pubs.acs.org/doi/full/10.1021/acs.jpcc.9b02116
-
-                    # These lines are to initiate the process of overwriting the data for the linear region.
-                    if curbest[2] == -1: # Initially set to -1 near the beginning of this function.
-                        curbest = [p, q, conscore, length, R2]
-                    if conscore > curbest[2]: # More consistency criteria are fulfilled than the previous best linear region
-                        curbest = [p, q, conscore, length, R2]
-                    """
-                    #We have commented this section out because in some cases, where no region was
-                    #found to satisfy 3rd or 4th consistency criterion, this code would select regions
-                    #with a higher length or R2 value. This was found to be a bit problematic because
-                    #in the event of multiple linear regions, we should select the one closest to the Consistency 4 limit. So
-                    #we have altered that here.
-                    if conscore == curbest[2]:
-                        if length>curbest[3]:
-                            curbest = [p,q,conscore,length,R2]
-                            if length==curbest[3]:
-                                if R2>curbest[4]:
-                                    curbest = [p,1,conscore,length, R2]
-                    """
-            if satisflag == 1:
-                break
+        # All possibilities of consecutive data points, in the order in which they are considered.
+        # Regions end at q (going down from the end of the data) and start at p (going up from the start of the data).
+        # p can not be higher than starthighlimit; in the case of BET+ESW, the ESW condition would be violated otherwise.
+        # q - p is at most 10, so that we have a maximum limit on the length of the linear region and don't end up selecting a really huge linear region.
+        windows = [
+            (j, i)
+            for i in range(end, endlowlimit, -1)
+            for j in range(max(start, i - 10), min(i - minlength - 1, starthighlimit) + 1)
+        ]
+        if len(windows) != 0:
+            p_all, q_all = np.array(windows).T
+            kernel = self.linregwindows(p_all, q_all, data)
+            # The statistical tests in linregauto are expensive, so they are only run on the regions that pass the first
+            # consistency criterion and the minimum R2.
+            candidates = np.flatnonzero(kernel["con1"] & (kernel["R2"] > self.R2min))
+        else:
+            candidates = []
+        count("candidate_windows", len(windows))
+        count("candidate_fits", len(candidates)) # The regions that go through linregauto.
+
+        for k in candidates:
+            p, q = p_all[k], q_all[k] # p is the starting point (data index) of the current region. q is the ending point of the current region.
+            fit = self.linregauto(p, q, data)
+            con1, con2, con3, con4, r2 = fit.con1, fit.con2, fit.con3, fit.con4, fit.R2
+            # first, let's see if we can satisfy the first two consistency criteria, statistical significance and min R2 value of the line.
+            # As of 05/25/2018, we are doing away with all these wonderful statistical criteria to ensure consistency with the current practices in the field.
+            # So, we will replace 0.05 by 0.90 such that these consistency criteria essentially become absent.
+            if (
+                con1 == "Yes"
+                and con2 == "Yes"
+                and fit.f_pvalue < 0.99
+                and max(fit.t_pvalues) < 0.99
+                and fit.shapiro_pvalue > 0.01
+                and r2 > self.R2min
+            ):
+                # Now this is a potential linear region. Now the race begins.
+                scon3 = int(1) if con3 == "Yes" else int(0)
+                scon4 = int(1) if con4 == "Yes" else int(0)
+                conscore = (
+                    scon3 + scon4
+                )  # Score based on the number of consistency criteria satisfied
+                length = q - p
+                R2 = r2
+                # Will check if the chosen region satisfies our requirements for the "Best" region.
+                if conscore == int(2) and length > minlength and R2 > R2cutoff:
+                    curbest = [p, q, conscore, length, R2]
+                    break # Select this region and look no further. See bottom left of Figure S2 of the SI of the SESAMI 1 paper: https://pubs.acs.org/doi/full/10.1021/acs.jpcc.9b02116
+
+                # These lines are to initiate the process of overwriting the data for the linear region.
+                if curbest[2] == -1: # Initially set to -1 near the beginning of this function.
+                    curbest = [p, q, conscore, length, R2]
+                if conscore > curbest[2]: # More consistency criteria are fulfilled than the previous best linear region
+                    curbest = [p, q, conscore, length, R2]
+                """
+                #We have commented this section out because in some cases, where no region was
+                #found to satisfy 3rd or 4th consistency criterion, this code would select regions
+                #with a higher length or R2 value. This was found to be a bit problematic because
+                #in the event of multiple linear regions, we should select the one closest to the Consistency 4 limit. So
+                #we have altered that here.
+                if conscore == curbest[2]:
+                    if length>curbest[3]:
+                        curbest = [p,q,conscore,length,R2]
+                        if length==curbest[3]:
+                            if R2>curbest[4]:
+                                curbest = [p,1,conscore,length, R2]
+                """
         fp, fq, fconscore, flength, fR2 = curbest
 
         return fp, fq
@@ -1148,10 +1406,12 @@ class BETAn:
         sumpath=os.path.join(os.curdir, "imgsummary"),
         saveindividual="No",
         eswminima=None,
+        fits=(None, None),
     ):
         """
         This function creates a summary of the BET process and stores it as a collection in the specified outlet directory.
         This function also generates plots.
+        The individual figures are drawn on figures of their own, without titles, from the same fits as the multiplot (see panelfigure).
 
         Parameters 
         ----------
@@ -1165,12 +1425,15 @@ class BETAn:
             Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
         plot_number : int
             A number identifier for which round of plots this is, for the current website user. Prevents issues with plot downloads.
-        sumpath : str
-            Path at which the figures will be saved.
+        sumpath : str or files
+            Path at which the figures will be saved, or the files of a session to save them to (see SESAMI/workspace.py).
         saveindividual : str
-            If "Yes", saves the plots from the multiplot individually as well.
+            If "Yes", saves the plots from the multiplot individually as well. If "On request", only saves what they are drawn from, as f"panels_{plot_number}.pickle",
+            so that each can be drawn when it is first asked for (see figures.render_on_request).
         eswminima : numpy.int64
             The 'Loading' value corresponding to a minima of 'phi' values.
+        fits : tuple
+            The BETFit of the BET and BET+ESW regions (see computesummary), so that they are not fit again. Either can be None, in which case that region is fit here.
 
         Returns
         -------
@@ -1180,207 +1443,388 @@ class BETAn:
             Contains SESAMI 1.0 intermediate calculation results, and the predicted area A_BET, when BET is used and ESW helps pick the linear region. The keys are "C", "qm", "A_BET", "con3", "con4", "length_linear_region", "R2_linear_region", "low_P_linear_region", and "high_P_linear_region".
 
         """
+        _load_matplotlib()
+
         scope = plotting_information['scope']
 
         if scope == 'BET and BET+ESW': # In this case, run the BET+ESW code
-            rbet = bet_info[0]
-            rbetesw = betesw_info[0]
-            if saveindividual == "Yes":
-                fig, fig2, fig3, fig4, fig5 = (
-                    plt.figure(),
-                    plt.figure(),
-                    plt.figure(),
-                    plt.figure(),
-                    plt.figure(),
-                )
-                ax, ax2, ax3, ax4, ax5 = (
-                    fig.add_subplot(111),
-                    fig2.add_subplot(111),
-                    fig3.add_subplot(111),
-                    fig4.add_subplot(111),
-                    fig5.add_subplot(111),
-                )
-                self.makeisothermplot(
-                    plotting_information,
-                    ax,
-                    data,
-                    maketitle="No",
-                    with_fit="Yes",
-                    fit_data=[bet_info, betesw_info],
-                )
-                self.makelinregplot(
-                    plotting_information, ax2, rbet[0], rbet[1], data, maketitle="No"
-                )
-                self.makeconsistencyplot(plotting_information, ax3, data, maketitle="No")
-                self.makeeswplot(
-                    plotting_information,
-                    ax4,
-                    data,
-                    maketitle="No",
-                    with_fit="Yes",
-                    fit_data=[bet_info, betesw_info],
-                )
-                self.makelinregplot(
-                    plotting_information, ax5, rbetesw[0], rbetesw[1], data, maketitle="No"
-                )  # Note, can set maketitle to "Yes" if you want the individual plots to have titles.
-                dpi = plotting_information["dpi"]
-                fig.savefig(
-                    os.path.join(sumpath, f"isotherm_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig2.savefig(
-                    os.path.join(sumpath, f"BETPlotLinear_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig3.savefig(
-                    os.path.join(sumpath, f"BETPlot_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig4.savefig(
-                    os.path.join(sumpath, f"ESWPlot_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig5.savefig(
-                    os.path.join(sumpath, f"BETESWPlot_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                plt.close(fig)
-                plt.close(fig2)
-                plt.close(fig3)
-                plt.close(fig4)
-                plt.close(fig5)
-
-            # Next, the multiplot.
             figf = plt.figure(figsize=(3 * 7.0, 2 * 6.0))
             [[axf, ax3f, ax4f], [ax2f, ax5f, blanksubplot]] = figf.subplots(
                 nrows=2, ncols=3
             )
+            # The panels of the multiplot, which are also the individual figures.
+            panels = {"isotherm": axf, "BETPlotLinear": ax2f, "BETPlot": ax3f, "ESWPlot": ax4f}
+            if eswminima is None:
+                ax5f.axis("off")
+            else:
+                panels["BETESWPlot"] = ax5f
+            blanksubplot.axis("off")
+
+        else: # Only run the BET related code
+            figf = plt.figure(figsize=(3 * 7.0, 1 * 6.0))
+            [axf, ax2f, ax3f] = figf.subplots( # Only have three plots, since not making the BET+ESW plots
+                nrows=1, ncols=3
+            )
+            panels = {"isotherm": axf, "BETPlotLinear": ax2f, "BETPlot": ax3f}
+
+        drawn = {
+            name: self.drawpanel(name, plotting_information, ax, data, bet_info, betesw_info, fits)
+            for name, ax in panels.items()
+        }
+        BET_dict = drawn["BETPlotLinear"]
+        BET_ESW_dict = drawn.get("BETESWPlot") # None if there is no BET+ESW plot, since two outputs are expected
+
+        figf.tight_layout()
+        self.savemultiplot(figf, plotting_information["dpi"], sumpath, plot_number)
+        plt.close(figf)
+
+        files = as_files(sumpath)
+        if saveindividual == "Yes":
+            with stage("save_individual"):
+                for name in panels:
+                    fig = self.panelfigure(name, plotting_information, data, bet_info, betesw_info, fits)
+                    savefigure(f"{name}_{plot_number}.png", fig, plotting_information["dpi"], files=files)
+        elif saveindividual == "On request":
+            # Everything the individual figures are drawn from. The summary is not needed for that, so it is left out.
+            betan = copy.copy(self)
+            betan.__dict__.pop("summary", None)
+            savepanelspec(files, plot_number, {
+                "betan": betan,
+                "panels": list(panels),
+                "plotting_information": plotting_information,
+                "data": data,
+                "bet_info": bet_info,
+                "betesw_info": betesw_info,
+                "fits": fits,
+            })
+
+        return BET_dict, BET_ESW_dict
+
+    def drawpanel(self, name, plotting_information, ax, data, bet_info, betesw_info, fits=(None, None), maketitle="Yes"):
+        """
+        This function draws one of the plots of saveimgsummary on the axes parsed as input.
+
+        Parameters 
+        ----------
+        name : str
+            Which plot to draw: "isotherm", "BETPlotLinear", "BETPlot", "ESWPlot", or "BETESWPlot".
+        ax : matplotlib.axes._subplots.AxesSubplot
+            The axes on which to plot.
+        bet_info, betesw_info, data, fits :
+            See saveimgsummary.
+        maketitle : str
+            If set to "Yes", the plot will be titled; otherwise, not.
+
+        Returns
+        -------
+        my_dict: dict
+            For "BETPlotLinear" and "BETESWPlot", the results of the linear region (see makelinregplot). None for the other plots.
+
+        """
+        if name == "isotherm":
             self.makeisothermplot(
                 plotting_information,
-                axf,
+                ax,
                 data,
+                maketitle=maketitle,
                 with_fit="Yes",
                 fit_data=[bet_info, betesw_info],
             )
-            self.makeconsistencyplot(plotting_information, ax3f, data)
-
-            BET_dict = self.makelinregplot(
-                plotting_information, ax2f, rbet[0], rbet[1], data
-            )
-
+        elif name == "BETPlot":
+            self.makeconsistencyplot(plotting_information, ax, data, maketitle=maketitle)
+        elif name == "ESWPlot":
             self.makeeswplot(
                 plotting_information,
-                ax4f,
+                ax,
                 data,
+                maketitle=maketitle,
                 with_fit="Yes",
                 fit_data=[bet_info, betesw_info],
             )
+        elif name == "BETPlotLinear":
+            rbet = bet_info[0]
+            return self.makelinregplot(
+                plotting_information, ax, rbet[0], rbet[1], data, maketitle=maketitle, fit=fits[0]
+            )
+        elif name == "BETESWPlot":
+            rbetesw = betesw_info[0]
+            return self.makelinregplot(
+                plotting_information, ax, rbetesw[0], rbetesw[1], data, maketitle=maketitle, mode="BET+ESW", fit=fits[1]
+            )
+        else:
+            raise ValueError(f"There is no plot named {name!r}.")
+        return None
+
+    def panelfigure(self, name, plotting_information, data, bet_info, betesw_info, fits=(None, None)):
+        """
+        This function draws one of the individual figures (see drawpanel) on a figure of its own, without a title, at the default figure size.
+        The figure is not registered with pyplot, so it does not have to be closed. The plot style is expected to be set already (see useplotstyle).
+
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+            The figure, to be saved with figures.savefigure.
+
+        """
+        _load_matplotlib()
+        fig = mpl.figure.Figure()
+        self.drawpanel(name, plotting_information, fig.add_subplot(111), data, bet_info, betesw_info, fits, maketitle="No")
+        return fig
+
+    def savemultiplot(self, fig, dpi, sumpath, plot_number, pad_inches=0.1):
+        """
+        This function renders the multiplot and saves it as f"multiplot_{plot_number}.png", cropped to what it shows with pad_inches around it,
+        as savefig(bbox_inches="tight") would do, but without rendering the figure a second time to find the crop.
+
+        Parameters 
+        ----------
+        fig : matplotlib.figure.Figure
+            The multiplot, after tight_layout.
+        dpi : float
+            Resolution of the image.
+        sumpath : str or files
+            Path at which the image will be saved, or the files of a session to save it to (see SESAMI/workspace.py).
+        plot_number : int
+            A number identifier for which round of plots this is, for the current website user.
+        pad_inches : float
+            Padding around the image.
+
+        """
+        fig.set_dpi(dpi)
+        with stage("draw"):
+            fig.canvas.draw() # The only time the figure is rendered.
+        image = np.asarray(fig.canvas.buffer_rgba())
+        facecolor = np.round(np.array(mpl.colors.to_rgba(fig.get_facecolor())) * 255).astype(np.uint8)
+        ink = np.any(image != facecolor, axis=2) # Pixels that show something.
+        pad = int(round(pad_inches * dpi))
+        height, width = image.shape[:2]
+        top, left, bottom, right = 0, 0, height, width
+        rows = np.flatnonzero(ink.any(axis=1))
+        columns = np.flatnonzero(ink.any(axis=0))
+        if len(rows) > 0:
+            top, bottom = max(rows[0] - pad, 0), min(rows[-1] + 1 + pad, height)
+            left, right = max(columns[0] - pad, 0), min(columns[-1] + 1 + pad, width)
+        with stage("save_multiplot"):
+            savepng(f"multiplot_{plot_number}.png", image[top:bottom, left:right], dpi, files=as_files(sumpath))
+
+    def computesummary(self, data, plotting_information, eswpoints=3):
+        """
+        This function computes the BET, ESW and BET+ESW results without making any plots. matplotlib is not imported.
+        The returned summary holds everything rendersummary needs, so the plots can be made later (or never) from it.
+
+        Parameters 
+        ----------
+        data : pandas.core.frame.DataFrame
+            Represents an isotherm. Columns are "Pressure", "Loading", "P_rel", "BETy", "BET_y2", and "phi".
+        plotting_information : dict
+            Lots of plotting and calculation settings from the front end (i.e. the SESAMI webpage). The keys are 'dpi', 'font size', 'font type', 'legend', 'R2 cutoff', 'R2 min', 'gas', 'scope', 'ML', 'custom adsorbate', 'custom cross section', 'custom temperature', and 'custom saturation pressure'.
+            Only 'scope' is used here.
+        eswpoints : int
+            Helps calculate the slope at a point. The number of points around the point at which slope is to be computed.
+
+        Returns
+        -------
+        summary : dict
+            The keys are:
+            "status": "OK", or the reason the calculation failed ("BET linear failure", "No eswminima", or "BET+ESW linear failure").
+            "scope": The 'scope' in plotting_information.
+            "data": The isotherm.
+            "eswminima": The index of the first ESW minimum, or None.
+            "con1limit": The index of the upper limit for consistency criterion 1, as found by prepdata.
+            "bet_info", "betesw_info": [rbet, bet_params] for the BET and BET+ESW regions, as taken by saveimgsummary. None if not found.
+            "BET_dict", "BET_ESW_dict": As returned by generatesummary. None if not found.
+            "bet_fit", "betesw_fit": The BETFit of the BET and BET+ESW regions, which the plots are drawn from. None if not found.
+
+        """
+        scope = plotting_information['scope']
+        summary = {
+            "status": "OK",
+            "scope": scope,
+            "data": data,
+            "eswminima": None,
+            "con1limit": self.con1limit,
+            "bet_info": None,
+            "betesw_info": None,
+            "BET_dict": None,
+            "BET_ESW_dict": None,
+            "bet_fit": None,
+            "betesw_fit": None,
+        }
+
+        # We are calling the eswdata function once from this function to get the variable minima.
+        [loading, phi, eswminima, eswarea] = self.eswdata(data, eswpoints)
+        summary["eswminima"] = eswminima
+        # will get the linear region from using the BET criteria only.
+
+        isotherm = IsothermArrays.of(data) # Views of the columns, which picklen and regionfit share.
+        with stage("picklen_bet"):
+            rbet = self.picklen(isotherm, method="BET") # Indices of the data points that start and end the chosen linear region.
 
-            BET_ESW_dict = None  # Set this to nothing to start. Will evaluate whether eswminima was None by whether the value changes from nothing.
+        if rbet == (None, None):
+            # This means that no suitable BET linear region has been found.
+            summary["status"] = 'BET linear failure'
+            return summary
+
+        # A BET region has been found.
+        bet_fit = self.regionfit(rbet[0], rbet[1], isotherm)
+        BET_dict = bet_fit.to_dict()
+        summary["bet_fit"] = bet_fit
+        summary["BET_dict"] = BET_dict
+        summary["bet_info"] = [rbet, (BET_dict["qm"], BET_dict["C"])]
+
+        if scope == 'BET and BET+ESW': # In this case, run the BET+ESW code
+            # We want to get the bet+esw data ONLY when the eswminima exists.
             if eswminima is None:
-                ax5f.axis("off")
-            else:
-                BET_ESW_dict = self.makelinregplot(
-                    plotting_information, ax5f, rbetesw[0], rbetesw[1], data, mode="BET+ESW"
-                )
-            blanksubplot.axis("off")
-            figf.tight_layout()
-            figf.savefig(
-                os.path.join(sumpath, f"multiplot_{plot_number}.png"),
-                format="png",
-                dpi=dpi,
-                bbox_inches="tight",
-            )
-            plt.close(figf)
+                summary["status"] = 'No eswminima'
+                return summary
 
-            return BET_dict, BET_ESW_dict
+            with stage("picklen_betesw"):
+                rbetesw = self.picklen(isotherm, method="BET+ESW") # Indices of the data points that start and end the chosen linear region.
+            if rbetesw == (None, None):
+                # This means that no suitable BET+ESW linear region has been found.
+                summary["status"] = 'BET+ESW linear failure'
+                return summary
 
-        else: # Only run the BET related code
-            rbet = bet_info[0]
-            if saveindividual == "Yes":
-                fig, fig2, fig3 = (
-                    plt.figure(),
-                    plt.figure(),
-                    plt.figure()
-                )
-                ax, ax2, ax3 = (
-                    fig.add_subplot(111),
-                    fig2.add_subplot(111),
-                    fig3.add_subplot(111)
-                )
-                self.makeisothermplot(
-                    plotting_information,
-                    ax,
-                    data,
-                    maketitle="No",
-                    with_fit="Yes",
-                    fit_data=[bet_info, betesw_info],
-                )
-                self.makelinregplot(
-                    plotting_information, ax2, rbet[0], rbet[1], data, maketitle="No"
-                )
-                self.makeconsistencyplot(plotting_information, ax3, data, maketitle="No")
-                dpi = plotting_information["dpi"]
-                fig.savefig(
-                    os.path.join(sumpath, f"isotherm_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig2.savefig(
-                    os.path.join(sumpath, f"BETPlotLinear_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                fig3.savefig(
-                    os.path.join(sumpath, f"BETPlot_{plot_number}.png"),
-                    format="png",
-                    dpi=dpi,
-                    bbox_inches="tight",
-                )
-                plt.close(fig)
-                plt.close(fig2)
-                plt.close(fig3)
+            # A BET+ESW region has been found.
+            betesw_fit = self.regionfit(rbetesw[0], rbetesw[1], isotherm)
+            BET_ESW_dict = betesw_fit.to_dict()
+            summary["betesw_fit"] = betesw_fit
+            summary["BET_ESW_dict"] = BET_ESW_dict
+            summary["betesw_info"] = [rbetesw, (BET_ESW_dict["qm"], BET_ESW_dict["C"])]
 
-            # Next, the multiplot.
-            figf = plt.figure(figsize=(3 * 7.0, 1 * 6.0))
-            [axf, ax2f, ax3f] = figf.subplots( # Only have three plots, since not making the BET+ESW plots
-                nrows=1, ncols=3
-            )
-            self.makeisothermplot(
-                plotting_information,
-                axf,
-                data,
-                with_fit="Yes",
-                fit_data=[bet_info, betesw_info],
-            )
-            self.makeconsistencyplot(plotting_information, ax3f, data)
+        return summary
 
-            BET_dict = self.makelinregplot(
-                plotting_information, ax2f, rbet[0], rbet[1], data
-            )
+    def rendersummary(
+        self,
+        summary,
+        plotting_information,
+        MAIN_PATH,
+        plot_number,
+        sumpath=os.path.join(os.curdir, "imgsummary"),
+        saveindividual="Yes",
+    ):
+        """
+        This function makes the plots for a summary from computesummary. It can be called any time after computesummary, e.g. on a summary loaded from a cache,
+        and on a different BETAn instance, as long as it was made with the same adsorbate settings.
 
-            figf.tight_layout()
-            figf.savefig(
-                os.path.join(sumpath, f"multiplot_{plot_number}.png"),
-                format="png",
-                dpi=dpi,
-                bbox_inches="tight",
-            )
-            plt.close(figf)         
+        Parameters 
+        ----------
+        summary : dict
+            The output of computesummary, for a calculation that succeeded.
+        plotting_information : dict
+            Lots of plotting and calculation settings from the front end (i.e. the SESAMI webpage). The keys are 'dpi', 'font size', 'font type', 'legend', 'R2 cutoff', 'R2 min', 'gas', 'scope', 'ML', 'custom adsorbate', 'custom cross section', 'custom temperature', and 'custom saturation pressure'.
+        MAIN_PATH : str
+            The main directory of the SESAMI website code.
+        plot_number : int
+            A number identifier for which round of plots this is, for the current website user. Prevents issues with plot downloads.
+        sumpath : str or files
+            Path at which the figures will be saved, or the files of a session to save them to (see SESAMI/workspace.py).
+        saveindividual : str
+            If "Yes", saves the plots from the multiplot individually as well. If "On request", they are only saved when they are first asked for (see saveimgsummary).
 
-            return BET_dict, None # None is a placeholder, since two outputs are expected
+        Returns
+        -------
+        BET_dict: dict
+            See generatesummary.
+        BET_ESW_dict: dict
+            See generatesummary.
+
+        """
+        _load_matplotlib()
+
+        # The plots mark the limits prepdata found, which this instance may not have computed itself.
+        self.con1limit = summary["con1limit"]
+        self.eswminima = summary["eswminima"]
+
+        useplotstyle(plotting_information, os.path.join(MAIN_PATH, "SESAMI", "SESAMI_1", "mplstyle"))
+
+        # saveimgsummary makes the plots for the scope the summary was computed for.
+        plotting_information = {**plotting_information, "scope": summary["scope"]}
+
+        return self.saveimgsummary(
+            plotting_information,
+            summary["bet_info"],
+            summary["betesw_info"],
+            summary["data"],
+            plot_number,
+            sumpath=sumpath,
+            saveindividual=saveindividual,
+            eswminima=summary["eswminima"],
+            fits=(summary.get("bet_fit"), summary.get("betesw_fit")), # Summaries cached before BETFit existed have no fits; those are fit again.
+        )
+
+    def plotpayload(self, summary):
+        """
+        This function collects what the plots of a summary from computesummary show, so that a browser can draw them instead of the server (see index.html).
+        matplotlib is not used. The numbers match what rendersummary draws: the isotherm, the BET and BET+ESW fits evaluated at the isotherm's relative pressures,
+        the points and fitted line of each linear region, and the consistency 1 maximum and first ESW minimum.
+        Numbers that are not finite (e.g. the BET fit at p/p0 = 1) are None, since JSON has no NaN or infinity.
+
+        Parameters
+        ----------
+        summary : dict
+            The output of computesummary, for a calculation that succeeded.
+
+        Returns
+        -------
+        payload: dict
+            JSON serializable. The keys are:
+            "scope": The scope the summary was computed for.
+            "loading_units": The units of the loading.
+            "isotherm": The columns "Pressure", "P_rel", "Loading", "BET_y2", and "phi" of the isotherm, as lists, sorted by pressure.
+            "con1limit", "eswminima": {"P_rel": ..., "Loading": ...} of the consistency 1 maximum and the first ESW minimum, or None if there is none.
+            "bet", "betesw": The BET and BET+ESW regions, or None if not found (the BET+ESW region is None for the 'BET' scope). Each has the keys
+                "indices": The indices of the data points that start and end the region.
+                "P_rel", "Loading": The relative pressures and loadings at which the region starts and ends.
+                "qm", "C": The BET parameters.
+                "linear": {"P_rel": ..., "BETy": ..., "fit": ...}, the points of the linear region and the fitted line at them.
+                "fit_loading", "fit_phi": The loading and excess sorption work of the BET fit at each relative pressure in "isotherm".
+
+        """
+        data = summary["data"]
+        p_rel = data["P_rel"].values
+
+        def values(array):
+            return [float(x) if np.isfinite(x) else None for x in np.asarray(array, dtype=np.float64)]
+
+        def point(index):
+            if index is None:
+                return None
+            return {"P_rel": float(data.at[index, "P_rel"]), "Loading": float(data.at[index, "Loading"])}
+
+        def region(info, fit):
+            if info is None:
+                return None
+            [(p, q), (qm, C)] = info
+            if fit is None: # Summaries cached before BETFit existed have no fits.
+                fit = self.regionfit(p, q, data)
+            linear = data[p:q] # The rows of the linear region, as drawn by makelinregplot
+            fit_loading = self.th_loading(p_rel, (qm, C))
+            return {
+                "indices": [int(p), int(q)],
+                "P_rel": [float(data.at[p, "P_rel"]), float(data.at[q, "P_rel"])],
+                "Loading": [float(data.at[p, "Loading"]), float(data.at[q, "Loading"])],
+                "qm": float(qm),
+                "C": float(C),
+                "linear": {
+                    "P_rel": values(linear["P_rel"]),
+                    "BETy": values(linear["BETy"]),
+                    "fit": values(fit.slope * linear["P_rel"].values + fit.intercept),
+                },
+                "fit_loading": values(fit_loading),
+                "fit_phi": values(self.gen_phi(fit_loading, p_rel)), # As makeeswplot draws it.
+            }
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "scope": summary["scope"],
+                "loading_units": self.loadunits,
+                "isotherm": {column: values(data[column]) for column in ("Pressure", "P_rel", "Loading", "BET_y2", "phi")},
+                "con1limit": point(summary["con1limit"]),
+                "eswminima": point(summary["eswminima"]) if summary["scope"] == "BET and BET+ESW" else None,
+                "bet": region(summary["bet_info"], summary.get("bet_fit")),
+                "betesw": region(summary["betesw_info"], summary.get("betesw_fit")),
+            }
 
     def generatesummary(
         self,
@@ -1391,12 +1835,14 @@ class BETAn:
         eswpoints=3,
         sumpath=os.path.join(os.curdir, "imgsummary"),
         saveindividual="Yes",
+        makeplots="Yes",
     ):
         """
         This function will call the required functions to compute BET, ESW and BET+ESW areas and write the output into the files.
         Format:
         Name BETLowerPressureLimit BETHigherPressureLimit BETArea Nm_BET C_BET Consistency 1 Consistency2 Consistency3 Consistency4 ESWq ESWpressure ESWSA BETESWLowerPressureLimit BETESWHigherPressureLimit BETESWArea Nm_BETESW C_BETESW Consistency 1 Consistency2 Consistency3 Consistency4
-        This function calls saveimgsummary for plot generation.
+        This function calls computesummary for the calculation, and rendersummary for plot generation.
+        The summary from computesummary is kept as self.summary, so the plots can be made later with rendersummary if makeplots is "No".
 
         Parameters 
         ----------
@@ -1410,10 +1856,12 @@ class BETAn:
             A number identifier for which round of plots this is, for the current website user. Prevents issues with plot downloads.
         eswpoints : int
             Helps calculate the slope at a point. The number of points around the point at which slope is to be computed.
-        sumpath : str
-            Path at which the figures will be saved.
+        sumpath : str or files
+            Path at which the figures will be saved, or the files of a session to save them to (see SESAMI/workspace.py).
         saveindividual : str
             If "Yes", saves the plots from the multiplot individually as well.
+        makeplots : str
+            If "No", no plots are made and matplotlib is not imported.
 
         Returns
         -------
@@ -1425,97 +1873,22 @@ class BETAn:
             None is returned if the calculation fails, or if the BET+ESW calculation is not asked for in 'scope' in plotting_information.
 
         """ 
-        scope = plotting_information['scope']
-
-        stylepath = os.path.join(MAIN_PATH, "SESAMI", "SESAMI_1", "mplstyle")
-        plt.style.use(stylepath)
-
-        # We are calling the eswdata function once from this function to get the variable minima.
-        [loading, phi, eswminima, eswarea] = self.eswdata(data, eswpoints)
-        # will get the linear region from using the BET criteria only.
+        summary = self.computesummary(data, plotting_information, eswpoints=eswpoints)
+        self.summary = summary
 
-        p, q = self.picklen(data, method="BET") # Indices of the data points that start and end the chosen linear region.
-        rbet = (p, q)
+        if summary["status"] != "OK":
+            # Since SESAMI failed, return values to indicate that. Will report an error message to the website.
+            # The second returned value is a placeholder, since the SESAMI_1.py call expects two values.
+            return summary["status"], summary["status"]
 
-        if rbet == (None, None):
-            # This means that no suitable BET linear region has been found.
-            return (
-                'BET linear failure',
-                'BET linear failure', # The second returned value is a placeholder, since the SESAMI_1.py call expects two values.
-            )  # Since SESAMI failed, return values to indicate that. Will report an error message to the website.
-        else:
-            # A BET region has been found.
-            (p, q) = rbet
-            [
-                linear,
-                stats,
-                C,
-                qm,
-                x_max,
-                x_BET3,
-                x_BET4,
-                con1,
-                con2,
-                con3,
-                con4,
-                A_BET,
-            ] = self.linregauto(p, q, data)
-            bet_params = (qm, C)
-
-        betesw_info = None # placeholder, in case scope is 'BET'
-        if scope == 'BET and BET+ESW': # In this case, run the BET+ESW code
-            # We want to get the bet+esw data ONLY when the eswminima exists.
-            if eswminima is None:
-                rbetesw = (None, None)
-                return 'No eswminima', 'No eswminima' # The second returned value is a placeholder, since the SESAMI_1.py call expects two values.
-            else:
-                p, q = self.picklen(data, method="BET+ESW") # Indices of the data points that start and end the chosen linear region.
-                rbetesw = (p, q)
-
-            # Write BET+ESW
-            if rbetesw == (None, None):
-                # This means that no suitable BET+ESW linear region has been found.
-                return (
-                    'BET+ESW linear failure',
-                    'BET+ESW linear failure',
-                )  # Since SESAMI failed, return values to indicate that. Will report an error message to the website.
-            else:
-                # A BET region has been found.
-                (p, q) = rbetesw
-                [
-                    linear,
-                    stats,
-                    C,
-                    qm,
-                    x_max,
-                    x_BET3,
-                    x_BET4,
-                    con1,
-                    con2,
-                    con3,
-                    con4,
-                    A_BET,
-                ] = self.linregauto(p, q, data)
-                betesw_params = (qm, C)
-
-            betesw_info = [rbetesw, betesw_params]
-
-        bet_info = [rbet, bet_params]
-        mpl.rcParams.update(
-            {"font.size": plotting_information["font size"]}
-        )  # changing the font size to be used in the figures
-        mpl.rcParams["font.family"] = plotting_information[
-            "font type"
-        ]  # setting the font family to be used in the figures
-        BET_dict, BET_ESW_dict = self.saveimgsummary(
-            plotting_information,
-            bet_info,
-            betesw_info,
-            data,
-            plot_number,
-            sumpath=sumpath,
-            saveindividual=saveindividual,
-            eswminima=eswminima,
-        )
+        if makeplots == "Yes":
+            return self.rendersummary(
+                summary,
+                plotting_information,
+                MAIN_PATH,
+                plot_number,
+                sumpath=sumpath,
+                saveindividual=saveindividual,
+            )
 
-        return BET_dict, BET_ESW_dict
+        return summary["BET_dict"], summary["BET_ESW_dict"]
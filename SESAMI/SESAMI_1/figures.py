@@ -0,0 +1,217 @@
+# Saving the figures of a calculation. BETAn.savemultiplot renders the multiplot once and saves it with savepng.
+# The individual figures are drawn on figures of their own, without titles, from the same fits as the multiplot, and saved with savefigure.
+# The website does not draw them at all until they are asked for: savepanelspec saves what they are drawn from,
+# and render_on_request draws one from it the first time it is requested. Most users only ever look at the multiplot.
+# On the website, PanelRenderer draws them in the background as soon as a calculation has saved its multiplot, one job per figure on a pool of processes,
+# so the calculation returns with the multiplot, and the figures are usually ready by the time they are asked for. A request for one that is not
+# ready yet waits for that figure only.
+# Images are written to a temporary file first and then renamed, so a figure that is still being saved is never served half written.
+# The figures can also be saved to the files of a session in a workspace that is not on disk (see SESAMI/workspace.py).
+
+import io
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from SESAMI.metrics import count
+from SESAMI.workspace import FolderFiles, as_files
+
+
+def savepng(path, image, dpi, files=None):
+    """
+    savepng saves image (an array of RGBA pixels) as a PNG at path, with dpi as its resolution.
+    If files (the files of a session, see SESAMI/workspace.py) is given, path is the name of the PNG in files.
+    """
+    from PIL import Image
+
+    if files is None:
+        files, path = FolderFiles(os.path.dirname(path)), os.path.basename(path)
+    png = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(image)).save(png, format="png", dpi=(dpi, dpi))
+    files.write(path, png.getvalue())
+    count("figure_bytes", png.tell())
+
+
+def pngbytes(fig, dpi):
+    """
+    pngbytes returns a matplotlib figure as a PNG, cropped to what it shows as savefig(bbox_inches="tight") does.
+    """
+    png = io.BytesIO()
+    fig.savefig(png, format="png", dpi=dpi, bbox_inches="tight")
+    return png.getvalue()
+
+
+def savefigure(path, fig, dpi, files=None):
+    """
+    savefigure saves a matplotlib figure as a PNG at path (see pngbytes). files is as for savepng.
+    """
+    if files is None:
+        files, path = FolderFiles(os.path.dirname(path)), os.path.basename(path)
+    png = pngbytes(fig, dpi)
+    files.write(path, png)
+    count("figure_bytes", len(png))
+
+
+def savepanelspec(sumpath, plot_number, spec):
+    """
+    savepanelspec saves what the individual figures of a multiplot are drawn from (see BETAn.saveimgsummary), as f"panels_{plot_number}.pickle"
+    in sumpath (a folder, or the files of a session), for render_on_request. spec["panels"] is the names of the figures.
+    """
+    as_files(sumpath).write(f"panels_{plot_number}.pickle", pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read_spec(files, plot_number):
+    # Returns what savepanelspec saved, or None if it is not there.
+    try:
+        return pickle.loads(files.read(f"panels_{plot_number}.pickle"))
+    except (OSError, TypeError, ValueError, pickle.UnpicklingError, EOFError):  # e.g. not a figure of the website, or cleaned up since.
+        return None
+
+
+_render_lock = threading.Lock()
+
+
+def render_panel(spec, name):
+    """
+    render_panel draws the individual figure name from spec (see savepanelspec) on a figure of its own, and returns it as a PNG.
+    The plot style is global to matplotlib, so figures are drawn one at a time in a process.
+    """
+    from SESAMI.SESAMI_1.betan import useplotstyle
+
+    information = spec["plotting_information"]
+    with _render_lock:
+        useplotstyle(information)
+        fig = spec["betan"].panelfigure(name, information, spec["data"], spec["bet_info"], spec["betesw_info"], spec["fits"])
+        return pngbytes(fig, information["dpi"])
+
+
+def render_on_request(path, files=None):
+    """
+    render_on_request saves the individual figure at path (f"{name}_{plot_number}.png"), drawn from what savepanelspec saved,
+    if it has not been saved yet. Returns True if the figure is at path afterwards.
+    If files (the files of a session, see SESAMI/workspace.py) is given, path is the name of the figure in files.
+    """
+    if files is None:
+        files, path = FolderFiles(os.path.dirname(path)), os.path.basename(path)
+    if files.exists(path):
+        return True
+
+    name, _, plot_number = os.path.splitext(path)[0].partition("_")  # The names of the figures have no underscores.
+    spec = _read_spec(files, plot_number)
+    if spec is None or name not in spec["panels"]:
+        return False
+    _save_panel(files, path, spec, name)
+    return True
+
+
+def _save_panel(files, path, spec, name):
+    png = render_panel(spec, name)
+    files.write(path, png)
+    count("figure_bytes", len(png))
+
+
+def _start_worker():
+    # Runs once in each worker process of a PanelRenderer: imports matplotlib with the Agg backend, so the first figure does not wait for it.
+    from SESAMI.SESAMI_1.betan import _load_matplotlib
+
+    _load_matplotlib()
+
+
+class PanelRenderer:
+    def __init__(self, max_workers=4):
+        """
+        Draws the individual figures of a multiplot in the background, all at once: one job per figure, each drawn from what savepanelspec saved,
+        on a pool of max_workers processes, so that the figures are drawn in parallel (matplotlib is not thread-safe) and without holding up the web server.
+        The PNGs are written to the files of the session in this process, as each job finishes.
+        """
+        self.max_workers = max_workers
+        self.executor = None  # The process pool is started with the first figure.
+        self.pending = {}  # (key, name of a figure) -> Future that is done once the figure is saved.
+        self.lock = threading.RLock()
+
+    def _get_executor(self):
+        if self.executor is None:
+            # fork is not safe in a process that already runs threads (the web server's), so fresh worker processes are used where possible.
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context, initializer=_start_worker)
+        return self.executor
+
+    def _submit(self, spec, name):
+        try:
+            return self._get_executor().submit(render_panel, spec, name)
+        except BrokenProcessPool:  # A worker process died (e.g. killed for using too much memory). Start a new pool.
+            self.executor = None
+            return self._get_executor().submit(render_panel, spec, name)
+
+    def start(self, key, files, plot_number):
+        """
+        start queues the individual figures of the multiplot plot_number in files (the files of a session) that are not saved yet, and returns right away,
+        e.g. once a calculation has saved its multiplot. key tells the sessions apart (e.g. the session ID). Does nothing if there are no such figures.
+        """
+        spec = _read_spec(files, plot_number)
+        if spec is not None:
+            self._queue(key, files, plot_number, spec)
+
+    def render(self, key, path, files):
+        """
+        render saves the individual figure path (f"{name}_{plot_number}.png") of files (the files of a session), if it has not been saved yet, and
+        starts saving the other figures of its multiplot in the background. key tells the sessions apart (e.g. the session ID).
+        Returns True if the figure is in files afterwards.
+        """
+        with self.lock:
+            future = self.pending.get((key, path))
+        if future is None:
+            if files.exists(path):
+                return True
+            name, _, plot_number = os.path.splitext(path)[0].partition("_")  # The names of the figures have no underscores.
+            spec = _read_spec(files, plot_number)
+            if spec is None or name not in spec["panels"]:
+                return False
+            future = self._queue(key, files, plot_number, spec, first=name).get(path)
+        if future is not None:  # Otherwise, it was saved in the meantime.
+            future.result()
+        return True
+
+    def _queue(self, key, files, plot_number, spec, first=None):
+        # Queues the figures of the multiplot that are neither saved nor being saved, first the one that was asked for.
+        # Returns the futures of all figures that are being saved, by name.
+        futures = {}
+        with self.lock:
+            for name in sorted(spec["panels"], key=lambda name: name != first):
+                path = f"{name}_{plot_number}.png"
+                if (key, path) in self.pending:
+                    futures[path] = self.pending[(key, path)]
+                elif not files.exists(path):
+                    saved = Future()
+                    self.pending[(key, path)] = futures[path] = saved
+                    self._submit(spec, name).add_done_callback(
+                        lambda rendered, entry=(key, path), saved=saved: self._save(entry, files, rendered, saved)
+                    )
+        return futures
+
+    def _save(self, entry, files, rendered, saved):
+        # Writes a figure to files once its job is done, and then lets those waiting for it go on.
+        error = None
+        try:
+            png = rendered.result()
+            files.write(entry[1], png)
+            count("figure_bytes", len(png))
+        except BaseException as failure:  # e.g. the pool was shut down, or the job failed. The figure can be asked for again.
+            error = failure
+        with self.lock:
+            self.pending.pop(entry, None)
+        if error is None:
+            saved.set_result(True)
+        else:
+            saved.set_exception(error)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,240 @@
+"""
+Vectorized least-squares helpers used by BETAn.
+
+Rather than fitting a statsmodels model for every window of points, the points of every window are gathered into one array,
+so that every window is fit at once. Each window is centered on its own means before the sums of squares and products are taken,
+as a two-pass fit would do, so the fits keep their precision when the values are far from zero compared with their spread
+(sums accumulated over the whole isotherm would lose it to cancellation).
+"""
+
+import numpy as np
+
+
+def window_values(values, p, q):
+    """
+    This function gathers values[p:q] for each window into the rows of one array.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values to gather.
+    p : numpy.ndarray
+        The position of the first point of each window.
+    q : numpy.ndarray
+        One past the position of the last point of each window.
+
+    Returns
+    -------
+    windows : numpy.ndarray
+        One row per window, as long as the longest window. Rows of shorter windows are padded with 0.
+    inside : numpy.ndarray
+        Boolean array of the same shape, True where the entry of windows is a point of the window.
+
+    """
+    values = np.asarray(values, dtype=float)
+    offsets = np.arange((q - p).max(initial=0))
+    idx = p[:, None] + offsets
+    inside = idx < q[:, None]
+    if len(values) == 0:
+        return np.zeros(idx.shape), inside
+    windows = np.where(inside, values[np.clip(idx, 0, len(values) - 1)], 0.0)
+    return windows, inside
+
+
+def centered_sums(x, y, inside):
+    """
+    This function returns the number of points, the means, and the centered sums of squares and products of each window of x and y
+    (as gathered by window_values), counting only the entries where inside is True.
+    The values are taken relative to the first entry of their window before the means are found, so that a window of equal values has sums of exactly 0.
+
+    Returns
+    -------
+    n, mx, my, sxx, sxy, syy : numpy.ndarray
+        One entry per window.
+
+    """
+    x0, y0 = x[:, :1], y[:, :1]
+    dx = np.where(inside, x - x0, 0.0)
+    dy = np.where(inside, y - y0, 0.0)
+    n = inside.sum(axis=1).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mx = dx.sum(axis=1) / n
+        my = dy.sum(axis=1) / n
+    dx = np.where(inside, dx - mx[:, None], 0.0)
+    dy = np.where(inside, dy - my[:, None], 0.0)
+    return n, x0[:, 0] + mx, y0[:, 0] + my, (dx * dx).sum(axis=1), (dx * dy).sum(axis=1), (dy * dy).sum(axis=1)
+
+
+def sliding_slopes(x, y, points):
+    """
+    This function computes the least-squares slope of y vs x for a window of 'points' points before and after every point.
+    Points that do not have a full window on both sides get a slope of 0, as in BETAn.getlocalextremum.
+
+    Each window is centered on its own means (see centered_sums), so the slopes of the low pressure windows are not swamped by
+    the much larger values at high pressure. Flat stretches of y (e.g. zero loading) get a slope of exactly 0.
+    Points with missing or infinite values (e.g. phi at zero pressure) are left out of the windows they are in, as smf.ols drops missing rows.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        The independent variable.
+    y : numpy.ndarray
+        The dependent variable.
+    points : int
+        How many points before and after a point to use in computing slope.
+
+    Returns
+    -------
+    slopes : numpy.ndarray
+        The slope at each point.
+
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    points = int(points)
+    n = len(x)
+    w = 2 * points + 1  # Number of points in each window
+    slopes = np.zeros(n)
+    if n < w:
+        return slopes
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    if not valid.all():
+        x = np.where(valid, x, 0.0)
+        y = np.where(valid, y, 0.0)
+    p = np.arange(n - w + 1)
+    xs, inside = window_values(x, p, p + w)
+    ys, _ = window_values(y, p, p + w)
+    inside &= window_values(valid, p, p + w)[0] > 0  # Points that were left out are not counted.
+    _, _, _, sxx, sxy, _ = centered_sums(xs, ys, inside)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes[points : n - points] = sxy / sxx
+    return slopes
+
+
+def local_minima(target, slopes, points, positions=None):
+    """
+    This function finds the minima of target, given the slopes at each point.
+    A point is a candidate minimum when the slope before it is negative and the slope after it is positive.
+    In order to ensure that we are not selecting a point due to the noise, the mean of the 'points' points before and after
+    the candidate must both be greater than the value at the candidate.
+
+    Parameters
+    ----------
+    target : numpy.ndarray
+        The feature for which to get the minima.
+    slopes : numpy.ndarray
+        The slope of target at each point.
+    points : int
+        How many points before and after a point to use in computing the means.
+    positions : numpy.ndarray
+        The position in target around which the means are taken for each point. Defaults to the point itself.
+        BETAn.getlocalextremum passes the index labels here, since that is where the original implementation looked.
+
+    Returns
+    -------
+    goodminimas : numpy.ndarray
+        Positions of the minima that are not just due to the noise, in ascending order.
+
+    """
+    target = np.asarray(target, dtype=float)
+    points = int(points)
+    n = len(target)
+    before = np.concatenate(([0.0], slopes[:-1]))  # Same as shifting by 1 and filling with 0
+    after = np.concatenate((slopes[1:], [0.0]))
+    minimas = np.flatnonzero((before < 0) & (after > 0))
+    if minimas.shape[0] == 0:
+        return minimas
+    centers = minimas if positions is None else np.asarray(positions)[minimas]
+
+    # Means of the points before and after each candidate, skipping missing values as pandas does. The windows are cut off at the ends of the data;
+    # a candidate without any points on one side can not pass the check.
+    idx_before = centers[:, None] + np.arange(-points, 0)
+    idx_after = centers[:, None] + np.arange(1, points + 1)
+    window_before = target[np.clip(idx_before, 0, n - 1)]
+    window_after = target[np.clip(idx_after, 0, n - 1)]
+    ok_before = (centers - points >= 0)[:, None] & (idx_before >= 0) & ~np.isnan(window_before)
+    ok_after = (idx_after < n) & ~np.isnan(window_after)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_before = np.where(ok_before, window_before, 0.0).sum(axis=1) / ok_before.sum(axis=1)
+        mean_after = np.where(ok_after, window_after, 0.0).sum(axis=1) / ok_after.sum(axis=1)
+    values = target[minimas]
+    good = (centers - points >= 0) & (mean_before > values) & (mean_after > values)  # A mean of no points is NaN, and fails the check.
+    return minimas[good]
+
+
+def window_linregs(x, y, p, q):
+    """
+    This function fits a line y = slope * x + intercept to each of the windows x[p:q], y[p:q] at once.
+    The fits are ordinary least squares, the same as smf.ols("y ~ x"), from the centered sums of each window (see centered_sums),
+    so the R² can be compared with a threshold as it is, even for values far from zero.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        The independent variable.
+    y : numpy.ndarray
+        The dependent variable.
+    p : numpy.ndarray
+        The position of the first point of each window.
+    q : numpy.ndarray
+        One past the position of the last point of each window.
+
+    Returns
+    -------
+    slope : numpy.ndarray
+        The slope of each window.
+    intercept : numpy.ndarray
+        The intercept of each window.
+    r2 : numpy.ndarray
+        The R² of each fit.
+
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Points with infinite or missing values (e.g. BETy at zero loading) get NaN fits for the windows that contain them, as smf.ols gives for them.
+    bad = ~(np.isfinite(x) & np.isfinite(y))
+    if bad.any():
+        x = np.where(bad, 0.0, x)
+        y = np.where(bad, 0.0, y)
+    xs, inside = window_values(x, p, q)
+    ys, _ = window_values(y, p, q)
+    spoiled = (window_values(bad, p, q)[0] > 0).any(axis=1)
+    n, mx, my, sxx, sxy, syy = centered_sums(xs, ys, inside)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        intercept = my - slope * mx
+        r2 = sxy * sxy / (sxx * syy)
+    slope[spoiled] = np.nan
+    intercept[spoiled] = np.nan
+    r2[spoiled] = np.nan
+    return slope, intercept, r2
+
+
+def window_extent(values, p, q):
+    """
+    This function returns the smallest and largest of values[p:q] for each window.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values to look at.
+    p : numpy.ndarray
+        The position of the first point of each window.
+    q : numpy.ndarray
+        One past the position of the last point of each window.
+
+    Returns
+    -------
+    low : numpy.ndarray
+        The minimum of each window.
+    high : numpy.ndarray
+        The maximum of each window.
+
+    """
+    windows, inside = window_values(values, p, q)
+    low = np.where(inside, windows, np.inf).min(axis=1, initial=np.inf)
+    high = np.where(inside, windows, -np.inf).max(axis=1, initial=-np.inf)
+    return low, high
@@ -3,7 +3,10 @@
 
 import numpy as np
 import pandas as pd
-import pickle
+from SESAMI.SESAMI_2.model_registry import get_registry, model_input
+from SESAMI.metrics import stage
+from SESAMI.result_cache import isotherm_digest, result_key
+from SESAMI.workspace import as_files, open_file
 
 
 class ML:
@@ -105,7 +108,7 @@ class ML:
             data[col] = default_val
         return data
 
-    def pressure_bin_features(self, data, pressure_bins, isotherm_data_path):
+    def pressure_bin_features(self, data, pressure_bins, isotherm_data_path=None, isotherm_data=None):
         """
         This function computes the mean loading for isotherms for the given set of pressure bins and adds it to the given dataframe as columns
         c_1, c_2, ... c_n.
@@ -113,6 +116,7 @@ class ML:
         pressure_bins: list of tuples giving the start and end points of the pressure ranges we want to use. The interval is half open with equality on
             the greater than side.
         isotherm_data_path: Path to the location of the isotherm data.
+        isotherm_data: Dataframe with columns 'Pressure' and 'Loading'. Used instead of reading isotherm_data_path, if given.
         """
         feature_list = ["c_%d" % i for i in range(len(pressure_bins))]
         data = self.initialize_multiple_cols(
@@ -120,9 +124,12 @@ class ML:
         )  # This is the dataframe that will store the feature values.
 
         column_names = ["Pressure", "Loading"]
-        df = pd.read_table(
-            isotherm_data_path, skiprows=1, sep="\t", names=column_names
-        )  # That text file gets made by the app.py python script.
+        if isotherm_data is None:
+            df = pd.read_table(
+                isotherm_data_path, skiprows=1, sep="\t", names=column_names
+            )  # That text file gets made by the app.py python script.
+        else:
+            df = isotherm_data[column_names].reset_index(drop=True)
         df.loc[df.shape[0]] = [0.0,0.0] #Here, we are adding the point 0,0 to the dataframe in order to start the fitting at (0,0).
 
         for i, p_bin in enumerate(pressure_bins):
@@ -210,6 +217,7 @@ class ML:
         feature_list,
         col_list,
         isotherm_data_path="isotherm_data",
+        isotherm_data=None,
     ):
         """
         This function adds the necessary features for the machine learning model.
@@ -218,9 +226,10 @@ class ML:
             the greater than side.
         feature_list: The list of features. Will look something like ['c_0', 'c_1', 'c_2', 'c_3', 'c_4', 'c_5', 'c_6']
         col_list: An expanded list of features that includes cross effect terms. Will look something like ['c_0', 'c_1', 'c_2', 'c_3', 'c_4', 'c_5', 'c_6', 'c_0-c_0', 'c_0-c_1', 'c_0-c_2', 'c_0-c_3', 'c_0-c_4', 'c_0-c_5', 'c_0-c_6', 'c_1-c_1', 'c_1-c_2', 'c_1-c_3', 'c_1-c_4', 'c_1-c_5', 'c_1-c_6', 'c_2-c_2', 'c_2-c_3', 'c_2-c_4', 'c_2-c_5', 'c_2-c_6', 'c_3-c_3', 'c_3-c_4', 'c_3-c_5', 'c_3-c_6', 'c_4-c_4', 'c_4-c_5', 'c_4-c_6', 'c_5-c_5', 'c_5-c_6', 'c_6-c_6']
+        isotherm_data: Dataframe with columns 'Pressure' and 'Loading'. Used instead of reading isotherm_data_path, if given.
         """
         tr_data = self.pressure_bin_features(
-            tr_data, pressure_bins, isotherm_data_path=isotherm_data_path
+            tr_data, pressure_bins, isotherm_data_path=isotherm_data_path, isotherm_data=isotherm_data
         )
         tr_data = self.combine_features(tr_data, feature_list)
         tr_data = self.normalize_df(
@@ -229,71 +238,168 @@ class ML:
 
         return tr_data
 
+    def isotherm_arrays(self, isotherms):
+        """
+        This function flattens many isotherms into single arrays, for feature_matrix.
+        isotherms: Either a long format dataframe with columns 'name', 'Pressure' and 'Loading' (one isotherm per name, in order of first appearance),
+            or a list with one entry per isotherm, each a dataframe with columns 'Pressure' and 'Loading' or a (pressure, loading) tuple of arrays.
+        Returns the names (list indices if the isotherms are a list), pressures, loadings, and the index of the isotherm each point belongs to.
+        """
+        if isinstance(isotherms, pd.DataFrame):
+            group, names = pd.factorize(isotherms["name"])
+            pressure = isotherms["Pressure"].to_numpy(dtype=float)
+            loading = isotherms["Loading"].to_numpy(dtype=float)
+            return list(names), pressure, loading, group
+
+        pairs = [
+            (isotherm["Pressure"], isotherm["Loading"]) if isinstance(isotherm, pd.DataFrame) else isotherm
+            for isotherm in isotherms
+        ]
+        lengths = [len(pair[0]) for pair in pairs]
+        pressure = np.concatenate([np.asarray(pair[0], dtype=float) for pair in pairs]) if pairs else np.zeros(0)
+        loading = np.concatenate([np.asarray(pair[1], dtype=float) for pair in pairs]) if pairs else np.zeros(0)
+        group = np.repeat(np.arange(len(pairs)), lengths)
+        return list(range(len(pairs))), pressure, loading, group
+
+    def bin_means(self, pressure, loading, group, n_isotherms, pressure_bins):
+        """
+        This function computes the mean loading of every isotherm in every pressure bin at once. It gives the same values as pressure_bin_features,
+        including the point (0, 0) that is added to every isotherm.
+        pressure, loading, group: The points of all isotherms, and the index of the isotherm each point belongs to. See isotherm_arrays.
+        n_isotherms: The number of isotherms.
+        pressure_bins: list of tuples giving the start and end points of the pressure ranges we want to use. The bins must follow one another,
+            as those from build_pressure_bins do.
+        Returns an array of shape (n_isotherms, number of bins). Bins without any points are NaN.
+        """
+        n_bins = len(pressure_bins)
+        edges = np.array([p_bin[0] for p_bin in pressure_bins] + [pressure_bins[-1][1]])
 
-# This function returns the ML prediction of the surface area for the new structure, uploaded to the website by the user. Return value is a string.
-def calculation_v2_runner(MAIN_PATH, USER_ID):
-    # The function takes the main path to the SESAMI web folder and the user's unique ID so that the correct isotherm (input.txt) is read and 
-    # figures can be placed in the appropriate folder.
+        # Bin i holds edges[i] <= pressure < edges[i + 1], the same half open intervals as in pressure_bin_features.
+        bin_index = np.digitize(pressure, edges) - 1
+        inside = (bin_index >= 0) & (bin_index < n_bins) & ~np.isnan(loading)  # pandas' mean skips missing loadings.
+        flat_index = group[inside] * n_bins + bin_index[inside]
 
-    my_ML = ML()  # This initiates the class.
+        sums = np.bincount(flat_index, weights=loading[inside], minlength=n_isotherms * n_bins).reshape(n_isotherms, n_bins)
+        counts = np.bincount(flat_index, minlength=n_isotherms * n_bins).reshape(n_isotherms, n_bins).astype(float)
+        # The point (0, 0) added to every isotherm adds one point, but no loading, to the bin that holds zero pressure.
+        zero_bin = np.digitize(0.0, edges) - 1
+        if 0 <= zero_bin < n_bins:
+            counts[:, zero_bin] += 1
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
 
-    # This is the description for this particular type of run. All of the output files will have this in their name which can be used to identify them.
+    def design_matrix(self, means):
+        """
+        This function builds the normalized features from the bin means: the means themselves, followed by the products of every pair of means,
+        in the order of generate_combine_feature_list. This is what add_features makes, for many isotherms at once.
+        means: Array of shape (number of isotherms, number of bins), from bin_means.
+        Returns an array of shape (number of isotherms, number of features). Rows of isotherms with empty bins contain NaN.
+        """
+        first, second = np.triu_indices(means.shape[1])
+        features = np.hstack([means, means[:, first] * means[:, second]])
+        return (features - self.norm_vals[0, :]) / (self.norm_vals[1, :] - self.norm_vals[0, :])
+
+    def feature_matrix(self, isotherms, pressure_bins):
+        """
+        This function computes the normalized features of many isotherms. See isotherm_arrays for the accepted formats of isotherms.
+        Returns the names of the isotherms, the bin means, and the design matrix.
+        """
+        names, pressure, loading, group = self.isotherm_arrays(isotherms)
+        means = self.bin_means(pressure, loading, group, len(names), pressure_bins)
+        return names, means, self.design_matrix(means)
 
-    isotherm_data_path = (
-        f"{MAIN_PATH}user_{USER_ID}/input.txt"  # path to isotherm data.
-    )
 
-    test_data = pd.DataFrame(
-        {"name": ["user_input"]}
-    )  # This will hold the features of the new MOF/material that is input at the web interface.
+# The model predicts the area as measured with argon. This function returns prediction (a number or an array) for gas, 'Argon' or 'Nitrogen':
+# multiplied by 1.148 if Nitrogen gas used instead of Argon, to account for difference in cross-sectional areas.
+# Every ML prediction the website, the batch analysis, and the API report goes through here.
+def scale_to_gas(prediction, gas):
+    if gas == "Nitrogen":
+        return prediction * 1.148
+    return prediction
 
-    # Actual pressure bins as features.
+
+# This function returns the ML prediction of the surface area for the new structure, uploaded to the website by the user. Return value is a string.
+def calculation_v2_runner(MAIN_PATH, USER_ID, isotherm_data=None, result_cache=None, user_files=None):
+    # The function takes the main path to the SESAMI web folder and the user's unique ID so that the correct isotherm (input.txt) is read and 
+    # figures can be placed in the appropriate folder.
+    # If isotherm_data (a DataFrame with columns "Pressure" and "Loading") is given, it is used instead of reading input.txt again.
+    # If result_cache (a SESAMI.result_cache.ResultCache) is given as well, the prediction is looked up in it before it is made.
+    # user_files is where the user's input.txt is, if not in f"{MAIN_PATH}user_{USER_ID}/": a folder, or the files of a session (see SESAMI/workspace.py).
+
+    isotherm_data_path = None
+    if isotherm_data is None:
+        isotherm_data_path = open_file(
+            as_files(user_files or f"{MAIN_PATH}user_{USER_ID}/"), "input.txt"
+        )  # The isotherm data, read from input.txt.
+
+    # Getting the LASSO model. It is only unpickled on the first call in this process, or after the file changes.
+    registry = get_registry(f"{MAIN_PATH}/SESAMI/SESAMI_2/lasso_model.sav")
+    lasso = registry.get()
+    # The LASSO model was trained following the jupyter notebook code in the SESAMI 2 paper
+    # It was saved using pickle.dump(lasso, open('lasso_model.sav', 'wb'))
+
+    if result_cache is None or isotherm_data is None:
+        return calculation_v2(lasso, isotherm_data_path=isotherm_data_path, isotherm_data=isotherm_data)
+
+    # The key includes the model version, so predictions of a replaced model are not reused.
+    key = result_key("SESAMI 2", isotherm_digest(isotherm_data), {}, version=list(registry.version))
+    prediction = result_cache.get(key)
+    if prediction is None:
+        prediction = calculation_v2(lasso, isotherm_data=isotherm_data)
+        result_cache.set(key, prediction)
+    return prediction
+
+
+# This function returns the ML predictions of the surface area for many isotherms, with a single call to lasso.predict.
+# isotherms can be a long format dataframe or a list of isotherms, see ML.isotherm_arrays. gas is 'Argon' or 'Nitrogen'.
+# Returns a dataframe indexed by isotherm name, with the columns 'ML_prediction' (NaN if it could not be made) and 'empty_bins' (the boundaries, in Pa, of the bins without data).
+def predict_many(lasso, isotherms, gas="Argon"):
+    my_ML = ML()
+    pressure_bins = my_ML.build_pressure_bins(5, 1e5, 7)
+    names, means, features = my_ML.feature_matrix(isotherms, pressure_bins)
+
+    complete = ~np.isnan(features).any(axis=1)  # Isotherms with an empty bin can not be predicted.
+    predictions = np.full(len(names), np.nan)
+    if complete.any():
+        predictions[complete] = lasso.predict(model_input(lasso, features[complete]))
+
+    predictions = scale_to_gas(predictions, gas)
+
+    empty_bins = [
+        [pressure_bins[i] for i in np.flatnonzero(np.isnan(row))] for row in means
+    ]
+    return pd.DataFrame({"ML_prediction": predictions, "empty_bins": empty_bins}, index=pd.Index(names, name="name"))
+
+
+# This function returns the ML prediction of the surface area for an isotherm, either read from isotherm_data_path or given as the DataFrame isotherm_data.
+# Return value is a string; if the prediction can not be made, the string explains why.
+def calculation_v2(lasso, isotherm_data_path=None, isotherm_data=None):
+    my_ML = ML()  # This initiates the class.
 
     # Here, we are creating the pressure bins which can be used for the ML model.
     n_bins = 7
     pressure_bins = my_ML.build_pressure_bins(5, 1e5, n_bins)
 
-    # Here, we generate a string for the various columns in the regression which we will input to the formula.
-    feature_list = ["c_%d" % i for i in range(len(pressure_bins))]
+    if isotherm_data is None:
+        column_names = ["Pressure", "Loading"]
+        with stage("read_isotherm"):
+            isotherm_data = pd.read_table(
+                isotherm_data_path, skiprows=1, sep="\t", names=column_names
+            )  # That text file gets made by the app.py python script.
 
-    # This is the list of features that we want to use.
-    col_list = feature_list + my_ML.generate_combine_feature_list(
-        feature_list, degree=2
-    )
-
-    # We now proceed to add the features to the dataframe.
-    test_data = my_ML.add_features(
-        test_data,
-        pressure_bins,
-        feature_list,
-        col_list,
-        isotherm_data_path=isotherm_data_path,
-    )
+    # The features (bin means, their products, normalized) of this one isotherm.
+    with stage("ml_features"):
+        names, means, features = my_ML.feature_matrix([isotherm_data], pressure_bins)
 
     # Identifying if any bins are empty (NaN values).
-    empty_bins = [] # Will keep track of the indices of the empty bins.
-    for i in range(n_bins):
-        if np.isnan(test_data.iloc[0, i+1]): # The +1 is to skip the first column, which is the name.
-            empty_bins.append(i)
-    empty_bin_boundaries = [] # Will keep track of the boundaries of the bins that are empty.
-    for i in empty_bins:
-        empty_bin_boundaries.append(pressure_bins[i])
-
-    # Check if any values in the dataframe are Null
-    if test_data.isnull().values.any(): # This would prevent lasso.predict from running correctly.
+    empty_bin_boundaries = [pressure_bins[i] for i in np.flatnonzero(np.isnan(means[0]))] # The boundaries of the bins that are empty.
+    if empty_bin_boundaries: # This would prevent lasso.predict from running correctly.
         return f"Missing data in a pressure bin, so the ML prediction could not be generated. The bins are, in Pa, {pressure_bins}. This isotherm is missing data in bins {empty_bin_boundaries}" 
             # Quits, does not proceed with the rest of the function.
 
-    test_data = test_data.dropna(subset=col_list)
-
-    # Loading the LASSO model.
-    lasso = pickle.load(open(f"{MAIN_PATH}/SESAMI/SESAMI_2/lasso_model.sav", "rb"))
-        # The LASSO model was trained following the jupyter notebook code in the SESAMI 2 paper
-        # It was saved using pickle.dump(lasso, open('lasso_model.sav', 'wb'))
-
-    test_data["FittedValues"] = lasso.predict(test_data[col_list])
-
-    test_prediction = test_data.iloc[0]["FittedValues"]
+    with stage("lasso"):
+        test_prediction = lasso.predict(model_input(lasso, features))[0]
     test_prediction = f"{test_prediction:.2f}"  # 2 digits after the decimal place
 
     return test_prediction
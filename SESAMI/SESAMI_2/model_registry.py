@@ -0,0 +1,129 @@
+# Keeps the SESAMI 2 LASSO model loaded, so that it is unpickled once per process instead of once per request.
+# The model file is checked for changes on every use (one os.stat call), and a changed file is loaded and validated before it replaces
+# the model in use. That way, a retrained model can be swapped in by replacing lasso_model.sav, without restarting the server.
+
+import os
+import pickle
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+LASSO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lasso_model.sav")
+
+# The names of the features SESAMI 2 makes, in order: the mean loading in each of the 7 pressure bins, and their 28 degree 2 combinations,
+# as in ML.generate_combine_feature_list. See calculation_v2.
+BIN_FEATURES = ["c_%d" % i for i in range(7)]
+FEATURE_NAMES = BIN_FEATURES + [f"{a}-{b}" for i, a in enumerate(BIN_FEATURES) for b in BIN_FEATURES[i:]]
+N_FEATURES = len(FEATURE_NAMES)
+
+
+def model_input(model, features):
+    """
+    This function returns the features (an array with one row per isotherm, with the columns FEATURE_NAMES) as model.predict should get them.
+    A model fitted on a DataFrame knows the names of its features, and gets a DataFrame, so that scikit-learn checks the names and their order
+    (and does not warn that it was given an array). Other models, such as the bundled one, get the array.
+    """
+    if getattr(model, "feature_names_in_", None) is None:
+        return features
+    return pd.DataFrame(features, columns=FEATURE_NAMES)
+
+
+class ModelRegistry:
+    def __init__(self, path=LASSO_PATH):
+        """
+        path: Path to a LASSO model saved with pickle.dump(lasso, open('lasso_model.sav', 'wb')).
+        """
+        self.path = path
+        self.model = None
+        self.version = None  # (modification time, size) of the file the model was loaded from.
+        self.failed_version = None  # Version of a file that failed to load, so it is not retried on every call.
+        self.n_loads = 0
+        self.lock = threading.Lock()
+
+    def file_version(self):
+        st = os.stat(self.path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def load(self):
+        """
+        This function unpickles the model file and checks that it can make predictions. Returns the model; raises ValueError if it is not usable.
+        """
+        with open(self.path, "rb") as f:
+            with warnings.catch_warnings():  # The bundled model was pickled with an older scikit-learn.
+                warnings.simplefilter("ignore")
+                model = pickle.load(f)
+        self.validate(model)
+        return model
+
+    @staticmethod
+    def validate(model):
+        """
+        This function checks that model is a fitted regressor taking the SESAMI 2 features (in the order of FEATURE_NAMES, if the model knows their names).
+        Raises ValueError otherwise.
+        """
+        if not hasattr(model, "predict"):
+            raise ValueError(f"The ML model ({type(model).__name__}) has no predict method.")
+        n_features = getattr(model, "n_features_in_", None)
+        if n_features is None and hasattr(model, "coef_"):
+            n_features = np.shape(model.coef_)[-1]
+        if n_features != N_FEATURES:
+            raise ValueError(f"The ML model takes {n_features} features; SESAMI 2 makes {N_FEATURES}.")
+        names = getattr(model, "feature_names_in_", None)
+        if names is not None and list(names) != FEATURE_NAMES:
+            raise ValueError(f"The ML model takes the features {list(names)}; SESAMI 2 makes {FEATURE_NAMES}.")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            prediction = model.predict(model_input(model, np.zeros((1, N_FEATURES))))
+        if not np.all(np.isfinite(prediction)):
+            raise ValueError("The ML model does not give a finite prediction.")
+
+    def get(self):
+        """
+        This function returns the model, loading it first if this has not happened yet or if the file has changed since.
+        If a changed file can not be loaded (e.g. it is only partially written), the previous model keeps being used and a warning is given.
+        """
+        version = self.file_version()
+        if version == self.version or version == self.failed_version:
+            if self.model is not None:
+                return self.model
+
+        with self.lock:  # Only one thread loads the file; the others wait for it and use the result.
+            version = self.file_version()
+            if version == self.version:
+                return self.model
+            try:
+                model = self.load()
+            except Exception as e:
+                self.failed_version = version
+                if self.model is None:  # Nothing to fall back on.
+                    raise
+                warnings.warn(f"Could not reload the ML model from {self.path}, the previous model is kept: {e}")
+                return self.model
+            self.model, self.version, self.failed_version = model, version, None
+            self.n_loads += 1
+            return self.model
+
+
+_registries = {}  # One registry per model path, shared by all threads of a process.
+_registries_lock = threading.Lock()
+
+
+def get_registry(path=LASSO_PATH):
+    """
+    This function returns the ModelRegistry of the model at path, shared by all threads of this process.
+    """
+    path = os.path.abspath(path)
+    with _registries_lock:
+        registry = _registries.get(path)
+        if registry is None:
+            registry = _registries[path] = ModelRegistry(path)
+    return registry
+
+
+def get_lasso(path=LASSO_PATH):
+    """
+    This function returns the LASSO model at path, loaded once per process and reloaded when the file changes.
+    """
+    return get_registry(path).get()
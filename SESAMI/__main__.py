@@ -0,0 +1,134 @@
+"""
+Command line interface for SESAMI.
+
+Usage
+-----
+    python -m SESAMI batch SOURCE -o OUTPUT [options]
+    python -m SESAMI benchmark [options]
+
+Run python -m SESAMI batch --help or python -m SESAMI benchmark --help for the list of options.
+"""
+
+import argparse
+import sys
+
+from SESAMI.batch import DEFAULT_OPTIONS, run_batch
+from SESAMI.benchmark import BASELINE_PATH, SYNTHETIC_SIZES
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m SESAMI", description="SESAMI surface area analysis.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Analyze many isotherms without plots.",
+        description="Run BET, BET+ESW, and the ML model over many isotherms, streaming the results to a CSV file or a Parquet directory. "
+        "Rerunning with the same output resumes where the last run stopped.",
+    )
+    batch.add_argument("source", help="Directory, glob pattern (quote it), or Parquet file of isotherms. Parquet needs pyarrow or fastparquet.")
+    batch.add_argument("-o", "--output", required=True, help="Output CSV file, or Parquet directory if it ends in .parquet (needs pyarrow or fastparquet).")
+    batch.add_argument("--gas", choices=["Argon", "Nitrogen"], default=DEFAULT_OPTIONS["gas"], help="Adsorbate. Default: %(default)s.")
+    batch.add_argument("--custom-cross-section", type=float, help="Cross section of a custom adsorbate, in Å²/molecule. Overrides --gas.")
+    batch.add_argument("--custom-temperature", type=float, help="Temperature of a custom adsorbate, in K.")
+    batch.add_argument("--custom-saturation-pressure", type=float, help="Saturation pressure of a custom adsorbate, in Pa.")
+    batch.add_argument("--bet-only", action="store_true", help="Skip the BET+ESW analysis.")
+    batch.add_argument("--r2-cutoff", default=DEFAULT_OPTIONS["R2 cutoff"], help="Default: %(default)s.")
+    batch.add_argument("--r2-min", default=DEFAULT_OPTIONS["R2 min"], help="Default: %(default)s.")
+    batch.add_argument("--no-ml", action="store_true", help="Skip the ML prediction.")
+    batch.add_argument("--processes", type=int, help="Number of worker processes. Default: number of CPUs.")
+    batch.add_argument("--chunksize", type=int, default=1, help="Isotherms sent to a worker at a time. Default: %(default)s.")
+    batch.add_argument("--flush-every", type=int, default=100, help="Rows per Parquet part file. Default: %(default)s.")
+    batch.add_argument("--no-resume", action="store_true", help="Overwrite the output instead of skipping isotherms already in it.")
+
+    benchmark = subparsers.add_parser(
+        "benchmark",
+        help="Time the calculation stages and compare them against a baseline.",
+        description="Time each calculation stage, and measure its peak memory, on the isotherms in paper/benchmarking and on synthetic isotherms. "
+        "Exits with status 1 if a stage is slower or uses more memory than in the baseline.",
+    )
+    benchmark.add_argument("--sizes", type=int, nargs="*", default=list(SYNTHETIC_SIZES), help="Points of the synthetic isotherms. Default: %(default)s.")
+    benchmark.add_argument("--only", default="*", help="Only benchmark isotherms matching this pattern, e.g. 'GCMC/*'. Default: all.")
+    benchmark.add_argument("--repeat", type=int, default=3, help="Timed runs per stage. Default: %(default)s.")
+    benchmark.add_argument("--max-time", type=float, default=5.0, help="Seconds after which a stage is not repeated further. Default: %(default)s.")
+    benchmark.add_argument("--no-plots", action="store_true", help="Skip the figures.")
+    benchmark.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file. Default: SESAMI/benchmark_baseline.json.")
+    benchmark.add_argument("--save-baseline", action="store_true", help="Save this run as the baseline instead of comparing against it.")
+    benchmark.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown or memory growth. Default: %(default)s.")
+    benchmark.add_argument("-o", "--output", help="Also save this run to a JSON file.")
+    return parser
+
+
+def batch_options(args):
+    # Turns the command line arguments into the settings dictionary used by the website.
+    options = {
+        "R2 cutoff": args.r2_cutoff,
+        "R2 min": args.r2_min,
+        "gas": args.gas,
+        "scope": "BET" if args.bet_only else "BET and BET+ESW",
+        "ML": "No" if args.no_ml else "Yes",
+        "custom adsorbate": "No",
+    }
+    custom = [args.custom_cross_section, args.custom_temperature, args.custom_saturation_pressure]
+    if any(value is not None for value in custom):
+        if any(value is None for value in custom):
+            raise SystemExit("A custom adsorbate needs --custom-cross-section, --custom-temperature, and --custom-saturation-pressure.")
+        options["custom adsorbate"] = "Yes"
+        options["custom cross section"] = args.custom_cross_section
+        options["custom temperature"] = args.custom_temperature
+        options["custom saturation pressure"] = args.custom_saturation_pressure
+    return options
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "batch":
+        n_done = run_batch(
+            args.source,
+            args.output,
+            options=batch_options(args),
+            processes=args.processes,
+            chunksize=args.chunksize,
+            resume=not args.no_resume,
+            flush_every=args.flush_every,
+        )
+        print(f"Analyzed {n_done} isotherms. Results are in {args.output}")
+
+    if args.command == "benchmark":
+        return run_benchmark_command(args)
+    return 0
+
+
+def run_benchmark_command(args):
+    from SESAMI import benchmark
+
+    isotherms = benchmark.benchmark_isotherms(sizes=args.sizes, pattern=args.only)
+    run = benchmark.run_benchmarks(
+        isotherms,
+        repeat=args.repeat,
+        max_time=args.max_time,
+        makeplots=not args.no_plots,
+        progress=lambda message: print(message, file=sys.stderr, flush=True),
+    )
+    if args.output:
+        benchmark.save_run(run, args.output)
+
+    if args.save_baseline:
+        benchmark.save_run(run, args.baseline)
+        print(benchmark.format_report(run))
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+
+    rows = benchmark.compare(run, benchmark.load_baseline(args.baseline), tolerance=args.tolerance)
+    print(benchmark.format_report(run, rows))
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} stages regressed against {args.baseline}.")
+        return 1
+    print(f"No regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+# Reads AIF files (the adsorption information format, see Langmuir 2021, 37, 4222−4226) in a single pass over their lines.
+# The adsorption and desorption loops are collected into numpy arrays as the lines go by, and the data items (units, temperature, adsorptive, ...)
+# into a dictionary, so the time is linear in the size of the file, and the memory is that of the two branches, whatever else the file holds.
+# read_aif takes any iterable of lines, e.g. an open file or io.StringIO(content), so the file does not have to be split into a list of lines first.
+
+from array import array
+
+import numpy as np
+
+# Factors to mol/kg and Pa of the supported units. May expand on allowed units in the future.
+LOADING_UNITS = {"mol/kg": 1, "mmol/g": 1, "cm³/g": 0.044615}  # conversion factor mol/kg -> cm^3 STP/g is 22.4139. So here, use its reciprocal
+PRESSURE_UNITS = {"Pa": 1, "pascal": 1, "bar": 100000, "torr": 133.322, "mbar": 100, "mb": 100}
+
+BRANCH_COLUMNS = ("pressure", "p0", "amount")
+
+
+class AIFError(ValueError):
+    # Raised when an AIF can not be used. The message is meant for the user.
+    pass
+
+
+class AIFBranch:
+    __slots__ = ("pressure", "p0", "amount", "error")
+
+    def __init__(self, pressure, p0, amount, error=None):
+        """
+        The adsorption or desorption data of an AIF, as float64 arrays in the units of the file.
+        p0 is None if the loop has no p0 column. error describes the row that could not be read, if any; the rows before it are kept.
+        """
+        self.pressure = pressure
+        self.p0 = p0
+        self.amount = amount
+        self.error = error
+
+    def __len__(self):
+        return len(self.pressure)
+
+
+class AIF:
+    def __init__(self, items, adsorption, desorption):
+        """
+        items: The data items of the file (e.g. "_units_pressure": "Pa"), by name, without quotes around the values.
+        adsorption, desorption: The AIFBranch of the first _adsorp_ and _desorp_ loops, or None if there is none.
+        """
+        self.items = items
+        self.adsorption = adsorption
+        self.desorption = desorption
+
+    @property
+    def units_loading(self):
+        return self.items.get("_units_loading")
+
+    @property
+    def units_pressure(self):
+        return self.items.get("_units_pressure")
+
+    @property
+    def adsorptive(self):
+        return self.items.get("_exptl_adsorptive")
+
+    @property
+    def temperature(self):
+        """
+        temperature is the temperature of the experiment in the units of _units_temperature, or None if it is missing or not a number.
+        """
+        try:
+            return float(self.items["_exptl_temperature"])
+        except (KeyError, ValueError):
+            return None
+
+    @property
+    def p0(self):
+        """
+        p0 is the saturation pressure of the first adsorption point in Pa, or None if it is not known.
+        """
+        if self.adsorption is None or self.adsorption.p0 is None or len(self.adsorption) == 0 or self.units_pressure not in PRESSURE_UNITS:
+            return None
+        return float(self.adsorption.p0[0]) * PRESSURE_UNITS[self.units_pressure]
+
+    def isotherm(self):
+        """
+        isotherm returns the pressure (Pa) and loading (mol/kg) of the adsorption branch, as float64 arrays.
+        Raises AIFError if the file has no adsorption data, or its units are missing or not supported.
+        """
+        # Currently, the adsorptive, p0, and temperature in the AIF are not checked.
+        if self.adsorption is None:
+            raise AIFError("Incorrectly formatted AIF file. Please refer to the example AIF in the Source Code.")
+        if self.adsorption.error is not None:
+            raise AIFError(self.adsorption.error)
+        if len(self.adsorption) == 0:
+            raise AIFError("Missing adsorption data in the AIF file. Please refer to the example AIF in the Source Code.")
+        if self.units_loading is None:
+            raise AIFError("Incorrectly formatted AIF file. Did not include units of loading. Please refer to the example AIF in the Source Code.")
+        if self.units_loading not in LOADING_UNITS:
+            raise AIFError(
+                f"Invalid/unsupported loading units in AIF file. Supported units are {list(LOADING_UNITS)}. Please refer to the example AIF in the Source Code."
+            )
+        if self.units_pressure is None:
+            raise AIFError("Incorrectly formatted AIF file. Did not include units of pressure. Please refer to the example AIF in the Source Code.")
+        if self.units_pressure not in PRESSURE_UNITS:
+            raise AIFError(
+                f"Invalid/unsupported pressure units in AIF file. Supported units are {list(PRESSURE_UNITS)}. Please refer to the example AIF in the Source Code."
+            )
+        return self.adsorption.pressure * PRESSURE_UNITS[self.units_pressure], self.adsorption.amount * LOADING_UNITS[self.units_loading]
+
+
+def _unquote(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def _branch(columns, prefix):
+    # Returns the positions of the pressure, p0, and amount columns of a loop with the given column names, if it is a loop of the branch with prefix
+    # (e.g. "_adsorp_"). Returns None otherwise.
+    positions = {name[len(prefix):]: i for i, name in enumerate(columns) if name.startswith(prefix)}
+    if "pressure" not in positions or "amount" not in positions:
+        return None
+    return [positions.get(column) for column in BRANCH_COLUMNS]
+
+
+def read_aif(lines):
+    """
+    read_aif reads an AIF from lines (an iterable of strings, e.g. an open file), and returns an AIF.
+    A row of the adsorption or desorption data that can not be read ends that branch; see AIFBranch.error.
+
+    A loop starts with a line loop_, followed by the names of its columns, one per line, and then its rows. As in the example AIF, a loop ends
+    at an empty line, a data item, a new loop, or the end of the file. Lines starting with # are comments, and text fields (between lines starting with ;) are skipped.
+    """
+    items = {}
+    branches = {}  # "_adsorp_" / "_desorp_" -> [pressure, p0, amount] as array("d"), or None for a column the loop does not have
+    errors = {}  # "_adsorp_" / "_desorp_" -> what is wrong with a row of the branch
+    columns = None  # The column names of the current loop, while they are being read.
+    loop = None  # (branch prefix, column positions) of the current loop while its rows are read; (None, None) for a loop that is skipped.
+    in_text = False
+
+    for number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if in_text:
+            in_text = not line.startswith(";")
+            continue
+        if line.startswith(";"):
+            in_text = True
+            continue
+        if stripped.startswith("#"):
+            continue
+
+        if columns is not None:  # Reading the column names of a loop.
+            if stripped.startswith("_"):
+                columns.append(stripped.split()[0])
+                continue
+            loop = (None, None)
+            for prefix in ("_adsorp_", "_desorp_"):
+                positions = _branch(columns, prefix)
+                if positions is not None and prefix not in branches:  # Only the first loop of each branch is read.
+                    branches[prefix] = [None if position is None else array("d") for position in positions]
+                    loop = (prefix, positions)
+                    break
+            columns = None
+
+        if not stripped or stripped.startswith("_") or stripped.startswith("loop_"):
+            loop = None  # The end of the loop, if there was one.
+        elif loop is not None:
+            prefix, positions = loop
+            if prefix is not None:
+                fields = stripped.split()
+                try:
+                    row = [None if position is None else float(fields[position]) for position in positions]
+                except (IndexError, ValueError):
+                    # The rest of the loop is skipped. The error is only raised if the branch is used (see AIF.isotherm).
+                    errors[prefix] = f"Could not read line {number} of the AIF file: {stripped!r}. Please refer to the example AIF in the Source Code."
+                    loop = (None, None)
+                    continue
+                for values, value in zip(branches[prefix], row):
+                    if values is not None:
+                        values.append(value)
+            continue
+
+        if stripped.startswith("loop_"):
+            columns = []
+        elif stripped.startswith("_"):
+            name, *value = stripped.split(None, 1)
+            items.setdefault(name, _unquote(value[0]) if value else "")  # The first one counts, if an item is given twice.
+
+    result = {}
+    for prefix, values in branches.items():
+        pressure, p0, amount = [None if column is None else np.frombuffer(column, dtype=np.float64).copy() for column in values]
+        result[prefix] = AIFBranch(pressure, p0, amount, error=errors.get(prefix))
+    return AIF(items, result.get("_adsorp_"), result.get("_desorp_"))
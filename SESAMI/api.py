@@ -0,0 +1,121 @@
+# The JSON API for scripts and other programs (/api/v1/analyze in app.py): no session, no files, and no plots.
+# read_request reads the isotherms and options of a request, and api_result shapes the results of an isotherm (see batch.analyze_isotherm) as plain numbers,
+# rather than the formatted text the website shows. The isotherms are checked as uploads of the website are (see uploads.py and Isotherm.check).
+
+import math
+
+from SESAMI.batch import BET_KEYS, DEFAULT_OPTIONS
+from SESAMI.isotherm_cache import Isotherm
+from SESAMI.uploads import MAX_ITEMS, UploadItem, read_item
+
+API_VERSION = 1
+MAX_POINTS = 10000  # Per isotherm, as for the website's CSV upload.
+
+# The options of the calculation, with the same keys and values as the website. "ML" and "custom adsorbate" can also be true or false.
+CHOICE_OPTIONS = {
+    "gas": ("Argon", "Nitrogen"),
+    "scope": ("BET", "BET and BET+ESW"),
+    "ML": ("Yes", "No"),
+    "custom adsorbate": ("Yes", "No"),
+}
+NUMBER_OPTIONS = ("R2 cutoff", "R2 min", "custom cross section", "custom temperature", "custom saturation pressure")
+CUSTOM_OPTIONS = ("custom cross section", "custom temperature", "custom saturation pressure")  # Needed if "custom adsorbate" is "Yes".
+
+
+class APIError(ValueError):
+    # Raised when a request can not be used. The message is meant for the caller.
+    pass
+
+
+def api_options(options):
+    """
+    api_options returns the calculation options of a request (a dictionary, e.g. from its JSON) with DEFAULT_OPTIONS for those that are missing,
+    as the website sends them. Raises APIError for an unknown option or a value that is not allowed.
+    """
+    if not isinstance(options, dict):
+        raise APIError("options must be an object.")
+    checked = dict(DEFAULT_OPTIONS)
+    for key, value in options.items():
+        if key in CHOICE_OPTIONS:
+            if isinstance(value, bool) and CHOICE_OPTIONS[key] == ("Yes", "No"):
+                value = "Yes" if value else "No"
+            if value not in CHOICE_OPTIONS[key]:
+                raise APIError(f"{key} must be one of {list(CHOICE_OPTIONS[key])}.")
+        elif key in NUMBER_OPTIONS:
+            try:
+                if isinstance(value, bool) or not math.isfinite(float(value)):
+                    raise ValueError
+            except (TypeError, ValueError):
+                raise APIError(f"{key} must be a number.")
+        else:
+            raise APIError(f"Unknown option {key!r}. The options are {list(CHOICE_OPTIONS) + list(NUMBER_OPTIONS)}.")
+        checked[key] = value
+    if checked["custom adsorbate"] == "Yes":
+        missing = [key for key in CUSTOM_OPTIONS if key not in checked]
+        if missing:
+            raise APIError(f"A custom adsorbate needs {missing}.")
+    return checked
+
+
+def api_isotherm(name, isotherm):
+    """
+    api_isotherm reads one isotherm of a request into an UploadItem (see uploads.py). isotherm is either an object with the arrays "pressure" (Pa)
+    and "loading" (mol/kg), or an object with "csv", or a string: the isotherm in the website CSV format.
+    An isotherm that can not be analyzed is an invalid item, with its problem as the message. Raises APIError if isotherm is neither.
+    """
+    if isinstance(isotherm, dict) and "csv" in isotherm:
+        isotherm = isotherm["csv"]
+    if isinstance(isotherm, str):
+        return read_item(f"{name}.csv", isotherm.encode())
+    if not isinstance(isotherm, dict) or "pressure" not in isotherm or "loading" not in isotherm:
+        raise APIError("An isotherm must be an object with the arrays pressure (Pa) and loading (mol/kg), or the isotherm as CSV text.")
+
+    pressure, loading = isotherm["pressure"], isotherm["loading"]
+    if not isinstance(pressure, list) or not isinstance(loading, list) or len(pressure) != len(loading):
+        return UploadItem(name, message="pressure and loading must be arrays of the same length.")
+    if not 2 <= len(pressure) <= MAX_POINTS:
+        return UploadItem(name, message=f"An isotherm must have between 2 and {MAX_POINTS} points.")
+    if not all(type(value) in (int, float) and math.isfinite(value) for value in pressure + loading):
+        return UploadItem(name, message="pressure and loading must contain numbers only.")
+    isotherm = Isotherm.from_columns(["Pressure (Pa)", "Loading (mol/kg)"], pressure, loading)  # The title row of the website CSV, which Isotherm.check expects.
+    return UploadItem(name, isotherm, isotherm.check())
+
+
+def read_request(body):
+    """
+    read_request reads the JSON body of a request: {"isotherm": ..., "options": {...}} for one isotherm, or {"isotherms": [...], "options": {...}} for
+    up to MAX_ITEMS, each of which can have a "name" (see api_isotherm for the isotherms). Returns the UploadItems, the options (see api_options),
+    and whether the request was for a single isotherm. Raises APIError if the request can not be used.
+    """
+    if not isinstance(body, dict):
+        raise APIError("The request must be a JSON object.")
+    options = api_options(body.get("options", {}))
+    if "isotherm" in body:
+        return [api_isotherm("isotherm", body["isotherm"])], options, True
+    isotherms = body.get("isotherms")
+    if not isinstance(isotherms, list) or not 1 <= len(isotherms) <= MAX_ITEMS:
+        raise APIError(f"The request must have an isotherm, or a list of 1 to {MAX_ITEMS} isotherms.")
+    names = [isotherm.get("name", str(i)) if isinstance(isotherm, dict) else str(i) for i, isotherm in enumerate(isotherms)]
+    return [api_isotherm(str(name), isotherm) for name, isotherm in zip(names, isotherms)], options, False
+
+
+def api_result(item, row=None):
+    """
+    api_result returns the result of an isotherm: its name, "status" ("OK", the reason the BET analysis failed, or "invalid"), "message" (a warning
+    about the isotherm, or why it is invalid), the "BET" and "BET_ESW" regions (see batch.BET_KEYS; None if not found), and "ML_prediction" (m²/g)
+    or "ML_message". row is the isotherm's row from batch.analyze_isotherm, for a valid item.
+    """
+    result = {"name": item.name, "status": "invalid", "message": None if item.message == "All good!" else item.message}
+    row = row or {}
+    if item.valid:
+        result["status"] = row.get("status")
+    for name, prefix in (("BET", "BET_"), ("BET_ESW", "BETESW_")):
+        region = None
+        if row.get(f"{prefix}A_BET") is not None:
+            region = {key: row[prefix + key] for key in BET_KEYS}
+            region["con3"] = region["con3"] == "Yes"
+            region["con4"] = region["con4"] == "Yes"
+        result[name] = region
+    result["ML_prediction"] = row.get("ML_prediction")
+    result["ML_message"] = row.get("ML_message")
+    return result
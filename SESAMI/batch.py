@@ -0,0 +1,379 @@
+"""
+Batch analysis of many isotherms without the website.
+
+The isotherms are analyzed with BETAn (BET and BET+ESW) and the SESAMI 2 LASSO model on a multiprocessing pool, without making any plots.
+Results are streamed to a CSV file or to a directory of Parquet part files as they come in. The output doubles as the checkpoint: when a run
+is restarted with the same output, the isotherms that already have a row are skipped.
+
+Example
+-------
+    python -m SESAMI batch "paper/benchmarking/GCMC isotherms/GCMC_N2_77K_isotherms_SESAMI_web_format" --gas Nitrogen -o results.csv
+"""
+
+import csv
+import glob
+import io
+import os
+import warnings
+from multiprocessing import Pool
+
+import pandas as pd
+
+from SESAMI.SESAMI_1.betan import BETAn
+from SESAMI.SESAMI_1.SESAMI_1 import adsorbate_conditions, read_isotherm, clean_isotherm
+from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2, scale_to_gas
+from SESAMI.SESAMI_2.model_registry import LASSO_PATH, get_lasso
+
+# Calculation settings, with the same keys and defaults as the website.
+DEFAULT_OPTIONS = {
+    "R2 cutoff": "0.9995",
+    "R2 min": "0.998",
+    "gas": "Argon",
+    "scope": "BET and BET+ESW",
+    "ML": "Yes",
+    "custom adsorbate": "No",
+}
+
+BET_KEYS = [
+    "C",
+    "qm",
+    "A_BET",
+    "con3",
+    "con4",
+    "length_linear_region",
+    "R2_linear_region",
+    "low_P_linear_region",
+    "high_P_linear_region",
+]
+COLUMNS = (
+    ["name", "status"]
+    + [f"BET_{key}" for key in BET_KEYS]
+    + [f"BETESW_{key}" for key in BET_KEYS]
+    + ["ML_prediction", "ML_message"]
+)
+
+ISOTHERM_EXTENSIONS = (".csv", ".txt")
+
+_LASSO = None  # The LASSO model, loaded once per worker process by _init_worker.
+
+
+def isotherm_sources(source):
+    """
+    This function lists the isotherms to analyze.
+
+    Parameters
+    ----------
+    source : str
+        A directory of isotherm files, a glob pattern of isotherm files, or a Parquet file.
+        Isotherm files are in the website format: a title row followed by pressure (Pa) and loading (mol/kg) columns, comma separated
+        for .csv files and tab separated otherwise. A Parquet file holds all isotherms in long format, with columns "name", "Pressure", and "Loading".
+
+    Returns
+    -------
+    sources : list
+        List of (name, isotherm) tuples. The isotherm is a path for isotherm files, and a DataFrame with columns "Pressure" and "Loading" for Parquet input.
+        The name of an isotherm file is its path relative to the directory, or to the folder the glob pattern starts from (e.g. "a/x.csv" for
+        "data/a/x.csv" and the pattern "data/*/*.csv"), so that files with the same name in different folders are told apart in the output.
+
+    """
+    if os.path.isfile(source) and source.endswith(".parquet"):
+        table = pd.read_parquet(source, columns=["name", "Pressure", "Loading"])
+        return [
+            (str(name), group[["Pressure", "Loading"]].reset_index(drop=True))
+            for name, group in table.groupby("name", sort=False)
+        ]
+
+    if os.path.isdir(source):
+        paths = [
+            os.path.join(source, filename)
+            for filename in os.listdir(source)
+            if filename.lower().endswith(ISOTHERM_EXTENSIONS)
+        ]
+    else:
+        paths = glob.glob(source)
+    paths = sorted(path for path in paths if os.path.isfile(path))
+    if not paths:
+        raise FileNotFoundError(f"No isotherms found at {source}")
+
+    root = source
+    if not os.path.isdir(source):
+        root = os.path.dirname(source)
+        while glob.has_magic(root):
+            root = os.path.dirname(root)
+    return [(os.path.relpath(path, root or os.curdir).replace(os.sep, "/"), path) for path in paths]
+
+
+def check_parquet():
+    """
+    This function makes sure that Parquet files can be read and written, so a batch with Parquet input or output fails before any isotherm is analyzed,
+    rather than when its results are written.
+
+    """
+    try:
+        pd.io.parquet.get_engine("auto")  # pyarrow, or fastparquet.
+    except ImportError:
+        raise ImportError("Parquet input and output need pyarrow (pip install pyarrow) or fastparquet.") from None
+
+
+def load_isotherm(isotherm):
+    """
+    This function reads an isotherm given by isotherm_sources.
+
+    Parameters
+    ----------
+    isotherm : str or pandas.core.frame.DataFrame
+        Path to an isotherm file, or an isotherm that is already loaded.
+
+    Returns
+    -------
+    data : pandas.core.frame.DataFrame
+        Represents an isotherm. Columns are "Pressure" and "Loading".
+
+    """
+    if isinstance(isotherm, pd.DataFrame):
+        return isotherm
+    sep = "," if isotherm.lower().endswith(".csv") else "\t"
+    return read_isotherm(isotherm, sep=sep)
+
+
+def analyze_isotherm(data, options=None, lasso=None):
+    """
+    This function runs SESAMI 1 (BET and BET+ESW) and SESAMI 2 (ML) on an isotherm, without making any plots.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        Represents an isotherm. Columns are "Pressure" in Pa and "Loading" in mol/kg.
+    options : dict
+        Calculation settings, with the same keys as on the website. Missing keys are taken from DEFAULT_OPTIONS.
+    lasso : sklearn.linear_model.Lasso
+        The SESAMI 2 model. The ML prediction is skipped if it is None.
+
+    Returns
+    -------
+    row : dict
+        The results, keyed by COLUMNS (without "name"). "status" is "OK", or the message the website would report on failure
+        ("BET linear failure", "No eswminima", or "BET+ESW linear failure"). The values of a region that could not be found are None.
+
+    """
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    options["R2 cutoff"] = float(options["R2 cutoff"])
+    options["R2 min"] = float(options["R2 min"])
+
+    row = dict.fromkeys(COLUMNS[1:])
+    row["status"] = "OK"
+
+    minlinelength = 4  # Minimum number of points required for a group of points to be considered a line, as in calculation_runner
+    gas, temperature, p0 = adsorbate_conditions(options)
+    b = BETAn(gas, temperature, minlinelength, options)
+    prepared = b.prepdata(clean_isotherm(data), p0=p0)
+
+    summary = b.computesummary(prepared, options)  # No plots are made.
+    row["status"] = summary["status"]
+    for prefix, region in (("BET_", summary["BET_dict"]), ("BETESW_", summary["BET_ESW_dict"])):
+        if region is not None:
+            for key, value in region.items():
+                row[prefix + key] = value
+
+    if options["ML"] == "Yes" and lasso is not None:
+        ML_prediction = calculation_v2(lasso, isotherm_data=data)
+        try:
+            ML_prediction = float(ML_prediction)
+        except ValueError:  # The prediction could not be made; ML_prediction is the message explaining why.
+            row["ML_message"] = ML_prediction
+        else:
+            row["ML_prediction"] = scale_to_gas(ML_prediction, options["gas"])
+
+    return row
+
+
+def _init_worker(lasso_path):
+    # Runs once in each worker process, so the LASSO model is not loaded (or sent over) for every isotherm.
+    global _LASSO
+    _LASSO = get_lasso(lasso_path) if lasso_path is not None else None
+
+
+def _analyze_task(task):
+    name, isotherm, options = task
+    try:
+        with warnings.catch_warnings():  # Per-isotherm numerical warnings would flood the output of a large batch.
+            warnings.simplefilter("ignore")
+            row = analyze_isotherm(load_isotherm(isotherm), options, lasso=_LASSO)
+    except Exception as e:  # One bad isotherm should not stop the whole batch.
+        row = dict.fromkeys(COLUMNS[1:])
+        row["status"] = f"Error: {type(e).__name__}: {e}"
+    row["name"] = name
+    return row
+
+
+def _complete_rows_end(text):
+    # Returns the length of the start of text (a CSV written by _CSVOutput) that is made of complete rows: rows with every column, ending in a line break.
+    end = consumed = 0
+    lines = io.StringIO(text, newline="")  # Only splits lines at line breaks, as csv does.
+
+    def counted():
+        nonlocal consumed
+        for line in lines:
+            consumed += len(line)
+            yield line
+
+    try:
+        for record in csv.reader(counted()):
+            if len(record) == len(COLUMNS) and text[consumed - 1 : consumed] in ("\n", "\r"):
+                end = consumed
+    except csv.Error:  # e.g. a quoted value that was cut off.
+        pass
+    return end
+
+
+def _drop_partial_row(path):
+    # Cuts off a row that was only partly written when a run was stopped (e.g. killed while writing), so the next rows start on a line of their own.
+    with open(path, "rb+") as f:
+        text = f.read().decode("utf-8", errors="surrogateescape")
+        end = _complete_rows_end(text)
+        if end < len(text):
+            f.truncate(len(text[:end].encode("utf-8", errors="surrogateescape")))
+
+
+class _CSVOutput:
+    # Appends rows to a CSV file, flushing after every row so the file is always a valid checkpoint.
+    # A row left partly written by an interrupted run is dropped, and its isotherm analyzed again.
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path):
+            _drop_partial_row(path)
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.f = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.f, fieldnames=COLUMNS)
+        if is_new:
+            self.writer.writeheader()
+
+    def done(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return set()
+        return set(pd.read_csv(self.path, usecols=["name"], dtype={"name": str}, encoding="utf-8")["name"])
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+class _ParquetOutput:
+    # Writes rows to a directory of Parquet part files, one part every flush_every rows.
+
+    def __init__(self, path, flush_every):
+        self.path = path
+        self.flush_every = flush_every
+        self.rows = []
+        os.makedirs(path, exist_ok=True)
+
+    def parts(self):
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def done(self):
+        names = set()
+        for part in self.parts():
+            names.update(pd.read_parquet(part, columns=["name"])["name"])
+        return names
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        part = os.path.join(self.path, f"part-{len(self.parts()):05d}.parquet")
+        # Written under a temporary name first, so an interrupted write does not leave a broken part behind.
+        pd.DataFrame(self.rows, columns=COLUMNS).to_parquet(part + ".tmp", index=False)
+        os.replace(part + ".tmp", part)
+        self.rows = []
+
+    def close(self):
+        self.flush()
+
+
+def run_batch(
+    source,
+    output,
+    options=None,
+    processes=None,
+    chunksize=1,
+    resume=True,
+    flush_every=100,
+    lasso_path=LASSO_PATH,
+):
+    """
+    This function analyzes every isotherm in source with analyze_isotherm, and streams the results to output.
+
+    Parameters
+    ----------
+    source : str
+        A directory, glob pattern, or Parquet file of isotherms. See isotherm_sources.
+    output : str
+        Where the results go. A path ending in ".parquet" is a directory of Parquet part files; anything else is a CSV file.
+    options : dict
+        Calculation settings, with the same keys as on the website. Missing keys are taken from DEFAULT_OPTIONS.
+    processes : int
+        Number of worker processes. Defaults to the number of CPUs. With 1, the isotherms are analyzed in this process.
+    chunksize : int
+        Number of isotherms sent to a worker at a time.
+    resume : bool
+        If True, isotherms that already have a row in output are skipped. If False, output is overwritten.
+    flush_every : int
+        For Parquet output, the number of rows in each part file.
+    lasso_path : str
+        Path to the SESAMI 2 LASSO model. If None, no ML predictions are made.
+
+    Returns
+    -------
+    n_done : int
+        The number of isotherms analyzed in this run.
+
+    """
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    if options["ML"] != "Yes":
+        lasso_path = None
+
+    if source.endswith(".parquet") or output.endswith(".parquet"):
+        check_parquet()
+    sources = isotherm_sources(source)
+
+    if not resume and os.path.exists(output):
+        if os.path.isdir(output):
+            for part in glob.glob(os.path.join(output, "part-*.parquet")):
+                os.remove(part)
+        else:
+            os.remove(output)
+
+    if output.endswith(".parquet"):
+        out = _ParquetOutput(output, flush_every)
+    else:
+        out = _CSVOutput(output)
+
+    done = out.done()
+    tasks = [(name, isotherm, options) for name, isotherm in sources if name not in done]
+
+    n_done = 0
+    pool = None
+    try:
+        if processes == 1:
+            _init_worker(lasso_path)
+            rows = map(_analyze_task, tasks)
+        else:
+            pool = Pool(processes, initializer=_init_worker, initargs=(lasso_path,))
+            rows = pool.imap_unordered(_analyze_task, tasks, chunksize=chunksize)
+        for row in rows:
+            out.write(row)
+            n_done += 1
+    finally:
+        out.close()
+        if pool is not None:
+            pool.terminate()
+
+    return n_done
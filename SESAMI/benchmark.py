@@ -0,0 +1,330 @@
+"""
+Performance benchmarks of the SESAMI calculation stages.
+
+Each stage of a website calculation is timed, and its peak memory measured, on the GCMC and experimental isotherms in paper/benchmarking
+and on synthetic isotherms with many more points than usual. The results can be saved as a baseline, and later runs are compared against
+it, so that a change that makes a stage slower or hungrier is noticed before it reaches production.
+
+Example
+-------
+    python -m SESAMI benchmark                    # Compare against SESAMI/benchmark_baseline.json
+    python -m SESAMI benchmark --save-baseline    # Replace the baseline, e.g. after an intended change, or on new hardware
+
+Timings depend on the machine, so a baseline is only meaningful on the machine it was recorded on.
+A full run takes several minutes, mostly for the figures and the 10,000 point isotherm; --no-plots, --sizes, and --only make it quicker.
+"""
+
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from SESAMI.batch import isotherm_sources, load_isotherm
+from SESAMI.SESAMI_1 import betan
+from SESAMI.SESAMI_1.betan import BETAn
+from SESAMI.SESAMI_1.SESAMI_1 import adsorbate_conditions, clean_isotherm
+from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2_runner
+from SESAMI.SESAMI_2.model_registry import LASSO_PATH, get_lasso
+
+MAIN_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + "/"
+
+BASELINE_PATH = os.path.join(MAIN_PATH, "SESAMI", "benchmark_baseline.json")
+
+# The bundled isotherms, by group. All are N2 at 77 K.
+BUNDLED_ISOTHERMS = {
+    "GCMC": os.path.join(MAIN_PATH, "paper", "benchmarking", "GCMC isotherms", "GCMC_N2_77K_isotherms_SESAMI_web_format"),
+    "experimental": os.path.join(
+        MAIN_PATH, "paper", "benchmarking", "experimental isotherms", "experimental_N2_77K_isotherms_SESAMI_web_format"
+    ),
+}
+SYNTHETIC_SIZES = (1000, 10000)
+
+STAGES = ["prepdata", "getlocalextremum", "picklen", "linregauto", "saveimgsummary", "calculation_v2_runner"]
+
+# Calculation and plot settings, as on the website.
+OPTIONS = {
+    "dpi": 100.0,
+    "font size": 10,
+    "font type": "DejaVu Sans",
+    "legend": "Yes",
+    "R2 cutoff": 0.9995,
+    "R2 min": 0.998,
+    "scope": "BET and BET+ESW",
+    "ML": "Yes",
+    "custom adsorbate": "No",
+}
+
+
+def synthetic_isotherm(n_points):
+    """
+    This function makes an isotherm with n_points points, by interpolating the example isotherm on a logarithmic pressure grid from 1 Pa to
+    just below the saturation pressure. It has the shape of a real isotherm, so every stage does the work it would do for a measured one.
+
+    Returns
+    -------
+    data : pandas.core.frame.DataFrame
+        Represents an isotherm. Columns are "Pressure" and "Loading".
+
+    """
+    example = load_isotherm(os.path.join(MAIN_PATH, "example_input", "example_input.txt"))
+    pressure = np.logspace(0, 5, n_points) * 0.999
+    loading = np.interp(np.log(pressure), np.log(example["Pressure"].to_numpy(dtype=float)), example["Loading"].to_numpy())
+    return pd.DataFrame({"Pressure": pressure, "Loading": loading})
+
+
+def benchmark_isotherms(sizes=SYNTHETIC_SIZES, pattern="*"):
+    """
+    This function lists the isotherms to benchmark.
+
+    Parameters
+    ----------
+    sizes : iterable of int
+        The numbers of points of the synthetic isotherms.
+    pattern : str
+        Only isotherms with names matching this fnmatch pattern are included, e.g. "GCMC/*".
+
+    Returns
+    -------
+    isotherms : list
+        List of (name, gas, data) tuples. Names are "group/isotherm", e.g. "GCMC/HKUST-1" or "synthetic/1000".
+
+    """
+    isotherms = []
+    for group, folder in BUNDLED_ISOTHERMS.items():
+        for name, path in isotherm_sources(folder):
+            isotherms.append((f"{group}/{os.path.splitext(name)[0]}", "Nitrogen", path))
+    for size in sizes:
+        isotherms.append((f"synthetic/{size}", "Argon", size))
+    return [
+        (name, gas, synthetic_isotherm(source) if isinstance(source, int) else load_isotherm(source))
+        for name, gas, source in isotherms
+        if fnmatch.fnmatchcase(name, pattern)
+    ]
+
+
+def measure(fn, repeat=3, max_time=5.0):
+    """
+    This function times fn() and measures the peak memory it allocates.
+
+    fn is first run once with tracemalloc on, for the peak memory (this also warms up caches and imports), and then up to repeat more times
+    for the timing. The timed runs stop early once they have taken max_time seconds, so slow stages are not repeated needlessly.
+
+    Returns
+    -------
+    result : dict
+        "time": The fastest of the timed runs, in seconds. The fastest run is the least disturbed by the rest of the machine.
+        "median_time": The median of the timed runs, in seconds.
+        "peak_memory": The peak memory allocated by fn, in bytes.
+        "value": The return value of fn.
+
+    """
+    tracemalloc.start()
+    try:
+        value = fn()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    started = time.perf_counter()
+    while len(times) < max(repeat, 1) and (not times or time.perf_counter() - started < max_time):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"time": min(times), "median_time": statistics.median(times), "peak_memory": peak_memory, "value": value}
+
+
+def benchmark_isotherm(data, gas, repeat=3, max_time=5.0, makeplots=True, plotpath=None):
+    """
+    This function benchmarks the stages of a website calculation on one isotherm.
+
+    The stages are:
+    prepdata: BETAn.prepdata, without the consistency 1 limit and ESW minimum (full=False); those are timed as getlocalextremum.
+    getlocalextremum: The two BETAn.getlocalextremum calls prepdata makes to find the consistency 1 limit and the ESW minimum.
+    picklen: BETAn.picklen for BET and for BET+ESW.
+    linregauto: BETAn.linregauto on the BET and BET+ESW linear regions.
+    saveimgsummary: Drawing and saving the multiplot and individual figures (through BETAn.rendersummary). Skipped if makeplots is False.
+    calculation_v2_runner: The SESAMI 2 ML prediction.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+        Represents an isotherm. Columns are "Pressure" and "Loading".
+    gas : str
+        "Argon" or "Nitrogen".
+    repeat, max_time : int, float
+        See measure.
+    makeplots : bool
+        Whether to benchmark the figures.
+    plotpath : str
+        Folder to save the figures in. Defaults to a temporary folder.
+
+    Returns
+    -------
+    results : dict
+        The measure results (without "value") of each stage, by stage name. Stages after a failed calculation (e.g. no BET linear region) are left out.
+
+    """
+    options = dict(OPTIONS, gas=gas)
+    minlinelength = 4  # As in calculation_runner
+    gas, temperature, p0 = adsorbate_conditions(options)
+    b = BETAn(gas, temperature, minlinelength, options)
+    cleaned = clean_isotherm(data)
+    stages = {}
+
+    stages["prepdata"] = measure(lambda: b.prepdata(cleaned, p0=p0, full=False), repeat, max_time)
+    prepared = stages["prepdata"]["value"]
+
+    def limits():
+        con1limit = b.getlocalextremum(prepared, column="BET_y2", x="P_rel", how="Maxima", which=0, points=3)[0]
+        eswminima = b.getlocalextremum(prepared, column="phi", x="P_rel", how="Minima", which=0, points=3)[0]
+        return con1limit, eswminima
+
+    stages["getlocalextremum"] = measure(limits, repeat, max_time)
+    b.con1limit, b.eswminima = stages["getlocalextremum"]["value"]
+
+    def regions():
+        rbet = b.picklen(prepared, method="BET")
+        rbetesw = b.picklen(prepared, method="BET+ESW") if b.eswminima is not None else (None, None)
+        return rbet, rbetesw
+
+    stages["picklen"] = measure(regions, repeat, max_time)
+    rbet, rbetesw = stages["picklen"]["value"]
+    found = [r for r in (rbet, rbetesw) if r != (None, None)]
+
+    if found:
+        stages["linregauto"] = measure(lambda: [b.linregauto(r[0], r[1], prepared) for r in found], repeat, max_time)
+
+    if makeplots and rbet != (None, None) and rbetesw != (None, None):
+        summary = b.computesummary(prepared, options)
+        folder = plotpath or tempfile.mkdtemp(prefix="sesami_benchmark_")
+        try:
+            stages["saveimgsummary"] = measure(lambda: b.rendersummary(summary, options, MAIN_PATH, "benchmark", sumpath=folder), repeat, max_time)
+        finally:
+            if plotpath is None:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    stages["calculation_v2_runner"] = measure(
+        lambda: calculation_v2_runner(MAIN_PATH, "benchmark", isotherm_data=data), repeat, max_time
+    )
+
+    for result in stages.values():
+        del result["value"]
+    return stages
+
+
+def run_benchmarks(isotherms, repeat=3, max_time=5.0, makeplots=True, progress=None):
+    """
+    This function benchmarks each isotherm from benchmark_isotherms.
+
+    Returns
+    -------
+    run : dict
+        {"meta": Information about the machine and library versions, "results": {isotherm name: {stage: measure result}}}.
+        This is also the format of the baseline file.
+
+    """
+    # Loaded up front, so that loading them is not counted as part of the first isotherm's stages.
+    get_lasso(LASSO_PATH)
+    if makeplots:
+        betan._load_matplotlib()
+
+    results = {}
+    for name, gas, data in isotherms:
+        if progress is not None:
+            progress(f"{name} ({len(data)} points)")
+        with warnings.catch_warnings():  # Numerical warnings of the calculation itself are not of interest here.
+            warnings.simplefilter("ignore")
+            results[name] = benchmark_isotherm(data, gas, repeat=repeat, max_time=max_time, makeplots=makeplots)
+    meta = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(run, baseline, tolerance=0.25, min_time=0.001, min_memory=1024 * 1024):
+    """
+    This function compares a benchmark run to a baseline.
+
+    A stage has regressed if it takes more than (1 + tolerance) times its baseline time, and at least min_time seconds more;
+    or if it allocates more than (1 + tolerance) times its baseline peak memory, and at least min_memory bytes more.
+    The absolute thresholds keep timer noise on very fast stages from being reported.
+
+    Returns
+    -------
+    rows : list
+        A dict per isotherm and stage in both run and baseline, with the keys "isotherm", "stage", "time", "baseline_time",
+        "time_ratio", "peak_memory", "baseline_peak_memory", "memory_ratio", and "regression" (a list of "time" and/or "memory").
+
+    """
+    rows = []
+    for name, stages in run["results"].items():
+        for stage, result in stages.items():
+            base = baseline["results"].get(name, {}).get(stage)
+            if base is None:
+                continue
+            row = {
+                "isotherm": name,
+                "stage": stage,
+                "time": result["time"],
+                "baseline_time": base["time"],
+                "time_ratio": result["time"] / base["time"] if base["time"] > 0 else float("inf"),
+                "peak_memory": result["peak_memory"],
+                "baseline_peak_memory": base["peak_memory"],
+                "memory_ratio": result["peak_memory"] / base["peak_memory"] if base["peak_memory"] > 0 else float("inf"),
+                "regression": [],
+            }
+            if row["time_ratio"] > 1 + tolerance and result["time"] - base["time"] >= min_time:
+                row["regression"].append("time")
+            if row["memory_ratio"] > 1 + tolerance and result["peak_memory"] - base["peak_memory"] >= min_memory:
+                row["regression"].append("memory")
+            rows.append(row)
+    return rows
+
+
+def format_report(run, rows=None):
+    """
+    This function returns a table of the per-stage times and peak memory of a run, with the comparison to the baseline if rows (from compare) are given.
+    """
+    compared = {(row["isotherm"], row["stage"]): row for row in rows or []}
+    lines = [f"{'isotherm':<32} {'stage':<22} {'time (ms)':>11} {'peak (MB)':>10} {'vs baseline':>20}"]
+    for name, stages in run["results"].items():
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            result = stages[stage]
+            line = f"{name:<32} {stage:<22} {1000 * result['time']:>11.2f} {result['peak_memory'] / 1e6:>10.2f}"
+            row = compared.get((name, stage))
+            if row is not None:
+                line += f" {row['time_ratio']:>8.2f}x {row['memory_ratio']:>6.2f}x mem"
+                if row["regression"]:
+                    line += "  REGRESSION (" + ", ".join(row["regression"]) + ")"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_run(run, path):
+    with open(path, "w") as f:
+        json.dump(run, f, indent=1, sort_keys=True)
+        f.write("\n")
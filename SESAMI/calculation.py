@@ -0,0 +1,180 @@
+# The calculation behind the website's "Run calculation" button: SESAMI 1 and 2 on the user's isotherm, with the results formatted for the front end.
+
+import os
+import warnings
+import numpy as np
+from SESAMI.batch import COLUMNS, analyze_isotherm
+from SESAMI.SESAMI_1.SESAMI_1 import calculation_runner, calculation_summary
+from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2_runner, scale_to_gas
+from SESAMI.SESAMI_2.model_registry import get_lasso
+from SESAMI.result_cache import make_result_cache
+
+# Results of earlier calculations, so that rerunning an isotherm with the same settings skips the calculation. Set up once per (worker) process.
+# SESAMI_RESULT_CACHE is "memory" (each process has its own cache), "sqlite:PATH" (one cache file, shared by all processes), or "off".
+# The web server's workers are given their cache by warm_up; it is shared by default (see app.py), since a rerun can land on any worker.
+RESULT_CACHE = make_result_cache(os.environ.get("SESAMI_RESULT_CACHE", "memory"))
+
+
+def warm_up(MAIN_PATH, result_cache=None):
+    # This function is run once by each worker process of the job queue, so that the first calculation in it does not pay for loading the ML model.
+    # result_cache is the setting of the worker's RESULT_CACHE (see make_result_cache), if not SESAMI_RESULT_CACHE.
+    global RESULT_CACHE
+    if result_cache is not None:
+        RESULT_CACHE = make_result_cache(result_cache)
+    get_lasso(f"{MAIN_PATH}SESAMI/SESAMI_2/lasso_model.sav")
+
+
+def run_calculation(MAIN_PATH, user_options, USER_ID, plot_number, isotherm_data=None, user_files=None):
+    # This function runs SESAMI 1 and SESAMI 2 on the user's isotherm.
+    # It generates diagnostics (SESAMI 1 and 2) and figures (SESAMI 1).
+    # Assumes the user's input.txt has been made by the website already.
+    # It does not depend on the Flask request, so that it can run in a worker process of the job queue (see jobs.py).
+    # isotherm_data is the user's isotherm as a DataFrame with columns "Pressure" and "Loading", if it has already been read (see isotherm_cache.py).
+    # user_files is where the user's files are, if not in f"{MAIN_PATH}user_{USER_ID}/": a folder, or the files of a session (see workspace.py).
+
+    # If user_options["interactive plots"] is "Yes", no figures are made here. Instead, the results include what the figures show (see BETAn.plotpayload),
+    # and the browser draws them. The figures can still be made by running the calculation again without "interactive plots".
+
+    ### SESAMI 1
+
+    plot_data = None # Only sent for interactive plots.
+    if user_options.get("interactive plots", "No") == "Yes":
+        # Running the SESAMI 1 calculation. Does not make plots.
+        b, summary = calculation_summary(
+            MAIN_PATH, user_options, USER_ID, isotherm_data=isotherm_data, result_cache=RESULT_CACHE, user_files=user_files
+        )
+        BET_dict, BET_ESW_dict = summary["status"], summary["status"] # The failure, if any.
+        if summary["status"] == "OK":
+            BET_dict, BET_ESW_dict = summary["BET_dict"], summary["BET_ESW_dict"]
+            plot_data = b.plotpayload(summary)
+    else:
+        # Running the SESAMI 1 calculation. Makes plots.
+        BET_dict, BET_ESW_dict = calculation_runner(
+            MAIN_PATH, user_options, USER_ID, plot_number, isotherm_data=isotherm_data, result_cache=RESULT_CACHE, user_files=user_files
+        )
+
+    # Packaging the diagnostics to be sent back to the frontend (index.html).
+    if BET_dict == 'No eswminima': # This is a problem.
+        return (
+            "No eswminima"  # Quits, does not proceed with the rest of the function.
+        )        
+    if BET_dict == 'BET linear failure':  # This is a problem.
+        return (
+            "BET linear failure"  # Quits, does not proceed with the rest of the function.
+        )
+    if BET_ESW_dict == 'BET+ESW linear failure': # This is a problem.
+        return (
+            "BET+ESW linear failure"  # Quits, does not proceed with the rest of the function.
+        )        
+    
+    # reformatting
+    BET_dict["C"] = "%.4g" % BET_dict["C"]
+    BET_dict["qm"] = "%.2f" % BET_dict["qm"]
+    BET_dict["A_BET"] = "%.1f" % BET_dict["A_BET"]
+    BET_dict["R2_linear_region"] = "%.4f" % BET_dict["R2_linear_region"]
+
+    BET_analysis = f'BET area = {BET_dict["A_BET"]} m2sup/g\n\
+        C = {BET_dict["C"]}\n\
+        qmsub = {BET_dict["qm"]} mol/kg\n\
+        Rouquerol consistency criteria 1 and 2: Yes\n\
+        Rouquerol consistency criterion 3: {BET_dict["con3"]}\n\
+        Rouquerol consistency criterion 4: {BET_dict["con4"]}\n\
+        Number of points in linear region: {BET_dict["length_linear_region"]}\n\
+        Lowest pressure of linear region: {int(np.rint(BET_dict["low_P_linear_region"]))} Pa\n\
+        Highest pressure of linear region: {int(np.rint(BET_dict["high_P_linear_region"]))} Pa\n\
+        R2sup of linear region: {BET_dict["R2_linear_region"]}'  # If a linear region is selected, it satisfies criteria 1 and 2. See SI for https://pubs.acs.org/doi/abs/10.1021/acs.jpcc.9b02116
+    # np.rint rounds to the nearest integer
+
+    if user_options['scope'] == 'BET': # Exclude ESW analysis
+        BETESW_analysis = None
+    else: # Include ESW analysis
+        # reformatting
+        BET_ESW_dict["C"] = "%.4g" % BET_ESW_dict["C"]
+        BET_ESW_dict["qm"] = "%.2f" % BET_ESW_dict["qm"]
+        BET_ESW_dict["A_BET"] = "%.1f" % BET_ESW_dict["A_BET"]
+        BET_ESW_dict["R2_linear_region"] = "%.4f" % BET_ESW_dict["R2_linear_region"]
+
+        BETESW_analysis = f'BET area = {BET_ESW_dict["A_BET"]} m2sup/g\n\
+            C = {BET_ESW_dict["C"]}\n\
+            qmsub = {BET_ESW_dict["qm"]} mol/kg\n\
+            Rouquerol consistency criteria 1 and 2: Yes\n\
+            Rouquerol consistency criterion 3: {BET_ESW_dict["con3"]}\n\
+            Rouquerol consistency criterion 4: {BET_ESW_dict["con4"]}\n\
+            Number of points in linear region: {BET_ESW_dict["length_linear_region"]}\n\
+            Lowest pressure of linear region: {int(np.rint(BET_ESW_dict["low_P_linear_region"]))} Pa\n\
+            Highest pressure of linear region: {int(np.rint(BET_ESW_dict["high_P_linear_region"]))} Pa\n\
+            R2sup of linear region: {BET_ESW_dict["R2_linear_region"]}'  # If a linear region is selected, it satisfies criteria 1 and 2. See SI for https://pubs.acs.org/doi/abs/10.1021/acs.jpcc.9b02116
+
+    if user_options['ML'] == 'No': # Exclude ML prediction
+        ML_prediction = None # Placeholder        
+    else:
+        ### SESAMI 2
+        ML_prediction = calculation_v2_runner(
+            MAIN_PATH, USER_ID, isotherm_data=isotherm_data, result_cache=RESULT_CACHE, user_files=user_files
+        )  # ML stands for machine learning.
+
+        if is_number(ML_prediction): # If ML_prediction is not a number, it is the error message about a bin being empty. If it is a number, the ML calculation ran, and we want to run some code on the number.
+            ML_prediction = float(ML_prediction
+                ) # Casting to float.
+
+            ML_prediction = scale_to_gas(ML_prediction, user_options['gas']) # The model predicts argon areas.
+
+            ML_prediction = "%.1f" % ML_prediction # One decimal precision. Casting back to string.
+
+    calculation_results = {
+        "ML_prediction": ML_prediction, 
+        "BET_analysis": BET_analysis,
+        "BETESW_analysis": BETESW_analysis,
+        "plot_number": plot_number,
+        "plot_data": plot_data,
+    }
+
+    return calculation_results  # Sends back SESAMI 1 and 2 diagnostics to be displayed, as well as the plot number so the appropriate plots are displayed.
+
+
+def run_calculation_batch(MAIN_PATH, user_options, USER_ID, plot_number, isotherm_data, batch):
+    # This function runs run_calculation with the user's files in batch (a workspace.FileBatch), for a workspace that the worker processes can not write to.
+    # Returns the results along with the batch, so that the web server can store the files the calculation made (batch.apply).
+
+    calculation_results = run_calculation(MAIN_PATH, user_options, USER_ID, plot_number, isotherm_data, user_files=batch)
+    return calculation_results, batch
+
+
+def run_analysis(MAIN_PATH, user_options, isotherm_data):
+    # This function runs SESAMI 1 and 2 on one isotherm of an upload of several isotherms (see uploads.py), without making any plots.
+    # Returns the isotherm's row of the summary table (see batch.analyze_isotherm), with numpy numbers cast to Python ones so it can be sent as JSON.
+
+    lasso = get_lasso(f"{MAIN_PATH}SESAMI/SESAMI_2/lasso_model.sav") if user_options.get("ML", "Yes") == "Yes" else None  # Loaded once per worker, see warm_up.
+    with warnings.catch_warnings():  # Numerical warnings of a single isotherm are not of interest here, as in the batch analysis.
+        warnings.simplefilter("ignore")
+        row = analyze_isotherm(isotherm_data, user_options, lasso=lasso)
+    return {key: value.item() if isinstance(value, np.generic) else value for key, value in row.items()}
+
+
+def run_analyses(MAIN_PATH, user_options, isotherms):
+    # This function runs run_analysis on several isotherms in one job, for the JSON API (see /api/v1/analyze in app.py), so that a large batch is one job per worker.
+    # Returns the rows of the isotherms, in order. An isotherm that fails gets the error as its "status", as in the batch analysis, and the others are still analyzed.
+
+    rows = []
+    for isotherm_data in isotherms:
+        try:
+            rows.append(run_analysis(MAIN_PATH, user_options, isotherm_data))
+        except Exception as e:
+            row = dict.fromkeys(COLUMNS[1:])
+            row["status"] = f"Error: {type(e).__name__}: {e}"
+            rows.append(row)
+    return rows
+
+
+def is_number(s):
+    """
+    is_number assesses whether the inputted string is a number; that it an be cast to a float.
+    It is used as a helper function in the run_calculation function.
+
+    :return: Boolean indicating whether the input string can be cast to a float.
+    """
+    try:
+        float(s)
+        return True
+    except ValueError:
+        return False
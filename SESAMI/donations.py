@@ -0,0 +1,191 @@
+# Writes the isotherms users donate (see process_info in app.py) to MongoDB without holding up the request.
+# Documents are put on a queue, and the request returns right away. A background thread writes them in batches with insert_many, to a collection of
+# one MongoClient that is shared by the whole app (a MongoClient keeps a pool of connections, so each write does not connect again).
+# A batch that can not be written is tried again after a growing delay. If the database stays unreachable, the batch is spooled to a file in spool_dir,
+# and the spooled batches are written once the database is back, also after a restart. One DonationWriter should use a spool_dir at a time.
+# Each document gets its _id when it is queued, so a batch that is written twice (e.g. after a reply was lost) is not stored twice.
+# A document the database rejects (e.g. one that fails validation, or is too large) would be rejected again, so it is not tried again: it is saved
+# with the error to a file in spool_dir/rejected, and the rest of its batch is written. Only errors reaching the database are tried again.
+
+import os
+import threading
+import time
+from collections import deque
+
+from bson import ObjectId, json_util
+from pymongo.errors import BulkWriteError, PyMongoError
+
+DUPLICATE_KEY = 11000  # MongoDB's error code for a document whose _id is already stored.
+
+
+class DonationWriter:
+    def __init__(self, collection, spool_dir, batch_size=50, batch_wait=1.0, retries=3, backoff=0.5, spool_retry=60.0, max_queued=1000):
+        """
+        collection: The collection to write to, e.g. MongoClient(...).data_isotherm.BET. Anything with pymongo's insert_many works (e.g. a mongomock collection).
+        spool_dir: Folder for the batches that could not be written, and (in its folder "rejected") the documents the database rejected. Created if needed.
+        batch_size: Largest number of documents per insert_many.
+        batch_wait: Seconds to wait for more documents before writing a batch that is not full.
+        retries, backoff: A batch that fails is tried again retries times, after backoff, 2 * backoff, 4 * backoff, ... seconds, before it is spooled.
+        spool_retry: After a batch is spooled, new batches are spooled right away for this many seconds, and the spooled batches are then written again.
+        max_queued: Largest number of documents waiting to be written. Beyond that, documents are spooled by submit.
+
+        Attributes:
+        written: Number of documents written to the collection so far.
+        spooled: Number of documents spooled so far (whether or not they have been written since).
+        rejected: Number of documents the database rejected so far.
+        """
+        self.collection = collection
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.retries = retries
+        self.backoff = backoff
+        self.spool_retry = spool_retry
+        self.max_queued = max_queued
+        self.written = 0
+        self.spooled = 0
+        self.rejected = 0
+        self.rejected_dir = os.path.join(spool_dir, "rejected")  # Created with the first rejected document.
+        os.makedirs(spool_dir, exist_ok=True)
+
+        self._queue = deque()
+        self._busy = 0  # Documents taken off the queue that are being written.
+        self._condition = threading.Condition()
+        self._closing = False
+        self._retry_at = 0.0  # time.monotonic() before which the database is not tried (see spool_retry).
+        self._spool_count = 0
+        # A daemon thread, so that the server can always exit. close() writes or spools what is left.
+        self._thread = threading.Thread(target=self._run, name="sesami-donations", daemon=True)
+        self._thread.start()
+
+    def submit(self, document):
+        """
+        submit queues document (a dict) to be written, and returns without waiting. An "_id" is added to document if it has none.
+        """
+        document.setdefault("_id", ObjectId())
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("The DonationWriter is closed.")
+            if len(self._queue) >= self.max_queued:  # The database has been slower than the requests for a while.
+                self._spool([document])
+                return
+            self._queue.append(document)
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        flush waits until every document submitted so far has been written or spooled. Returns False if that took longer than timeout seconds.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def close(self, timeout=30):
+        """
+        close writes (or spools) the queued documents, and stops the background thread. Waits at most timeout seconds for the writes;
+        documents still queued after that are spooled.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        with self._condition:
+            left, self._queue = list(self._queue), deque()
+        if left:
+            self._spool(left)
+
+    def _next_batch(self):
+        # Waits for documents, and takes up to batch_size of them off the queue. Returns None once closed and empty.
+        with self._condition:
+            while not self._queue:
+                if self._closing:
+                    return None
+                if not self._condition.wait(timeout=self.spool_retry):
+                    return []  # Nothing to write for a while; a chance to write the spooled batches.
+            deadline = time.monotonic() + self.batch_wait
+            while len(self._queue) < self.batch_size and not self._closing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(timeout=remaining):
+                    break
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._busy = len(batch)
+            return batch
+
+    def _run(self):
+        self._write_spooled()
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                if batch:
+                    written = None if time.monotonic() < self._retry_at else self._write(batch)
+                    if written is None:
+                        self._spool(batch)
+                    else:
+                        self.written += written
+                self._write_spooled()
+            finally:
+                with self._condition:
+                    self._busy = 0
+                    self._condition.notify_all()
+
+    def _write(self, batch):
+        # Writes batch, trying again after backoff if the database can not be reached. Returns the number of documents written
+        # (or already stored), or None if the batch could not be written.
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                self.collection.insert_many(batch, ordered=False)
+                return len(batch)
+            except BulkWriteError as error:
+                # The writes are unordered, so every document the database did not reject was written. Documents that are already stored
+                # were written by an earlier attempt. The others would be rejected again, so they are set aside rather than tried again.
+                rejected = [write_error for write_error in error.details.get("writeErrors", []) if write_error.get("code") != DUPLICATE_KEY]
+                if rejected:
+                    self._reject([{"document": batch[write_error["index"]], "error": write_error} for write_error in rejected])
+                return len(batch) - len(rejected)
+            except PyMongoError:  # e.g. the server could not be reached in time.
+                pass
+        self._retry_at = time.monotonic() + self.spool_retry
+        return None
+
+    def _save(self, folder, content):
+        # Saves content (a list) to a new file in folder. The file is written under a temporary name and then renamed, so it is never read half written.
+        with self._condition:
+            self._spool_count += 1
+            name = f"{time.time_ns()}-{os.getpid()}-{self._spool_count}.json"
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, name)
+        with open(f"{path}.tmp", "w") as f:
+            f.write(json_util.dumps(content))
+        os.replace(f"{path}.tmp", path)
+
+    def _spool(self, batch):
+        # Saves batch to a new file in spool_dir, to be written later.
+        with self._condition:
+            self.spooled += len(batch)
+        self._save(self.spool_dir, batch)
+
+    def _reject(self, rejected):
+        # Saves the documents the database rejected, each with its error, to a new file in spool_dir/rejected. They are not written again.
+        with self._condition:
+            self.rejected += len(rejected)
+        self._save(self.rejected_dir, rejected)
+
+    def _write_spooled(self):
+        # Writes the spooled batches, oldest first, unless the database was unreachable less than spool_retry seconds ago.
+        if time.monotonic() < self._retry_at:
+            return
+        for name in sorted(name for name in os.listdir(self.spool_dir) if name.endswith(".json")):
+            path = os.path.join(self.spool_dir, name)
+            try:
+                with open(path) as f:
+                    batch = json_util.loads(f.read())
+            except (OSError, ValueError):  # e.g. removed meanwhile.
+                continue
+            written = self._write(batch)
+            if written is None:
+                return
+            self.written += written
+            os.remove(path)
@@ -0,0 +1,234 @@
+# An in-process cache of parsed isotherm files, so that each upload is read and parsed once, and then shared by every step that needs it
+# (checking the file, plotting the raw data, the SESAMI 1 and 2 calculations, and storing the data).
+# Entries are keyed by e.g. the session ID, and are re-read when the file's modification time or size changes. The least recently used
+# entries are evicted once the cache holds more than max_bytes.
+# An isotherm that was read some other way (e.g. from an AIF, see aif.py, or from the rows of the website's CSV upload, see Isotherm.from_rows) can be put in the cache along with the file written for it, so it is not parsed again.
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+def read_column(cells):
+    # Returns the numbers in cells (strings) as a float64 array, with nan for empty cells (or cells of only whitespace),
+    # or None if any other cell is not a finite number as float() reads it (e.g. "abc", "nan", or "1e999").
+    empty = np.array([not cell.strip() for cell in cells], dtype=bool)
+    try:
+        numbers = np.array(["0" if blank else cell for cell, blank in zip(cells, empty)], dtype=np.float64)
+    except ValueError:
+        return None
+    if not np.isfinite(numbers).all():
+        return None
+    numbers[empty] = np.nan
+    return numbers
+
+
+class Isotherm:
+    def __init__(self, raw):
+        """
+        This class reads an isotherm file in the format of the user's input.txt, which is:
+            - a title row, whose first two cells should be "Pressure (Pa)" and "Loading (mol/kg)" (see check),
+            - followed by rows of pressure (Pa) and loading (mol/kg), and nothing else, with the cells of each row separated by tabs.
+        Every data cell must be a finite number that float() reads (surrounding whitespace is allowed); check reports any other cell as a problem,
+        and empty cells as gaps. Rows that are empty (or whose cells are all empty) are skipped, and shorter rows have empty cells at the end.
+        The file is UTF-8, optionally starting with a byte order mark, and its lines may end with \r\n.
+        raw: The bytes of the file.
+
+        Attributes:
+        digest: sha256 hex digest of the file.
+        header: The cells of the title row.
+        n_columns: The number of columns of the data rows.
+        numeric: Whether all data cells are numbers or empty.
+        has_nan: Whether there are any empty cells, in columns that are numeric.
+        pressure, loading: Read-only float64 numpy arrays of the first two columns, if numeric. None otherwise.
+        """
+        text = raw.decode("utf-8-sig", errors="replace")  # Bytes that are not UTF-8 can not be numbers.
+        self._read(raw, [line.rstrip("\r").split("\t") for line in text.split("\n")])
+
+    def _read(self, raw, rows):
+        # Sets the attributes for the file raw, made of rows (lists of cells, the first being the title row).
+        self.raw = raw
+        self.digest = hashlib.sha256(raw).hexdigest()
+        self.header = raw.split(b"\n", 1)[0].decode("utf-8-sig", errors="replace").rstrip("\r").split("\t")
+
+        data = [row for row in rows[1:] if any(cell.strip() for cell in row)]
+        n_columns = max(map(len, data), default=0)
+        if any(len(row) < n_columns for row in data):
+            data = [list(row) + [""] * (n_columns - len(row)) for row in data]
+        columns = [read_column(cells) for cells in zip(*data)]
+
+        self.n_columns = n_columns
+        self.numeric = all(column is not None for column in columns)
+        self.has_nan = any(column is not None and np.isnan(column).any() for column in columns)
+        self.pressure = None
+        self.loading = None
+        if self.numeric and n_columns >= 2:
+            # Shared by every user of the cache entry, so nobody may change them in place.
+            columns[0].flags.writeable = False
+            columns[1].flags.writeable = False
+            self.pressure, self.loading = columns[0], columns[1]
+        self.nbytes = len(raw) + (0 if self.pressure is None else self.pressure.nbytes + self.loading.nbytes)
+
+    @classmethod
+    def from_columns(cls, header, pressure, loading):
+        """
+        from_columns returns the Isotherm of the file with the title row header (a list of strings) and the numbers in pressure and loading (float arrays),
+        without parsing it. The file (Isotherm.raw) has each number written with repr, as str(float) does.
+        """
+        pressure = np.array(pressure, dtype=np.float64)
+        loading = np.array(loading, dtype=np.float64)
+        lines = ["\t".join(header) + "\n"] + [f"{p!r}\t{q!r}\n" for p, q in zip(pressure.tolist(), loading.tolist())]
+        isotherm = cls.__new__(cls)
+        isotherm.raw = "".join(lines).encode()
+        isotherm.digest = hashlib.sha256(isotherm.raw).hexdigest()
+        isotherm.header = list(header)
+        isotherm.n_columns = 2
+        isotherm.numeric = True
+        isotherm.has_nan = bool(np.isnan(pressure).any() or np.isnan(loading).any())
+        pressure.flags.writeable = False
+        loading.flags.writeable = False
+        isotherm.pressure = pressure
+        isotherm.loading = loading
+        isotherm.nbytes = len(isotherm.raw) + pressure.nbytes + loading.nbytes
+        return isotherm
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        from_rows returns the Isotherm of the file made of rows (lists of cells, the first being the title row), as the website's CSV upload sends them.
+        The cells are checked and converted in a single pass, without writing the file and reading it again, with the same result as Isotherm(raw).
+        The file (Isotherm.raw) has the cells of each row separated by tabs, as input.txt.
+        """
+        rows = list(rows)
+        try:
+            raw = "".join("\t".join(row) + "\n" for row in rows)
+        except TypeError:  # Cells that are not strings, e.g. numbers in JSON.
+            rows = [["" if cell is None else str(cell) for cell in row] for row in rows]
+            raw = "".join("\t".join(row) + "\n" for row in rows)
+        isotherm = cls.__new__(cls)
+        isotherm._read(raw.encode(), rows)
+        return isotherm
+
+    def to_frame(self):
+        """
+        to_frame returns a new DataFrame with columns "Pressure" and "Loading".
+        """
+        return pd.DataFrame({"Pressure": self.pressure, "Loading": self.loading}, copy=True)
+
+    def lines(self):
+        """
+        lines returns the lines of the file, as open(path).readlines() would.
+        """
+        return io.TextIOWrapper(io.BytesIO(self.raw)).readlines()
+
+    def check(self):
+        """
+        check returns "All good!" if the isotherm is correctly formatted, and otherwise the problem, as a message for the user.
+        A message starting with "Warning" is not a problem: the calculations can still be run.
+        """
+        if self.n_columns != 2:  # This is a problem.
+            return "Wrong number of columns in the CSV. There should be two. Please refer to the example CSV in the Source Code."
+
+        # Every cell must be a number, or empty.
+        if not self.numeric:  # This is a problem.
+            # non numbers in this column
+            return "The CSV must contain numbers only. Please refer to the example CSV in the Source Code."
+
+        # Checking for NaN values
+        if self.has_nan:  # This is a problem.
+            return "The CSV cannot have any empty cells (gaps), since they lead to NaN values. Please refer to the example CSV in the Source Code."
+
+        # Checking to ensure the first row of the CSV reads Pressure, Loading
+        if self.header[:2] != ["Pressure (Pa)", "Loading (mol/kg)"]:  # This is a problem.
+            return "The CSV does not have the correct first row. The first entries of the two columns should be Pressure (Pa) and Loading (mol/kg), respectively. Please refer to the example CSV in the Source Code."
+
+        # The warnings do not stop the calculations, so all of them are reported together.
+        warnings = []
+
+        # Check to make sure the lowest loading divided by the highest loading is not less than 0.05
+        # If it is, the isotherm does not have enough low pressure data.
+        if self.loading[0] / self.loading[-1] >= 0.05:  # This is a warning.
+            warnings.append("Lacking data at low pressure region. The ratio of the lowest loading to the highest loading is not less than 0.05.")
+
+        # Checking that the pressures increase, as in an adsorption branch. The isotherm may otherwise be a mix of branches or runs.
+        steps = np.diff(self.pressure)
+        if (steps == 0).any():  # This is a warning.
+            warnings.append("Some pressures appear more than once in the CSV.")
+        if (steps < 0).any():  # This is a warning.
+            warnings.append("The pressures in the CSV do not always increase.")
+        if (steps <= 0).any():
+            warnings.append("Please check that it holds a single adsorption branch.")
+
+        if warnings:
+            return f"Warning: {' '.join(warnings)} You can still run calculations, though."
+
+        # If the code gets to this point, the CSV likely doesn't have any problems with it.
+        return "All good!"
+
+
+class IsothermCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        max_bytes: The memory the cached isotherms may take up, in bytes. The least recently used ones are evicted beyond it.
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (file version, Isotherm), least recently used first
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, path):
+        """
+        get returns the Isotherm for the file at path, parsing it only if it is not cached under key, or the file has changed since.
+        """
+        st = os.stat(path)
+
+        def read():
+            with open(path, "rb") as f:
+                return f.read()
+
+        return self.load(key, (st.st_mtime_ns, st.st_size), read)
+
+    def load(self, key, version, read):
+        """
+        load returns the Isotherm cached under key if it was parsed from the given version of the file (anything that changes when the file does,
+        e.g. the version of a file in a workspace, see workspace.py). Otherwise, it parses read() (the bytes of the file) and caches it.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        return self.put(key, version, Isotherm(read()))
+
+    def put(self, key, version, isotherm):
+        """
+        put caches isotherm under key, as parsed from the given version of the file. Returns isotherm.
+        """
+        with self.lock:
+            self._remove(key)
+            self.entries[key] = (version, isotherm)
+            self.nbytes += isotherm.nbytes
+            while self.nbytes > self.max_bytes and len(self.entries) > 1:  # The newest entry is kept, even if it is too large by itself.
+                self._remove(next(iter(self.entries)))
+        return isotherm
+
+    def invalidate(self, key):
+        """
+        invalidate drops the entry for key, e.g. when the file is about to be replaced.
+        """
+        with self.lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1].nbytes
@@ -0,0 +1,234 @@
+# A bounded queue of calculations, run on a pool of worker processes.
+# Each calculation runs in its own process, so matplotlib/pyplot state (which is not thread-safe) is never shared between concurrent calculations,
+# and calculations do not hold up the web server threads. Jobs are identified by a random ID, which can be polled for status and timing.
+# With a metrics Registry, the stages of each calculation are recorded in its worker process and added to the registry (see SESAMI/metrics.py).
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from SESAMI.metrics import NO_STAGE, Recording, recording
+
+
+class QueueFull(Exception):
+    # Raised by JobQueue.submit when max_pending jobs are already queued or running.
+    pass
+
+
+def _timed_call(fn, args, submitted=None):
+    # Runs in the worker process. Returns the time the calculation actually started along with its result,
+    # and the Recording of its stages if submitted (the time the job was submitted) is given, or None.
+    started = time.time()
+    if submitted is None:
+        return started, fn(*args), None
+    with recording() as stages:
+        stages.add("queue", started - submitted)
+        with stages.stage("run"):
+            result = fn(*args)
+    return started, result, stages
+
+
+class Job:
+    def __init__(self, job_id, owner, on_result=None, metrics=None, key=None):
+        self.id = job_id
+        self.owner = owner  # e.g. the session ID of the user who submitted the job.
+        self.key = key  # See JobQueue.submit
+        self.on_result = on_result  # See JobQueue.submit
+        self.metrics = metrics  # The JobQueue's metrics Registry, or None.
+        self.future = None  # Set by JobQueue.submit
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._result_lock = threading.Lock()
+        self._converted = False
+        self._result = None
+        self._error = None  # What on_result raised, if it failed.
+        self._observed = False
+
+    def status(self):
+        """
+        status returns where the job is: "queued", "running", "done", "failed", or "cancelled" (e.g. by JobQueue.shutdown before it started).
+        A job whose on_result failed has failed too.
+        """
+        if self.future.cancelled():
+            return "cancelled"
+        if self.future.done():
+            return "failed" if self.future.exception() is not None or self._error is not None else "done"
+        if self.future.running():
+            return "running"
+        return "queued"
+
+    def result(self, timeout=None):
+        """
+        result waits for the job to finish, and returns the return value of the calculation.
+        Raises the calculation's exception if it failed, concurrent.futures.TimeoutError if it is not done after timeout seconds,
+        and concurrent.futures.CancelledError if it was cancelled. If on_result failed, raises what it raised, every time.
+        """
+        _, value, stages = self.future.result(timeout=timeout)
+        if self.on_result is None:
+            return value
+        with self._result_lock:  # on_result is called once, by whichever thread gets here first, even if it fails.
+            if not self._converted:
+                try:
+                    with NO_STAGE if stages is None else stages.stage("on_result"):
+                        self._result = self.on_result(value)
+                except Exception as error:
+                    self._error = error
+                self._converted = True
+            if self._error is not None:
+                raise self._error
+            return self._result
+
+    def recording(self):
+        """
+        recording returns the metrics.Recording of the stages of the job once it is done, or None if they were not recorded (or it failed, or was cancelled).
+        """
+        if not self.future.done() or self.future.cancelled() or self.future.exception() is not None or self._error is not None:
+            return None
+        return self.future.result()[2]
+
+    def info(self):
+        """
+        info returns the status and timing of the job, as a dictionary that can be sent as JSON.
+        "queue_time" and "run_time" are in seconds. "result" is present once the job is done, and "error" if it failed or was cancelled.
+        """
+        status = self.status()
+        if status in ("done", "failed", "cancelled") and self.finished is None:  # The done callback has not run yet.
+            self._on_done(self.future)
+        info = {
+            "job_id": self.id,
+            "status": status,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "queue_time": None,
+            "run_time": None,
+        }
+        now = time.time()
+        if self.started is not None:
+            info["queue_time"] = self.started - self.submitted
+            info["run_time"] = (self.finished or now) - self.started
+        elif status == "queued":
+            info["queue_time"] = now - self.submitted
+        if status == "done":
+            try:
+                info["result"] = self.result()
+            except Exception:  # on_result failed just now.
+                info["status"] = status = "failed"
+        if status == "failed":
+            error = self.future.exception() or self._error
+            info["error"] = f"{type(error).__name__}: {error}"
+        elif status == "cancelled":
+            info["error"] = "The calculation was cancelled before it started."
+        return info
+
+    def _on_done(self, future):
+        self.finished = time.time()
+        if not future.cancelled() and future.exception() is None:
+            self.started = future.result()[0]
+            try:
+                self.result()  # Runs on_result right away, rather than when the result is first asked for.
+            except Exception:  # Kept, and raised by result.
+                pass
+        if self.metrics is not None:
+            with self._result_lock:  # Called by both the future and info; the job is only counted once.
+                observed, self._observed = self._observed, True
+            if not observed:
+                stages = self.recording()
+                if stages is None:
+                    stages = Recording(counts={"cancelled_calculations" if future.cancelled() else "failed_calculations": 1})
+                self.metrics.observe(stages)
+
+
+class JobQueue:
+    def __init__(self, max_workers=None, max_pending=None, keep_seconds=3600, initializer=None, initargs=(), metrics=None):
+        """
+        max_workers: Number of worker processes. Defaults to the number of CPUs.
+        max_pending: Largest number of jobs that can be queued or running at a time. Defaults to four per worker.
+        keep_seconds: How long the status and result of a finished job can still be polled.
+        initializer, initargs: initializer(*initargs) is called once in each worker process when it starts, e.g. to load models.
+        metrics: A metrics.Registry that the stages of each job are added to once it is done. If None, the stages are not recorded.
+        """
+        self.metrics = metrics
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.max_workers
+        self.keep_seconds = keep_seconds
+        self.jobs = {}  # job ID -> Job, in order of submission
+        self.lock = threading.Lock()
+        self.executor = None  # The process pool is started with the first job.
+
+    def _get_executor(self):
+        if self.executor is None:
+            # fork is not safe in a process that already runs threads (the web server's), so fresh worker processes are used where possible.
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context, initializer=self.initializer, initargs=self.initargs
+            )
+        return self.executor
+
+    def _forget_old_jobs(self):
+        cutoff = time.time() - self.keep_seconds
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished is not None and job.finished < cutoff]:
+            del self.jobs[job_id]
+
+    def submit(self, fn, *args, owner=None, on_result=None, key=None):
+        """
+        submit queues fn(*args) to run in a worker process. fn and args must be picklable, e.g. a module level function.
+        If on_result is given, it is called in this process with the return value of fn once it is done (e.g. to store files the calculation made),
+        and what it returns is the result of the job.
+        If key is given (e.g. a hash of the isotherm and settings), and a job of the same owner with the same key is still queued or running,
+        that job is returned instead of queuing the same calculation again (e.g. when a user retries a calculation that is taking long).
+
+        :return: The Job. Raises QueueFull if max_pending jobs are already queued or running.
+        """
+        with self.lock:
+            self._forget_old_jobs()
+            if key is not None:
+                for job in self.jobs.values():
+                    if job.key == key and job.owner == owner and not job.future.done():
+                        return job
+            n_pending = self._n_pending()
+            if n_pending >= self.max_pending:
+                raise QueueFull(f"{n_pending} calculations are already queued or running.")
+
+            job = Job(uuid.uuid4().hex, owner, on_result, self.metrics, key)
+            submitted = None if self.metrics is None else job.submitted
+            try:
+                job.future = self._get_executor().submit(_timed_call, fn, args, submitted)
+            except BrokenProcessPool:  # A worker process died (e.g. killed for using too much memory). Start a new pool.
+                self.executor = None
+                job.future = self._get_executor().submit(_timed_call, fn, args, submitted)
+            self.jobs[job.id] = job
+        job.future.add_done_callback(job._on_done)
+        return job
+
+    def _n_pending(self):
+        return sum(not job.future.done() for job in self.jobs.values())
+
+    def room(self):
+        """
+        room returns how many more jobs can be submitted right now before the queue is full.
+        """
+        with self.lock:
+            return self.max_pending - self._n_pending()
+
+    def get(self, job_id, owner=None):
+        """
+        get returns the job with ID job_id, or None if there is no such job (or it belongs to a different owner).
+        """
+        job = self.jobs.get(job_id)
+        if job is None or (owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
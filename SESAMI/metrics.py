@@ -0,0 +1,146 @@
+# Timing of the stages of a calculation (reading the isotherm, prepdata, picklen, drawing the figures, the ML model, waiting in the job queue, ...),
+# and counts of the work it does (candidate linear regions, bytes of figures), to find where a slow /run_SESAMI spends its time.
+# The calculation code marks a stage with `with stage("name"):` and counts with count("name", n). Both go to the Recording of the calculation running
+# in this process (see recording). When nothing is being recorded, which is always the case if SESAMI_METRICS is "off" (the default),
+# stage returns one shared do-nothing context manager and count returns right away, so the calculation runs as it did before.
+# Each job's Recording is sent back with its result (see SESAMI/jobs.py), and the web server adds them up in a Registry, which /metrics serves as
+# Prometheus text. SESAMI_METRICS is "off", "on" (/metrics), or "server-timing" (/metrics, and a Server-Timing header with the stages on the responses with results).
+
+import contextlib
+import os
+import threading
+import time
+
+# Upper bounds (in seconds) of the histogram buckets of the stage times.
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+NO_STAGE = contextlib.nullcontext()  # What stage returns when nothing is being recorded.
+
+_current = None  # The Recording of the calculation running in this process, if any. A worker process of the job queue runs one calculation at a time.
+_lock = threading.Lock()  # Stages and counts can be added from several threads of a process.
+
+
+def metrics_mode():
+    """
+    metrics_mode returns SESAMI_METRICS: "off" (the default), "on", or "server-timing".
+    """
+    return os.environ.get("SESAMI_METRICS", "off")
+
+
+class Recording:
+    __slots__ = ("stages", "counts")
+
+    def __init__(self, stages=None, counts=None):
+        """
+        The stage times and counts of one calculation or request.
+
+        Attributes:
+        stages: Seconds spent in each stage, by name, in the order the stages were first entered. The times of a stage entered more than once are added up.
+        counts: What was counted, by name (e.g. "candidate_windows").
+        """
+        self.stages = dict(stages or {})
+        self.counts = dict(counts or {})
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        with _lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def count(self, name, n=1):
+        with _lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def server_timing(self):
+        """
+        server_timing returns the stages as the value of a Server-Timing header, e.g. "queue;dur=1.2, prepdata;dur=3.4" (in milliseconds).
+        """
+        return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.stages.items())
+
+
+def stage(name):
+    """
+    stage returns a context manager that adds the time spent in it to the stage name of the Recording of this process, if there is one.
+    """
+    if _current is None:
+        return NO_STAGE
+    return _current.stage(name)
+
+
+def count(name, n=1):
+    """
+    count adds n to the count name of the Recording of this process, if there is one.
+    """
+    if _current is not None:
+        _current.count(name, n)
+
+
+@contextlib.contextmanager
+def recording():
+    """
+    recording records the stages and counts of the code run in it, in this process, and yields the Recording they go to.
+    """
+    global _current
+    previous, _current = _current, Recording()
+    try:
+        yield _current
+    finally:
+        _current = previous
+
+
+class Registry:
+    def __init__(self, buckets=STAGE_BUCKETS):
+        """
+        The stage times and counts of all calculations and requests so far, for /metrics.
+
+        Attributes:
+        buckets: Upper bounds (in seconds) of the histogram buckets of the stage times.
+        stages: For each stage, by name, the number of times in each bucket, followed by the sum and the number of all times.
+        counts: The total of each count, by name.
+        """
+        self.buckets = buckets
+        self.stages = {}
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def observe(self, recording):
+        # Adds the stages and counts of recording (a Recording).
+        with self.lock:
+            for name, seconds in recording.stages.items():
+                row = self.stages.setdefault(name, [0] * len(self.buckets) + [0.0, 0])
+                for i, bound in enumerate(self.buckets):
+                    if seconds <= bound:
+                        row[i] += 1
+                row[-2] += seconds
+                row[-1] += 1
+            for name, n in recording.counts.items():
+                self.counts[name] = self.counts.get(name, 0) + n
+
+    def prometheus(self):
+        """
+        prometheus returns the stage times as the histogram sesami_stage_seconds (labeled by stage), and each count as the counter sesami_[name]_total,
+        in the Prometheus text format.
+        """
+        with self.lock:
+            stages = {name: list(row) for name, row in self.stages.items()}
+            counts = dict(self.counts)
+        lines = [
+            "# HELP sesami_stage_seconds Time spent in each stage of the calculations.",
+            "# TYPE sesami_stage_seconds histogram",
+        ]
+        for name, row in stages.items():
+            for bound, n in zip(self.buckets, row):
+                lines.append(f'sesami_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {n}')
+            lines.append(f'sesami_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {row[-1]}')
+            lines.append(f'sesami_stage_seconds_sum{{stage="{name}"}} {row[-2]!r}')
+            lines.append(f'sesami_stage_seconds_count{{stage="{name}"}} {row[-1]}')
+        for name, n in counts.items():
+            lines.append(f"# TYPE sesami_{name}_total counter")
+            lines.append(f"sesami_{name}_total {n}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,155 @@
+# Profiles of slow calculations, to find and reproduce the isotherms (long, noisy, or with many candidate regions in picklen) that take much longer than others.
+# Every calculation is profiled while it runs in its worker process, and the profile is only saved if the calculation took longer than a threshold.
+# Along with the profile, the isotherm's digest, the calculation settings, and the isotherm itself are saved, so the calculation can be run again.
+# Only the most recent profiles are kept.
+# The default "sample" profiler is statistical: a thread looks at the calculation's call stack every few milliseconds, which costs the calculation little,
+# and the stacks are saved in the "folded" format that flamegraph.pl and speedscope draw as flame graphs. "cprofile" saves a cProfile (pstats) file instead,
+# which counts every call, but slows down the calculation.
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class Sampler:
+    def __init__(self, interval=0.005):
+        """
+        This class samples the call stack of the thread that starts it, every interval seconds, from a thread of its own.
+
+        Attributes:
+        stacks: The number of times each stack was seen, as "outermost;...;innermost", with each frame as "function (file:line)".
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="sesami-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self):
+        """
+        folded returns the stacks in the folded format of flamegraph.pl: one line per stack, followed by the number of samples.
+        """
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+class Profiler:
+    def __init__(self, folder, threshold=10.0, method="sample", keep=50, interval=0.005):
+        """
+        This class runs calculations under a profiler, and saves the profiles of the slow ones in folder. It is sent to the worker processes with each calculation.
+        folder: Where the profiles are saved.
+        threshold: The profile of a calculation is saved if it took longer than this many seconds.
+        method: "sample" (see Sampler) or "cprofile".
+        keep: How many profiles to keep. The oldest are removed.
+        interval: Seconds between samples, for "sample".
+        """
+        if method not in ("sample", "cprofile"):
+            raise ValueError(f"Unknown profiler {method!r}. Use 'sample' or 'cprofile'.")
+        self.folder = folder
+        self.threshold = threshold
+        self.method = method
+        self.keep = keep
+        self.interval = interval
+
+    def call(self, info, isotherm, fn, *args):
+        """
+        call returns fn(*args), and saves its profile if it took longer than threshold seconds (also if it failed).
+        info: What is saved about the calculation along with the profile (a dictionary that can be written as JSON), e.g. the isotherm digest and settings.
+        isotherm: The isotherm file (bytes), saved along with the profile so the calculation can be run again. Can be None.
+        """
+        if self.method == "sample":
+            profile = Sampler(self.interval)
+            profile.start()
+        else:
+            profile = cProfile.Profile()
+            profile.enable()
+        started = time.perf_counter()
+        error = None
+        try:
+            return fn(*args)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            if self.method == "sample":
+                profile.stop()
+            else:
+                profile.disable()
+            if seconds > self.threshold:
+                try:
+                    self.save({**info, "seconds": seconds, "error": error}, isotherm, profile)
+                except OSError:  # e.g. the disk is full. The calculation's result matters more than its profile.
+                    pass
+
+    def save(self, info, isotherm, profile):
+        # Saves [time]_[isotherm digest].json (info), .txt (the isotherm), and .folded or .prof (the profile), and removes the oldest profiles beyond keep.
+        os.makedirs(self.folder, exist_ok=True)
+        now = time.time()
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.{int(now % 1 * 1e6):06d}"  # Sorts from oldest to newest.
+        name = os.path.join(self.folder, f"{stamp}_{str(info.get('isotherm', 'unknown'))[:16]}")
+        if self.method == "sample":
+            with open(f"{name}.folded", "w") as f:
+                f.write(profile.folded())
+        else:
+            profile.dump_stats(f"{name}.prof")
+        if isotherm is not None:
+            with open(f"{name}.txt", "wb") as f:
+                f.write(isotherm)
+        with open(f"{name}.json", "w") as f:  # Written last, since it marks a complete profile.
+            json.dump({**info, "profiler": self.method}, f, indent=1, default=str)
+        self.prune()
+
+    def profiles(self):
+        """
+        profiles returns the paths of the saved profiles' .json files, from oldest to newest.
+        """
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.folder, name) for name in sorted(names) if name.endswith(".json")]
+
+    def prune(self):
+        profiles = self.profiles()
+        for path in profiles[: max(len(profiles) - self.keep, 0)]:
+            stem = path[: -len(".json")]
+            for extension in (".json", ".txt", ".folded", ".prof"):
+                try:
+                    os.remove(stem + extension)
+                except FileNotFoundError:
+                    pass
+
+
+def make_profiler(setting, folder, keep=50):
+    """
+    make_profiler returns the Profiler for setting, or None if setting is "off".
+    setting is "off", "sample", or "cprofile", optionally followed by ":SECONDS", the threshold (default 10), e.g. "sample:5".
+    """
+    method, _, threshold = setting.partition(":")
+    if method == "off":
+        return None
+    return Profiler(folder, threshold=float(threshold or 10), method=method, keep=keep)
@@ -0,0 +1,193 @@
+# A cache of calculation results, so that running the same isotherm with the same settings again (e.g. after only changing the plot
+# settings, or re-uploading the same file) skips the BET, BET+ESW, and ML calculations.
+# Results are keyed on a hash of the isotherm's numbers (not of the file, so a CSV and a tab separated file with the same data share results)
+# and of the settings the calculation depends on. Plot settings (dpi, fonts, legend) are not part of the key, so changing them only re-renders.
+# The results are stored through a backend: MemoryBackend keeps them in this process, SQLiteBackend in a file that several processes can share.
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from SESAMI.metrics import count
+
+# The settings the SESAMI 1 results depend on. The custom adsorbate settings only count when a custom adsorbate is selected.
+COMPUTE_OPTIONS = ("gas", "custom adsorbate", "R2 cutoff", "R2 min", "scope")
+CUSTOM_OPTIONS = ("custom cross section", "custom temperature", "custom saturation pressure")
+FLOAT_OPTIONS = ("R2 cutoff", "R2 min") + CUSTOM_OPTIONS
+
+# The settings the figures depend on, on top of the SESAMI 1 results.
+PLOT_OPTIONS = ("dpi", "font size", "font type", "legend")
+
+
+def isotherm_digest(data):
+    """
+    isotherm_digest returns a sha256 hex digest of the numbers of an isotherm (a DataFrame with columns "Pressure" and "Loading").
+    """
+    h = hashlib.sha256()
+    for column in ("Pressure", "Loading"):
+        values = np.ascontiguousarray(data[column].to_numpy(), dtype=np.float64)  # int and float columns with the same numbers hash the same.
+        h.update(column.encode())
+        h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def canonical_options(user_options, keys):
+    """
+    canonical_options returns the settings in user_options that are in keys, in a form that does not depend on how they were entered
+    (e.g. R2 cutoff "0.9995" and 0.9995 are the same).
+    """
+    keys = list(keys)
+    if "custom adsorbate" in keys and user_options.get("custom adsorbate") == "Yes":
+        keys += CUSTOM_OPTIONS
+    options = {}
+    for key in keys:
+        value = user_options.get(key)
+        if value is not None and key in FLOAT_OPTIONS + ("dpi",):
+            value = float(value)
+        elif value is not None and key == "font size":
+            value = int(value)
+        options[key] = value
+    if options.get("custom adsorbate") == "Yes":
+        options.pop("gas", None)  # The gas selection is ignored for a custom adsorbate.
+    return options
+
+
+def result_key(kind, digest, options, version=None):
+    """
+    result_key returns the cache key of a result.
+    kind: What the result is, e.g. "SESAMI 1". Results of different kinds never share a key.
+    digest: The isotherm_digest of the isotherm.
+    options: The canonical_options the result depends on.
+    version: Anything else the result depends on, e.g. the version of the ML model. Must be JSON serializable.
+    """
+    description = json.dumps([kind, digest, options, version], sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class MemoryBackend:
+    def __init__(self, max_entries=256):
+        """
+        Keeps results in this process. The least recently used ones are evicted beyond max_entries.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SQLiteBackend:
+    def __init__(self, path, max_entries=10000):
+        """
+        Keeps results in the SQLite database at path, which is shared by every process that uses it (e.g. the workers of the job queue).
+        The least recently used results are deleted beyond max_entries.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, used REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+
+    def _connect(self):
+        # A connection per call, so the backend can be used from any thread. Waits up to 30 s for other processes to finish writing.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        connection = self._connect()
+        try:
+            with connection:
+                row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    connection.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        finally:
+            connection.close()
+        return None if row is None else row[0]
+
+    def set(self, key, value):
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, value, time.time()))
+                connection.execute(
+                    "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY used DESC LIMIT ?)", (self.max_entries,)
+                )
+        finally:
+            connection.close()
+
+    def __len__(self):
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        finally:
+            connection.close()
+
+
+class ResultCache:
+    def __init__(self, backend=None):
+        """
+        backend: Where the results are stored, e.g. MemoryBackend() (the default) or SQLiteBackend(path). Results are pickled before they are stored,
+        so every result read from the cache is a new copy, and can be changed by the caller.
+
+        Attributes:
+        hits, misses: How many times get found and did not find a result, in this process. They are also counted as result_cache_hits and
+        result_cache_misses in the metrics of the calculation (see SESAMI/metrics.py), which the web server adds up for /metrics.
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        get returns the result stored under key, or None.
+        """
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            count("result_cache_misses")
+            return None
+        self.hits += 1
+        count("result_cache_hits")
+        return pickle.loads(value)
+
+    def set(self, key, result):
+        self.backend.set(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def make_result_cache(setting):
+    """
+    make_result_cache returns the ResultCache described by setting (e.g. the SESAMI_RESULT_CACHE environment variable):
+    "memory" (or an empty setting) for a MemoryBackend, "sqlite:PATH" for a SQLiteBackend at PATH, or "off" for no cache (None).
+    """
+    setting = (setting or "memory").strip()
+    if setting == "off":
+        return None
+    if setting == "memory":
+        return ResultCache(MemoryBackend())
+    if setting.startswith("sqlite:"):
+        path = setting[len("sqlite:"):]
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        return ResultCache(SQLiteBackend(path))
+    raise ValueError(f"Unknown result cache setting {setting!r}. Use 'memory', 'sqlite:PATH', or 'off'.")
@@ -0,0 +1,110 @@
+# The folders of the users' sessions (user_[ID], with the uploaded isotherm and the figures), and their removal once they are no longer used.
+# All session folders are in one root folder. The time each session was last used is kept in memory, along with a heap of the sessions by expiry time,
+# so that starting a session or using it is O(1), and finding the expired sessions does not list any folders.
+# A background thread (the janitor) removes the expired folders, at most batch_size per pass, so requests never wait for folders to be deleted.
+# When the app starts, the janitor first adds the folders already in the root (e.g. from before a restart), with their modification time as last use.
+
+import heapq
+import os
+import shutil
+import threading
+import time
+
+PREFIX = "user_"  # The session folders are named f"{PREFIX}{ID}".
+
+
+class SessionStore:
+    def __init__(self, root, max_age=7200, interval=60.0, batch_size=100, on_expire=None):
+        """
+        root: Folder for the session folders. Created if needed. Nothing else should be kept in it.
+        max_age: Seconds after their last use after which sessions are removed (7200 s is two hours).
+        interval: Seconds between passes of the janitor.
+        batch_size: Largest number of folders removed per pass. The next pass follows right away if more sessions have expired.
+        on_expire: Called with the ID of each session that is removed, e.g. to drop it from a cache.
+
+        Attributes:
+        removed: Number of session folders removed so far.
+        """
+        self.root = root
+        self.max_age = max_age
+        self.interval = interval
+        self.batch_size = batch_size
+        self.on_expire = on_expire
+        self.removed = 0
+        os.makedirs(root, exist_ok=True)
+
+        self._last_used = {}  # Session ID: time.time() of its last use.
+        self._heap = []  # (expiry, ID), one entry per session. An entry may be older than the last use; it is then pushed back when it comes up.
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sesami-sessions", daemon=True)
+        self._thread.start()
+
+    def path(self, session_id, filename=""):
+        """
+        path returns the path of filename in the folder of the session, without checking that the folder exists.
+        """
+        return os.path.join(self.root, f"{PREFIX}{session_id}", filename)
+
+    def create(self, session_id):
+        """
+        create makes the folder of a new session, and returns its path.
+        """
+        folder = self.path(session_id)
+        os.makedirs(folder, exist_ok=True)
+        self.touch(session_id)
+        return folder
+
+    def touch(self, session_id, when=None):
+        """
+        touch records that the session was used at when (default: now), so that it is kept for another max_age seconds.
+        """
+        when = time.time() if when is None else when
+        with self._lock:
+            if session_id not in self._last_used:
+                heapq.heappush(self._heap, (when + self.max_age, session_id))
+            if when > self._last_used.get(session_id, 0):
+                self._last_used[session_id] = when
+
+    def expire(self, now=None):
+        """
+        expire removes the folders of up to batch_size sessions that were last used more than max_age seconds before now (default: now).
+        Returns the number of folders removed.
+        """
+        now = time.time() if now is None else now
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now and len(expired) < self.batch_size:
+                _, session_id = heapq.heappop(self._heap)
+                expiry = self._last_used[session_id] + self.max_age
+                if expiry > now:  # Used since the entry was pushed.
+                    heapq.heappush(self._heap, (expiry, session_id))
+                else:
+                    del self._last_used[session_id]
+                    expired.append(session_id)
+        for session_id in expired:
+            shutil.rmtree(self.path(session_id), ignore_errors=True)
+            if self.on_expire is not None:
+                self.on_expire(session_id)
+        self.removed += len(expired)
+        return len(expired)
+
+    def close(self):
+        """
+        close stops the janitor. The session folders are kept.
+        """
+        self._stop.set()
+        self._thread.join()
+
+    def _index_existing(self):
+        # Adds the session folders already in root, with their modification time as their last use.
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.name.startswith(PREFIX) and entry.is_dir(follow_symlinks=False):
+                    self.touch(entry.name[len(PREFIX):], when=entry.stat(follow_symlinks=False).st_mtime)
+
+    def _run(self):
+        self._index_existing()
+        while not self._stop.is_set():
+            if self.expire() < self.batch_size:
+                self._stop.wait(self.interval)
@@ -0,0 +1,259 @@
+# Several isotherms uploaded at once (a ZIP of isotherm files, or several files), analyzed in parallel on the job queue without making any plots.
+# read_upload reads the uploaded files into UploadItems, checking each isotherm as check_csv does for a single one. An UploadRun then submits the
+# analysis of each item to the job queue (see SESAMI/jobs.py) from a thread of its own, at most `parallel` at a time, so that a large upload does not
+# fill the queue and turn away other users. Its progress can be polled item by item, and its results are a table with the columns of the batch analysis (see batch.py).
+# The plots of an item are only made when they are asked for, by running the website's calculation on its isotherm.
+
+import csv
+import io
+import os
+import threading
+import time
+import uuid
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from SESAMI.aif import AIFError, read_aif
+from SESAMI.batch import COLUMNS
+from SESAMI.isotherm_cache import Isotherm
+from SESAMI.jobs import QueueFull
+
+# Isotherm files: the website CSV format (comma separated), the same tab separated (as input.txt), and AIF.
+UPLOAD_EXTENSIONS = (".csv", ".txt", ".aif")
+MAX_ITEMS = 200  # Isotherms per upload
+MAX_ITEM_BYTES = 2 * 1024 * 1024  # Size of each isotherm file, also when unzipped
+
+
+class UploadError(ValueError):
+    # Raised by read_upload when the upload as a whole can not be used. The message is meant for the user.
+    pass
+
+
+class UploadItem:
+    __slots__ = ("name", "isotherm", "message", "job")
+
+    def __init__(self, name, isotherm=None, message="All good!"):
+        """
+        One isotherm of an upload.
+        name: The name of the file, without its extension (and with its folder, if it is in a ZIP).
+        isotherm: The Isotherm, or None if the file could not be read.
+        message: As from Isotherm.check: "All good!", a warning (starting with "Warning"), or why the isotherm can not be analyzed.
+        job: The Job analyzing the isotherm, once it is submitted.
+        """
+        self.name = name
+        self.isotherm = isotherm
+        self.message = message
+        self.job = None
+
+    @property
+    def valid(self):
+        return self.isotherm is not None and (self.message == "All good!" or self.message.startswith("Warning"))
+
+    def status(self):
+        """
+        status returns "invalid" if the isotherm can not be analyzed, "waiting" if it is not submitted yet, and otherwise the status of its Job.
+        """
+        if not self.valid:
+            return "invalid"
+        if self.job is None:
+            return "waiting"
+        return self.job.status()
+
+    def row(self):
+        """
+        row returns the item's row of the summary table (see batch.COLUMNS). Until the item is analyzed, the "status" is its status() (or its message, if it is invalid).
+        """
+        status = self.status()
+        if status == "done":
+            return {**self.job.result(), "name": self.name}
+        row = dict.fromkeys(COLUMNS)
+        row["name"] = self.name
+        if status == "invalid":
+            row["status"] = self.message
+        elif status == "failed":
+            row["status"] = f"Error: {self.job.info()['error']}"
+        else:
+            row["status"] = status
+        return row
+
+
+def read_item(filename, content):
+    """
+    read_item reads one isotherm file (bytes) into an UploadItem. It is read by the extension of filename (see UPLOAD_EXTENSIONS).
+    """
+    name, extension = os.path.splitext(filename)
+    extension = extension.lower()
+    if extension not in UPLOAD_EXTENSIONS:
+        return UploadItem(name, message=f"Unsupported file type. Supported files are {list(UPLOAD_EXTENSIONS)}.")
+    if len(content) > MAX_ITEM_BYTES:
+        return UploadItem(name, message=f"The file is larger than {MAX_ITEM_BYTES // (1024 * 1024)} MiB.")
+    try:
+        text = content.decode("utf-8-sig")  # utf-8-sig, since CSVs saved by Excel start with a byte order mark.
+    except UnicodeDecodeError:
+        return UploadItem(name, message="The file is not a text file.")
+
+    if extension == ".aif":
+        try:
+            pressure, loading = read_aif(io.StringIO(text, newline=None)).isotherm()  # In Pa and mol/kg.
+        except AIFError as error:
+            return UploadItem(name, message=str(error))
+        isotherm = Isotherm.from_columns(["Pressure (Pa)", "Loading (mol/kg)"], pressure, loading)  # The title row of the website CSV, which Isotherm.check expects.
+    else:
+        # Converted to the format of input.txt, and checked, as save_csv_txt does.
+        rows = csv.reader(io.StringIO(text, newline=None), delimiter="," if extension == ".csv" else "\t")
+        try:
+            isotherm = Isotherm.from_rows(rows)
+        except csv.Error:  # e.g. a field larger than the csv module allows.
+            return UploadItem(name, message="The file could not be read. Please refer to the example CSV in the Source Code.")
+    return UploadItem(name, isotherm, isotherm.check())
+
+
+def read_upload(files):
+    """
+    read_upload reads the isotherms in files, a list of (filename, bytes) tuples. A file ending in .zip holds isotherm files; its folders and
+    hidden files (e.g. those macOS adds) are skipped. Returns a list of UploadItems.
+    Raises UploadError if there are no isotherms, more than MAX_ITEMS, or a ZIP can not be read.
+    """
+    items = []
+    for filename, content in files:
+        if not filename.lower().endswith(".zip"):
+            items.append(read_item(os.path.basename(filename), content))
+            continue
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or any(part.startswith((".", "__MACOSX")) for part in info.filename.split("/")):
+                        continue
+                    if len(items) > MAX_ITEMS:
+                        break
+                    if info.file_size > MAX_ITEM_BYTES:  # Not unzipped at all, so a small ZIP can not fill up the memory.
+                        items.append(UploadItem(os.path.splitext(info.filename)[0], message=f"The file is larger than {MAX_ITEM_BYTES // (1024 * 1024)} MiB."))
+                        continue
+                    with archive.open(info) as f:
+                        items.append(read_item(info.filename, f.read(MAX_ITEM_BYTES + 1)))
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, zlib.error, NotImplementedError, RuntimeError):  # e.g. damaged, encrypted, or an unsupported compression.
+            raise UploadError(f"{os.path.basename(filename)} could not be read as a ZIP file.")
+    if not items:
+        raise UploadError("No isotherms were uploaded.")
+    if len(items) > MAX_ITEMS:
+        raise UploadError(f"At most {MAX_ITEMS} isotherms can be uploaded at once.")
+    return items
+
+
+class UploadRun:
+    def __init__(self, items, submit, parallel=1, owner=None):
+        """
+        This class analyzes the valid items of an upload, by submitting them to the job queue from a thread of its own, as room frees up.
+        items: The UploadItems.
+        submit: submit(item) submits the analysis of item, and returns its Job (see JobQueue.submit). It can raise QueueFull, in which case it is tried again later.
+        parallel: The largest number of items that are queued or running at a time.
+        owner: e.g. the session ID of the user who uploaded the isotherms.
+
+        Attributes:
+        id: A random ID, by which the run can be polled.
+        created, finished: When the run was started, and when its last item was done (None until then).
+        """
+        self.id = uuid.uuid4().hex
+        self.items = items
+        self.submit = submit
+        self.parallel = max(parallel, 1)
+        self.owner = owner
+        self.created = time.time()
+        self.finished = None
+        self._thread = threading.Thread(target=self._run, name="sesami-upload", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        waiting = [item for item in self.items if item.valid]
+        running = []
+        while waiting or running:
+            while waiting and len(running) < self.parallel:
+                item = waiting[0]
+                try:
+                    item.job = self.submit(item)
+                except QueueFull:
+                    break
+                except Exception as e:  # The item can not be analyzed, but the others can.
+                    item.message = f"Error: {type(e).__name__}: {e}"
+                    item.isotherm = None
+                else:
+                    running.append(item.job)
+                waiting.pop(0)
+            if running:
+                wait([job.future for job in running], timeout=1, return_when=FIRST_COMPLETED)
+                running = [job for job in running if not job.future.done()]
+            elif waiting:
+                time.sleep(0.5)  # The queue is full of other calculations.
+        self.finished = time.time()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def info(self):
+        """
+        info returns the progress of the run, as a dictionary that can be sent as JSON: the number of items, how many are finished
+        (analyzed, failed, cancelled, or invalid), and for each item its name, status, message, and once it is analyzed, its row of the summary table.
+        """
+        items = []
+        for index, item in enumerate(self.items):
+            status = item.status()
+            entry = {"index": index, "name": item.name, "status": status, "message": item.message}
+            if status == "done":
+                entry["results"] = item.row()
+            elif status == "failed":
+                entry["message"] = item.row()["status"]
+            items.append(entry)
+        return {
+            "upload_id": self.id,
+            "n_items": len(items),
+            "n_finished": sum(entry["status"] in ("done", "failed", "cancelled", "invalid") for entry in items),
+            "finished": self.finished is not None,
+            "created": self.created,
+            "items": items,
+        }
+
+    def summary_csv(self):
+        """
+        summary_csv returns the summary table (one row per item, with the columns of batch.COLUMNS) as CSV text.
+        """
+        table = io.StringIO(newline="")
+        writer = csv.DictWriter(table, fieldnames=COLUMNS)
+        writer.writeheader()
+        for item in self.items:
+            writer.writerow(item.row())
+        return table.getvalue()
+
+
+class UploadRuns:
+    def __init__(self, keep_seconds=3600):
+        """
+        The upload runs of all users, by ID. At most one run per owner is unfinished at a time.
+        keep_seconds: How long the progress and results of a finished run can still be polled.
+        """
+        self.keep_seconds = keep_seconds
+        self.runs = {}  # run ID -> UploadRun, in order of creation
+        self.lock = threading.Lock()
+
+    def start(self, items, submit, parallel=1, owner=None):
+        """
+        start starts an UploadRun of items (see UploadRun), and returns it. Raises QueueFull if the owner already has a run that is not finished.
+        """
+        with self.lock:
+            cutoff = time.time() - self.keep_seconds
+            for run_id in [run_id for run_id, run in self.runs.items() if run.finished is not None and run.finished < cutoff]:
+                del self.runs[run_id]
+            if owner is not None and any(run.owner == owner and run.finished is None for run in self.runs.values()):
+                raise QueueFull("An upload of this user is still being analyzed.")
+            run = UploadRun(items, submit, parallel=parallel, owner=owner)
+            self.runs[run.id] = run
+        return run
+
+    def get(self, run_id, owner=None):
+        """
+        get returns the run with ID run_id, or None if there is no such run (or it belongs to a different owner).
+        """
+        run = self.runs.get(run_id)
+        if run is None or (owner is not None and run.owner != owner):
+            return None
+        return run
@@ -0,0 +1,452 @@
+# Where the files of each session are kept: the uploaded isotherm (input.aif, input.txt) and the figures.
+# A workspace gives out the files of one session as an object with read, write, exists, version, names, and copy, so the website, the calculations,
+# and the figures (see SESAMI_1/figures.py) do not depend on where the files are. The workspaces are:
+# DiskWorkspace: a folder per session on disk (see sessions.py). The calculations in the worker processes of the job queue write to it directly.
+# MemoryWorkspace: the files are kept in this process, up to max_bytes, so nothing goes through the file system. Only one web server process can use it.
+#     The calculations run in other processes, so they write their figures to a FileBatch, which is stored in the workspace once the calculation is done.
+# SQLiteWorkspace: the files are kept in a SQLite file, which every process can use (e.g. several gunicorn workers, and the job queue's workers).
+# The sessions of the memory and SQLite workspaces expire max_age seconds after their last use, like the session folders on disk.
+
+import io
+import itertools
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from SESAMI.sessions import SessionStore
+
+
+def valid_name(name):
+    """
+    valid_name returns whether name can be the name of a file of a session: a file name without any folders.
+    """
+    return isinstance(name, str) and name not in ("", ".", "..") and os.path.basename(name) == name and "/" not in name and "\\" not in name
+
+
+def as_files(files):
+    """
+    as_files returns files if it is already the files of a session, or FolderFiles(files) if it is the path of a folder.
+    """
+    return FolderFiles(files) if isinstance(files, (str, os.PathLike)) else files
+
+
+def open_file(files, name):
+    """
+    open_file returns the file name of files (the files of a session) as a binary file object. Raises FileNotFoundError if there is no such file.
+    """
+    data = files.read(name)
+    if data is None:
+        raise FileNotFoundError(name)
+    return io.BytesIO(data)
+
+
+class FolderFiles:
+    def __init__(self, folder):
+        """
+        The files of a session in a folder on disk. Files are written to a temporary name first and then renamed, so they are never read half written.
+        """
+        self.folder = os.fspath(folder)
+
+    def path(self, name):
+        if not valid_name(name):
+            raise ValueError(f"Invalid file name {name!r}.")
+        return os.path.join(self.folder, name)
+
+    def read(self, name):
+        """
+        read returns the contents of the file name as bytes, or None if there is no such file.
+        """
+        try:
+            with open(self.path(name), "rb") as f:
+                return f.read()
+        except (OSError, ValueError):
+            return None
+
+    def write(self, name, data):
+        """
+        write saves data (bytes) as the file name, replacing it if it exists.
+        """
+        path = self.path(name)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+
+    def version(self, name):
+        """
+        version returns something that changes whenever the file name is written, or None if there is no such file.
+        """
+        try:
+            st = os.stat(self.path(name))
+        except (OSError, ValueError):
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def exists(self, name):
+        return self.version(name) is not None
+
+    def names(self):
+        try:
+            return [name for name in os.listdir(self.folder) if not name.endswith(".tmp")]
+        except OSError:
+            return []
+
+    def copy(self, source, destination):
+        """
+        copy saves the contents of the file source as the file destination as well.
+        """
+        path = self.path(destination)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(self.path(source), temporary)
+        os.replace(temporary, path)
+
+
+class FileBatch:
+    def __init__(self, names=(), contents=None):
+        """
+        Files written by a calculation in a worker process, for a workspace the worker can not write to (MemoryWorkspace).
+        Writes and copies are recorded, and apply then makes them in the workspace. FileBatch.of makes one from the files of a session.
+        A calculation saves its figures one after another, in the worker process that runs it, so a FileBatch is only used by one thread at a time.
+        names: The names of the files the session has.
+        contents: The contents of the files the calculation reads, by name.
+        """
+        self.existing = set(names)
+        self.contents = dict(contents or {})
+        self.changes = []  # ("write", name, data) and ("copy", source, destination), in order.
+
+    @classmethod
+    def of(cls, files, read=()):
+        """
+        of returns a FileBatch for files, with the contents of the files in read.
+        """
+        return cls(files.names(), {name: files.read(name) for name in read if files.exists(name)})
+
+    def read(self, name):
+        return self.contents.get(name)
+
+    def write(self, name, data):
+        if not valid_name(name):
+            raise ValueError(f"Invalid file name {name!r}.")
+        self.contents[name] = data
+        self.existing.add(name)
+        self.changes.append(("write", name, data))
+
+    def version(self, name):
+        return name if name in self.existing else None
+
+    def exists(self, name):
+        return name in self.existing
+
+    def names(self):
+        return list(self.existing)
+
+    def copy(self, source, destination):
+        if source in self.contents:
+            self.contents[destination] = self.contents[source]
+        self.existing.add(destination)
+        self.changes.append(("copy", source, destination))
+
+    def apply(self, files):
+        """
+        apply makes the writes and copies of the batch in files, in the order they were made.
+        """
+        for change, name, data in self.changes:
+            if change == "write":
+                files.write(name, data)
+            else:
+                files.copy(name, data)
+
+
+class DiskWorkspace:
+    shared = True  # The worker processes of the job queue can write to it.
+
+    def __init__(self, root, max_age=7200, on_expire=None):
+        """
+        A folder per session in root, removed max_age seconds after its last use. See sessions.SessionStore.
+        """
+        self.sessions = SessionStore(root, max_age=max_age, on_expire=on_expire)
+
+    def create(self, session_id):
+        """
+        create starts a new session, and returns its files.
+        """
+        return FolderFiles(self.sessions.create(session_id))
+
+    def files(self, session_id):
+        """
+        files returns the files of a session, and notes that it was used.
+        """
+        self.sessions.touch(session_id)
+        folder = self.sessions.path(session_id)
+        os.makedirs(folder, exist_ok=True)
+        return FolderFiles(folder)
+
+    def close(self):
+        self.sessions.close()
+
+
+class MemoryFiles:
+    def __init__(self, workspace, session_id):
+        # The files of a session in a MemoryWorkspace.
+        self.workspace = workspace
+        self.session_id = session_id
+
+    def read(self, name):
+        entry = self.workspace._get(self.session_id, name)
+        return None if entry is None else entry[1]
+
+    def write(self, name, data):
+        if not valid_name(name):
+            raise ValueError(f"Invalid file name {name!r}.")
+        self.workspace._set(self.session_id, name, bytes(data))
+
+    def version(self, name):
+        entry = self.workspace._get(self.session_id, name)
+        return None if entry is None else entry[0]
+
+    def exists(self, name):
+        return self.version(name) is not None
+
+    def names(self):
+        return self.workspace._names(self.session_id)
+
+    def copy(self, source, destination):
+        data = self.read(source)
+        if data is None:
+            raise FileNotFoundError(source)
+        self.write(destination, data)  # The bytes are shared, not copied.
+
+
+class MemoryWorkspace:
+    shared = False  # Only this process can use it. Calculations in other processes write to a FileBatch.
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, max_age=7200, batch_size=100, on_expire=None):
+        """
+        Keeps the files of the sessions in this process. Beyond max_bytes, the least recently used sessions are dropped.
+        Sessions not used for max_age seconds are dropped as well, at most batch_size whenever a session is created.
+        on_expire is called with the ID of each session that is dropped.
+
+        Attributes:
+        nbytes: The size of the files kept, in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.batch_size = batch_size
+        self.on_expire = on_expire
+        self.sessions = OrderedDict()  # session ID -> {name: (version, data)}, least recently used first
+        self.used = {}  # session ID -> time.time() of its last use
+        self.nbytes = 0
+        self.lock = threading.Lock()
+        self._versions = itertools.count(1)
+
+    def create(self, session_id):
+        self.expire()
+        return self.files(session_id)
+
+    def files(self, session_id):
+        with self.lock:
+            self.sessions.setdefault(session_id, {})
+            self.sessions.move_to_end(session_id)
+            self.used[session_id] = time.time()
+        return MemoryFiles(self, session_id)
+
+    def expire(self, now=None):
+        """
+        expire drops up to batch_size sessions that were last used more than max_age seconds before now (default: now). Returns how many were dropped.
+        """
+        now = time.time() if now is None else now
+        expired = []
+        with self.lock:
+            for session_id in self.sessions:  # Least recently used first, so the expired ones are at the start.
+                if len(expired) >= self.batch_size or self.used[session_id] > now - self.max_age:
+                    break
+                expired.append(session_id)
+            for session_id in expired:
+                self._drop(session_id)
+        self._expired(expired)
+        return len(expired)
+
+    def close(self):
+        pass
+
+    def _drop(self, session_id):
+        files = self.sessions.pop(session_id, {})
+        self.used.pop(session_id, None)
+        self.nbytes -= sum(len(data) for _, data in files.values())
+
+    def _expired(self, session_ids):
+        if self.on_expire is not None:
+            for session_id in session_ids:
+                self.on_expire(session_id)
+
+    def _get(self, session_id, name):
+        with self.lock:
+            return self.sessions.get(session_id, {}).get(name)
+
+    def _names(self, session_id):
+        with self.lock:
+            return list(self.sessions.get(session_id, {}))
+
+    def _set(self, session_id, name, data):
+        evicted = []
+        with self.lock:
+            files = self.sessions.setdefault(session_id, {})
+            self.used.setdefault(session_id, time.time())
+            old = files.get(name)
+            if old is not None:
+                self.nbytes -= len(old[1])
+            files[name] = (next(self._versions), data)
+            self.nbytes += len(data)
+            for other in list(self.sessions):
+                if self.nbytes <= self.max_bytes:
+                    break
+                if other != session_id:  # The session being written to is kept, even if it is too large by itself.
+                    self._drop(other)
+                    evicted.append(other)
+        self._expired(evicted)
+
+
+class SQLiteFiles:
+    def __init__(self, workspace, session_id):
+        # The files of a session in a SQLiteWorkspace. Can be sent to other processes, e.g. the workers of the job queue.
+        self.workspace = workspace
+        self.session_id = session_id
+
+    def read(self, name):
+        row = self.workspace._query("SELECT data FROM files WHERE session = ? AND name = ?", (self.session_id, name))
+        return None if row is None else bytes(row[0])
+
+    def write(self, name, data):
+        if not valid_name(name):
+            raise ValueError(f"Invalid file name {name!r}.")
+        self.workspace._execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (self.session_id, name, sqlite3.Binary(data), time.time_ns())
+        )
+
+    def version(self, name):
+        row = self.workspace._query("SELECT version, length(data) FROM files WHERE session = ? AND name = ?", (self.session_id, name))
+        return None if row is None else tuple(row)
+
+    def exists(self, name):
+        return self.version(name) is not None
+
+    def names(self):
+        return [row[0] for row in self.workspace._query("SELECT name FROM files WHERE session = ?", (self.session_id,), fetch="all")]
+
+    def copy(self, source, destination):
+        if not valid_name(destination):
+            raise ValueError(f"Invalid file name {destination!r}.")
+        copied = self.workspace._execute(
+            "INSERT OR REPLACE INTO files SELECT session, ?, data, ? FROM files WHERE session = ? AND name = ?",
+            (destination, time.time_ns(), self.session_id, source),
+        )
+        if not copied:
+            raise FileNotFoundError(source)
+
+
+class SQLiteWorkspace:
+    shared = True  # Every process can open the SQLite file.
+
+    def __init__(self, path, max_age=7200, batch_size=100, on_expire=None):
+        """
+        Keeps the files of the sessions in the SQLite database at path. Sessions not used for max_age seconds are deleted,
+        at most batch_size whenever a session is created. on_expire is called with the ID of each session that is deleted, in the process that deletes it.
+        """
+        self.path = path
+        self.max_age = max_age
+        self.batch_size = batch_size
+        self.on_expire = on_expire
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("PRAGMA journal_mode=WAL")  # Readers do not wait for writers.
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS files (session TEXT NOT NULL, name TEXT NOT NULL, data BLOB NOT NULL, version INTEGER NOT NULL, "
+                    "PRIMARY KEY (session, name))"
+                )
+                connection.execute("CREATE TABLE IF NOT EXISTS sessions (session TEXT PRIMARY KEY, used REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS sessions_used ON sessions (used)")
+        finally:
+            connection.close()
+
+    def __getstate__(self):
+        return {**self.__dict__, "on_expire": None}  # Sent to the worker processes, which do not expire sessions.
+
+    def _connect(self):
+        # A connection per call, so the workspace can be used from any thread and process. Waits up to 30 s for other processes to finish writing.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _execute(self, statement, parameters=()):
+        # Runs a statement that changes the database. Returns the number of rows it changed.
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(statement, parameters).rowcount
+        finally:
+            connection.close()
+
+    def _query(self, statement, parameters=(), fetch="one"):
+        connection = self._connect()
+        try:
+            cursor = connection.execute(statement, parameters)
+            return cursor.fetchone() if fetch == "one" else cursor.fetchall()
+        finally:
+            connection.close()
+
+    def create(self, session_id):
+        self.expire()
+        return self.files(session_id)
+
+    def files(self, session_id):
+        self._execute("INSERT OR REPLACE INTO sessions VALUES (?, ?)", (session_id, time.time()))
+        return SQLiteFiles(self, session_id)
+
+    def expire(self, now=None):
+        """
+        expire deletes up to batch_size sessions that were last used more than max_age seconds before now (default: now). Returns how many were deleted.
+        """
+        now = time.time() if now is None else now
+        connection = self._connect()
+        try:
+            with connection:
+                expired = [
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT session FROM sessions WHERE used <= ? ORDER BY used LIMIT ?", (now - self.max_age, self.batch_size)
+                    )
+                ]
+                for session_id in expired:
+                    connection.execute("DELETE FROM files WHERE session = ?", (session_id,))
+                    connection.execute("DELETE FROM sessions WHERE session = ?", (session_id,))
+        finally:
+            connection.close()
+        if self.on_expire is not None:
+            for session_id in expired:
+                self.on_expire(session_id)
+        return len(expired)
+
+    def close(self):
+        pass
+
+
+def make_workspace(setting, root, max_age=7200, on_expire=None):
+    """
+    make_workspace returns the workspace described by setting (e.g. the SESAMI_WORKSPACE environment variable):
+    "disk" (or an empty setting) for a DiskWorkspace in root, "memory" or "memory:MB" for a MemoryWorkspace of at most MB megabytes (default: 256),
+    or "sqlite:PATH" for a SQLiteWorkspace at PATH. Sessions are removed max_age seconds after their last use, and on_expire is called with their IDs.
+    """
+    setting = (setting or "disk").strip()
+    if setting == "disk":
+        return DiskWorkspace(root, max_age=max_age, on_expire=on_expire)
+    if setting == "memory" or setting.startswith("memory:"):
+        megabytes = float(setting[len("memory:"):] or 256) if ":" in setting else 256
+        return MemoryWorkspace(max_bytes=int(megabytes * 1024 * 1024), max_age=max_age, on_expire=on_expire)
+    if setting.startswith("sqlite:"):
+        path = setting[len("sqlite:"):]
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        return SQLiteWorkspace(path, max_age=max_age, on_expire=on_expire)
+    raise ValueError(f"Unknown workspace setting {setting!r}. Use 'disk', 'memory', 'memory:MB', or 'sqlite:PATH'.")
@@ -1,19 +1,28 @@
 import flask
 from flask import session, request
 import json
-import csv
+import io
 import os
-import time
-import stat
-import shutil
+import mimetypes
 import uuid
 import secrets
-from threading import Lock
-import numpy as np
-import pandas as pd
+import atexit
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import matplotlib.pyplot as plt
-from SESAMI.SESAMI_1.SESAMI_1 import calculation_runner
-from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2_runner
+from SESAMI.api import API_VERSION, APIError, api_isotherm, api_options, api_result, read_request
+from SESAMI.calculation import run_analyses, run_analysis, run_calculation, run_calculation_batch, warm_up
+from SESAMI.jobs import JobQueue, QueueFull
+from SESAMI.metrics import NO_STAGE, Recording, Registry, metrics_mode
+from SESAMI.profiling import make_profiler
+from SESAMI.result_cache import isotherm_digest, result_key
+from SESAMI.isotherm_cache import Isotherm, IsothermCache
+from SESAMI.aif import AIFError, read_aif
+from SESAMI.SESAMI_1.figures import PanelRenderer
+from SESAMI.donations import DonationWriter
+from SESAMI.uploads import UploadError, UploadRuns, read_upload
+from SESAMI.workspace import FileBatch, make_workspace
+from SESAMI.SESAMI_1.SESAMI_1 import RENDER_RECORD
 from datetime import datetime
 
 # Mongo Atlas
@@ -29,18 +38,82 @@ app.config.update(
 )
 
 MAIN_PATH = os.path.abspath(".") + "/"  # the main directory
-RUN_SESAMI_LOCK = Lock()
+SESSION_ROOT = os.environ.get("SESAMI_SESSION_ROOT", f"{MAIN_PATH}sessions")
+# With SESAMI_METRICS "on" or "server-timing", the stages of each calculation (and of the requests around it) are timed, and served at /metrics.
+# With "server-timing", the responses with results also get a Server-Timing header with the stages. Off by default. See SESAMI/metrics.py.
+METRICS = None if metrics_mode() == "off" else Registry()
+SERVER_TIMING = metrics_mode() == "server-timing"
+# Calculations run on a pool of SESAMI_WORKERS processes (default: one per CPU). At most SESAMI_MAX_PENDING calculations (default: four per worker)
+# can be queued or running; beyond that, new calculations are turned away with a 503.
+JOB_QUEUE = JobQueue(
+    max_workers=int(os.environ.get("SESAMI_WORKERS", 0)) or None,
+    max_pending=int(os.environ.get("SESAMI_MAX_PENDING", 0)) or None,
+    initializer=warm_up,  # Loads the ML model once per worker process. It is reloaded if the file changes.
+    # The workers share one cache of results (see SESAMI/result_cache.py), so that rerunning an isotherm skips the calculation whichever worker gets it.
+    initargs=(MAIN_PATH, os.environ.get("SESAMI_RESULT_CACHE", f"sqlite:{SESSION_ROOT}/results.sqlite")),
+    metrics=METRICS,
+)
+RUN_SESAMI_TIMEOUT = 110  # seconds; below the gunicorn worker timeout.
+# With SESAMI_PROFILE "sample" or "cprofile" (optionally followed by ":SECONDS", default 10), calculations are profiled, and the profiles of those slower
+# than SECONDS are saved in SESAMI_PROFILE_DIR, with the isotherm and settings. The newest SESAMI_PROFILE_KEEP (default 50) are kept. See SESAMI/profiling.py.
+PROFILER = make_profiler(
+    os.environ.get("SESAMI_PROFILE", "off"),
+    os.environ.get("SESAMI_PROFILE_DIR", f"{MAIN_PATH}profiles"),
+    keep=int(os.environ.get("SESAMI_PROFILE_KEEP", 50)),
+)
+# Uploads of several isotherms (a ZIP, or several CSV and AIF files) of at most SESAMI_UPLOAD_MB MB (default 20). Their isotherms are analyzed on the
+# job queue, at most one per worker at a time, so that single calculations still get through. See SESAMI/uploads.py.
+UPLOAD_RUNS = UploadRuns()
+UPLOAD_MAX_BYTES = int(os.environ.get("SESAMI_UPLOAD_MB", 20)) * 1024 * 1024
+# Each user's input.txt is parsed once, and shared by check_csv, show_data, the calculation, and process_info. At most SESAMI_ISOTHERM_CACHE_MB MB are kept.
+ISOTHERM_CACHE = IsothermCache(max_bytes=int(os.environ.get("SESAMI_ISOTHERM_CACHE_MB", 64)) * 1024 * 1024)
+# Each session's files (the uploaded isotherm and the figures) are kept in the SESAMI_WORKSPACE: "disk" (the default; a folder user_[ID] per session
+# in SESAMI_SESSION_ROOT), "memory" or "memory:MB" (in this process), or "sqlite:PATH" (a SQLite file all processes share). See SESAMI/workspace.py.
+# Sessions not used for two hours are removed.
+WORKSPACE = make_workspace(
+    os.environ.get("SESAMI_WORKSPACE", "disk"),
+    SESSION_ROOT,
+    max_age=7200,  # 7200s is two hours
+    on_expire=ISOTHERM_CACHE.invalidate,
+)
+# Once a calculation has saved its multiplot, the individual figures are drawn in the background on SESAMI_RENDER_WORKERS processes (default 4).
+PANEL_RENDERER = PanelRenderer(max_workers=int(os.environ.get("SESAMI_RENDER_WORKERS", 4)))
 MONGODB_URI = os.environ.get("MONGODB_URI")
+# Donated isotherms are written to MongoDB in the background, in batches, through one client (and its pool of connections) for the whole app.
+# Batches that can not be written are kept in SESAMI_DONATION_SPOOL until the database can be reached again. See SESAMI/donations.py.
+DONATIONS = None
+if MONGODB_URI:
+    DONATIONS = DonationWriter(
+        MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000).data_isotherm.BET,  # The BET collection in the data_isotherm database
+        os.environ.get("SESAMI_DONATION_SPOOL", f"{MAIN_PATH}donation_spool"),
+    )
+    atexit.register(DONATIONS.close)
 
 
-def user_path(filename=""):
-    """Return a path constrained to the server-generated per-session directory."""
+def user_files():
+    """Return the files of the server-generated session (see SESAMI/workspace.py). The session is kept for another two hours."""
     user_id = session.get("ID")
     if not user_id:
         flask.abort(400, "Session is not initialized. Reload the application.")
-    base = os.path.join(MAIN_PATH, f"user_{user_id}")
-    os.makedirs(base, exist_ok=True)
-    return os.path.join(base, filename)
+    return WORKSPACE.files(user_id)
+
+
+def user_isotherm():
+    """Return the parsed isotherm in the session's input.txt (see SESAMI/isotherm_cache.py)."""
+    files = user_files()
+    version = files.version("input.txt")
+    if version is None:
+        flask.abort(400, "No isotherm has been uploaded.")
+    return ISOTHERM_CACHE.load(session["ID"], version, lambda: files.read("input.txt"))
+
+
+def request_stage(name):
+    # Times a stage of the current request in the web server (e.g. loading the isotherm), for /metrics and the Server-Timing header.
+    if METRICS is None:
+        return NO_STAGE
+    if "recording" not in flask.g:
+        flask.g.recording = Recording()
+    return flask.g.recording.stage(name)
 
 
 @app.after_request
@@ -51,6 +124,21 @@ def add_security_headers(response):
     response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
     return response
 
+
+@app.after_request
+def add_timing(response):
+    # Adds the stages of the request to the metrics, and sends them, with those of the calculation it returns (flask.g.job), as a Server-Timing header.
+    recording = flask.g.pop("recording", None)
+    job = flask.g.pop("job", None)
+    if recording is not None:
+        METRICS.observe(recording)  # The stages of the calculation itself were added by the job queue.
+    if SERVER_TIMING:
+        recordings = [recording, job.recording() if job is not None else None]
+        timing = ", ".join(stages.server_timing() for stages in recordings if stages is not None and stages.stages)
+        if timing:
+            response.headers["Server-Timing"] = timing
+    return response
+
 # Next two lines are for later use, when comparing any user uploaded isotherms to the example isotherm.
 with open(f"{MAIN_PATH}example_input/example_input.txt", "r") as f:
     EXAMPLE_FILE_CONTENT = f.readlines()
@@ -89,7 +177,14 @@ def serve_images(path):
 
 @app.route("/generated_plots/<path:path>")
 def serve_plots(path):
-    return flask.send_from_directory(user_path(), path)
+    # Calculations only save the multiplot. The other figures are drawn in the background once it is saved (see submit_SESAMI).
+    # A request for a figure that is not saved yet waits for that figure, and starts drawing the others if they are not being drawn already.
+    files = user_files()
+    PANEL_RENDERER.render(session["ID"], path, files)  # Names with folders in them are turned away by the workspace.
+    data = files.read(path)
+    if data is None:
+        flask.abort(404)
+    return flask.send_file(io.BytesIO(data), mimetype=mimetypes.guess_type(path)[0] or "application/octet-stream", download_name=path)
 
 
 @app.route("/example_inputs")
@@ -107,26 +202,22 @@ def serve_aif():
     return flask.send_from_directory("example_input", "example_loading_data.aif")
 
 
-# Writes the uploaded CSV as a CSV and TXT file. Writes them in the users designated folder.
+# Writes the uploaded CSV as a TXT file, in the user's designated folder.
 @app.route("/save_csv_txt", methods=["POST"])
 def save_csv_txt():
     my_dict = flask.request.get_json(silent=False)
     my_content = my_dict.get("my_content")
-    if not isinstance(my_content, list) or len(my_content) > 10000:
+    if not isinstance(my_content, list) or len(my_content) > 10000 or not all(isinstance(row, list) for row in my_content):
         flask.abort(400, "CSV input must contain at most 10,000 rows.")
 
-    # Writing the CSV the user provided.
-    with open(user_path("input.csv"), "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(my_content)
+    files = user_files()  # Makes sure the session is initialized.
+    ISOTHERM_CACHE.invalidate(session["ID"])  # input.txt is about to change.
 
-    # Converting the CSV to a TXT, and saving the TXT.
-    with open(user_path("input.txt"), "w") as output_file:
-        with open(user_path("input.csv"), "r") as input_file:
-            [
-                output_file.write("\t".join(row) + "\n")
-                for row in csv.reader(input_file)
-            ]  # \t is tab
+    # Converting the CSV to a TXT (the cells of each row separated by tabs), and saving the TXT.
+    # The rows are checked and converted to numbers as they are, so the TXT is not parsed again by check_csv, show_data, or the calculation.
+    isotherm = Isotherm.from_rows(my_content)
+    files.write("input.txt", isotherm.raw)
+    ISOTHERM_CACHE.put(session["ID"], files.version("input.txt"), isotherm)
 
     return "0"  # The return value does not really matter here.
 
@@ -139,9 +230,11 @@ def save_aif_txt():
     if not isinstance(my_content, str) or len(my_content.encode("utf-8")) > 2 * 1024 * 1024:
         flask.abort(400, "AIF input must be text no larger than 2 MiB.")
 
+    files = user_files()  # Makes sure the session is initialized.
+    ISOTHERM_CACHE.invalidate(session["ID"])  # input.txt is about to change.
+
     # Writing the AIF the user provided.
-    with open(user_path("input.aif"), "w", newline="") as f:
-        f.writelines(my_content)
+    files.write("input.aif", my_content.encode())
 
     # Converting the AIF to a TXT, and saving the TXT.
     status = aif_to_txt(my_content)
@@ -153,270 +246,224 @@ def aif_to_txt(content):
     # This helper function converts the AIF into an isotherm text file.
     # content is the content of the AIF
 
-    # Currently, the code does not check the adsorbate, p0, nor the temperature in the AIF file.
-
-    content = content.splitlines()  # split into an array based on new line characters
-
-    # Find the adsorption data, in order to convert to an isotherm data file.
-    start_idx = None  # Will instantiate in the loop below.
-    for idx, line in enumerate(content):
-        if (
-            line[:5] == "loop_"
-            and content[idx + 1][:16] == "_adsorp_pressure"
-            and content[idx + 2][:10] == "_adsorp_p0"
-            and content[idx + 3][:14] == "_adsorp_amount"
-        ):  # getting only the first 5/16/10/14 characters of respective lines
-            start_idx = idx
-            break  # No need to keep checking. We found the start of the adsorption data.
-    if start_idx is None:  # This means there is a problem.
-        return "Incorrectly formatted AIF file. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-
-    # quote from AIF paper Langmuir 2021, 37, 4222−4226: "The data loops, as used here, are terminated by a new data item, a new data loop, or an end of file"
-    # Code block below grabs the adsorption data from the AIF file.
-    counter = 0
-    full_adsorption_data = []
-    while True:
-        # Note, we have start_idx + 4 because want to skip the first three lines, which are _adsorp_pressure, _adsorp_p0, and _adsorp_amount
-        if (start_idx + 4 + counter) >= len(content):  # termination by end of file
-            break
-
-        line = content[start_idx + 4 + counter]
-
-        if len(line.strip()) == 0: # termination by an empty line
-            break
-        if line[0] == "_":  # termination by a new data item
-            break
-        if line[:5] == "loop_":  # termination by a new data loop
-            break
-
-        full_adsorption_data.append(line)
-
-        counter += 1
-
-    if len(full_adsorption_data) == 0:  # This means there is a problem.
-        return "Missing adsorption data in the AIF file. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-
-    # Now, we have all of the adsorption data in the variable full_adsorption_data.
-
-    # Next, find the units of loading
-    units_loading = None
-    for line in content:
-        if "_units_loading" in line:
-            line_modified = line.replace("'", "") # Removing all single quotation marks
-            units_loading = line_modified.split()  # split on spaces
-            units_loading = units_loading[1]
-            break
-
-    if units_loading is None:  # This means there is a problem.
-        return "Incorrectly formatted AIF file. Did not include units of loading. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-    supported_units_loading = [
-        "mol/kg",
-        "mmol/g",
-        "cm³/g"
-    ]  # May expand on allowed units in the future.
-    if units_loading not in supported_units_loading:  # This means there is a problem.
-        return f"Invalid/unsupported loading units in AIF file. Supported units are {supported_units_loading}. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-
-    # Grabbing just the adsorption amount data
-    adsorption_data = [
-        item.split()[2] for item in full_adsorption_data
-    ]  # Get the third element of each row (after splitting on spaces)
-
-    # Convert adsorption_data to mol/kg
-    if units_loading == "mmol/g" or units_loading == "mol/kg":
-        conversion_multiplier = 1 # No action needed
-    elif units_loading == "cm³/g":
-        conversion_multiplier = 0.044615 # conversion factor mol/kg -> cm^3 STP/g is 22.4139. So here, use its reciprocal
-    adsorption_data = [
-        str(float(datum) * conversion_multiplier) for datum in adsorption_data
-    ]  # Results in a list with entries of the correct units
-
-    # Next, find the units of pressure
-    units_pressure = None
-    for line in content:
-        if "_units_pressure" in line:
-            line_modified = line.replace("'", "") # Removing all single quotation marks
-            units_pressure = line_modified.split()  # split on spaces
-            units_pressure = units_pressure[1]
-
-    if units_pressure is None:  # This means there is a problem.
-        return "Incorrectly formatted AIF file. Did not include units of pressure. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-    supported_units_pressure = [
-        "Pa",
-        "pascal",
-        "bar",
-        "torr",
-        "mbar",
-        "mb",
-    ]  # May expand on allowed units in the future.
-    if units_pressure not in supported_units_pressure:  # This means there is a problem.
-        return f"Invalid/unsupported pressure units in AIF file. Supported units are {supported_units_pressure}. Please refer to the example AIF in the Source Code."  # Quits, does not proceed with the rest of the function.
-
-    # Grabbing just the pressure data
-    pressure_data = [
-        item.split()[0] for item in full_adsorption_data
-    ]  # Get the first element of each row (after splitting on spaces)
-
-    # # Grabbing just the p0 data
-    # saturation_pressure_data = [item.split()[1] for item in full_adsorption_data] # Get the second element of each row (after splitting on spaces)
-    # saturation_pressure = saturation_pressure_data[0] # All elements in saturation_pressure_data should be the same anyway. Since saturation pressure depends on the temperature and adsorbate type, and these aren't changing.
-    # p0 = float(saturation_pressure)
-
-    # Convert pressure units
-    if units_pressure in ["Pa", "pascal"]:
-        conversion_multiplier = 1 # No action needed
-    elif units_pressure == "bar":
-        conversion_multiplier = 100000 # bar to Pascal
-    elif units_pressure == "torr":
-        conversion_multiplier = 133.322 # torr to Pascal
-    elif units_pressure in ["mbar", "mb"]:
-        conversion_multiplier = 100 # mbar to Pascal
-    pressure_data = [
-        str(float(datum) * conversion_multiplier) for datum in pressure_data
-    ]  # Results in a list with entries of the correct units.
-
-    with open(user_path("input.txt"), "w") as f:
-        f.write("\t".join(["Pressure", "Loading"]) + "\n")  # The column titles
-        [
-            f.write("\t".join([pressure_data[i], adsorption_data[i]]) + "\n")
-            for i in range(len(pressure_data))
-        ]  # \t is tab
-        # join on tabs, and add a new line after each join
+    # The AIF is read in a single pass (see SESAMI/aif.py). Currently, the code does not check the adsorbate, p0, nor the temperature in the AIF file.
+    try:
+        pressure_data, adsorption_data = read_aif(io.StringIO(content, newline=None)).isotherm()  # In Pa and mol/kg.
+    except AIFError as error:  # This means there is a problem.
+        return str(error)  # Quits, does not proceed with the rest of the function.
+
+    # The isotherm goes to the cache along with its text file, so the calculations use these numbers without parsing the text file again.
+    isotherm = Isotherm.from_columns(["Pressure", "Loading"], pressure_data, adsorption_data)  # The column titles
+    files = user_files()
+    files.write("input.txt", isotherm.raw)
+    ISOTHERM_CACHE.put(session["ID"], files.version("input.txt"), isotherm)
 
     # If the code gets to this point, the AIF hopefully doesn't have any problems with it.
     return "All good!"
 
 
-def run_SESAMI():
-    # This function runs SESAMI 1 and SESAMI 2 on the user's isotherm.
-    # It generates diagnostics (SESAMI 1 and 2) and figures (SESAMI 1).
-    # Assumes the user's input.txt has been made by the website already.
-
-    ### SESAMI 1
+def submit_SESAMI(isotherm=None):
+    # This function queues SESAMI 1 and SESAMI 2 on the user's isotherm, with the options sent by the frontend. Returns the Job (see SESAMI/jobs.py).
+    # Each calculation runs in a worker process, so matplotlib state is not shared between users calculating at the same time.
+    # isotherm is the Isotherm to calculate on, if not the user's input.txt (e.g. one of an upload of several isotherms).
+    # If the user's previous calculation of the same isotherm with the same options is still queued or running (e.g. the user clicked again
+    # after /run_SESAMI timed out), that job is returned instead of running the calculation twice.
     user_options = flask.request.get_json(silent=False)
+    files = user_files()  # Makes sure the session is initialized.
+    with request_stage("load_isotherm"):
+        isotherm = isotherm or user_isotherm()
+        isotherm_data = isotherm.to_frame()
+
+    owner, plot_number = session["ID"], session["plot_number"]
+
+    def saved(results):  # Once the multiplot is saved, the individual figures are drawn in the background. Does nothing if no PNGs were made.
+        PANEL_RENDERER.start(owner, files, plot_number)
+        return results
+
+    if WORKSPACE.shared:  # The worker process saves the figures to the workspace itself.
+        calculation = (run_calculation, MAIN_PATH, user_options, owner, plot_number, isotherm_data, files)
+        on_result = saved
+    else:  # The figures are saved to a FileBatch, which is stored in the workspace here once the calculation is done.
+        batch = FileBatch.of(files, read=[RENDER_RECORD])  # The calculation reads which figures it can reuse.
+        calculation = (run_calculation_batch, MAIN_PATH, user_options, owner, plot_number, isotherm_data, batch)
+        on_result = lambda value: saved(value[1].apply(files) or value[0])  # Stores the files, and returns the results.
+    if PROFILER is not None:  # The calculation is profiled, and the profile is kept if it is slow, along with what is needed to run it again.
+        info = {"isotherm": isotherm_digest(isotherm_data), "options": dict(user_options), "submitted": datetime.now().isoformat()}
+        calculation = (PROFILER.call, info, isotherm.raw) + calculation
 
-    # Running the SESAMI 1 calculation. Makes plots.
-    BET_dict, BET_ESW_dict = calculation_runner(
-        MAIN_PATH, user_options, session["ID"], session["plot_number"]
-    )
+    try:
+        key = result_key("SESAMI website", isotherm_digest(isotherm_data), user_options)
+        job = JOB_QUEUE.submit(*calculation, owner=session["ID"], on_result=on_result, key=key)
+    except QueueFull:
+        flask.abort(503, "The calculation service is busy. Please retry shortly.")
 
     session["plot_number"] += 1  # So that the next set of plots have different names
 
-    # Packaging the diagnostics to be sent back to the frontend (index.html).
-    if BET_dict == 'No eswminima': # This is a problem.
-        return (
-            "No eswminima"  # Quits, does not proceed with the rest of the function.
-        )        
-    if BET_dict == 'BET linear failure':  # This is a problem.
-        return (
-            "BET linear failure"  # Quits, does not proceed with the rest of the function.
-        )
-    if BET_ESW_dict == 'BET+ESW linear failure': # This is a problem.
-        return (
-            "BET+ESW linear failure"  # Quits, does not proceed with the rest of the function.
-        )        
-    
-    # reformatting
-    BET_dict["C"] = "%.4g" % BET_dict["C"]
-    BET_dict["qm"] = "%.2f" % BET_dict["qm"]
-    BET_dict["A_BET"] = "%.1f" % BET_dict["A_BET"]
-    BET_dict["R2_linear_region"] = "%.4f" % BET_dict["R2_linear_region"]
-
-    BET_analysis = f'BET area = {BET_dict["A_BET"]} m2sup/g\n\
-        C = {BET_dict["C"]}\n\
-        qmsub = {BET_dict["qm"]} mol/kg\n\
-        Rouquerol consistency criteria 1 and 2: Yes\n\
-        Rouquerol consistency criterion 3: {BET_dict["con3"]}\n\
-        Rouquerol consistency criterion 4: {BET_dict["con4"]}\n\
-        Number of points in linear region: {BET_dict["length_linear_region"]}\n\
-        Lowest pressure of linear region: {int(np.rint(BET_dict["low_P_linear_region"]))} Pa\n\
-        Highest pressure of linear region: {int(np.rint(BET_dict["high_P_linear_region"]))} Pa\n\
-        R2sup of linear region: {BET_dict["R2_linear_region"]}'  # If a linear region is selected, it satisfies criteria 1 and 2. See SI for https://pubs.acs.org/doi/abs/10.1021/acs.jpcc.9b02116
-    # np.rint rounds to the nearest integer
-
-    if user_options['scope'] == 'BET': # Exclude ESW analysis
-        BETESW_analysis = None
-    else: # Include ESW analysis
-        # reformatting
-        BET_ESW_dict["C"] = "%.4g" % BET_ESW_dict["C"]
-        BET_ESW_dict["qm"] = "%.2f" % BET_ESW_dict["qm"]
-        BET_ESW_dict["A_BET"] = "%.1f" % BET_ESW_dict["A_BET"]
-        BET_ESW_dict["R2_linear_region"] = "%.4f" % BET_ESW_dict["R2_linear_region"]
-
-        BETESW_analysis = f'BET area = {BET_ESW_dict["A_BET"]} m2sup/g\n\
-            C = {BET_ESW_dict["C"]}\n\
-            qmsub = {BET_ESW_dict["qm"]} mol/kg\n\
-            Rouquerol consistency criteria 1 and 2: Yes\n\
-            Rouquerol consistency criterion 3: {BET_ESW_dict["con3"]}\n\
-            Rouquerol consistency criterion 4: {BET_ESW_dict["con4"]}\n\
-            Number of points in linear region: {BET_ESW_dict["length_linear_region"]}\n\
-            Lowest pressure of linear region: {int(np.rint(BET_ESW_dict["low_P_linear_region"]))} Pa\n\
-            Highest pressure of linear region: {int(np.rint(BET_ESW_dict["high_P_linear_region"]))} Pa\n\
-            R2sup of linear region: {BET_ESW_dict["R2_linear_region"]}'  # If a linear region is selected, it satisfies criteria 1 and 2. See SI for https://pubs.acs.org/doi/abs/10.1021/acs.jpcc.9b02116
-
-    if user_options['ML'] == 'No': # Exclude ML prediction
-        ML_prediction = None # Placeholder        
-    else:
-        ### SESAMI 2
-        ML_prediction = calculation_v2_runner(
-            MAIN_PATH, session["ID"]
-        )  # ML stands for machine learning.
-
-        if is_number(ML_prediction): # If ML_prediction is not a number, it is the error message about a bin being empty. If it is a number, the ML calculation ran, and we want to run some code on the number.
-            ML_prediction = float(ML_prediction
-                ) # Casting to float.
-
-            # Multiply by 1.148 if Nitrogen gas used instead of Argon, to account for difference in cross-sectional areas.
-            if user_options['gas'] == 'Nitrogen':
-                ML_prediction *= 1.148
-
-            ML_prediction = "%.1f" % ML_prediction # One decimal precision. Casting back to string.
-
-    calculation_results = {
-        "ML_prediction": ML_prediction, 
-        "BET_analysis": BET_analysis,
-        "BETESW_analysis": BETESW_analysis,
-        "plot_number": session["plot_number"] - 1,
-    }
-
-    return calculation_results  # Sends back SESAMI 1 and 2 diagnostics to be displayed, as well as the plot number so the appropriate plots are displayed.
+    return job
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    # Queues a calculation and returns its job ID right away. The frontend then polls /jobs/<job_id> for the results.
+    job = submit_SESAMI()
+    return flask.jsonify(job.info()), 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def poll_job(job_id):
+    # Returns the status and timing of a calculation, and its results once it is done. Users can only see their own jobs.
+    if not session.get("ID"):  # Without a session, there is no owner to check against.
+        flask.abort(404, "No such calculation.")
+    job = JOB_QUEUE.get(job_id, owner=session["ID"])
+    if job is None:
+        flask.abort(404, "No such calculation.")
+    flask.g.job = job  # For the Server-Timing header, once it is done.
+    return flask.jsonify(job.info())
 
 
 @app.route("/run_SESAMI", methods=["POST"])
-def run_SESAMI_serialized():
-    if not RUN_SESAMI_LOCK.acquire(timeout=30):
-        flask.abort(503, "The calculation service is busy. Please retry shortly.")
+def run_SESAMI():
+    # Runs a calculation and waits for its results, for clients that do not poll.
+    # If it has not even started when the wait is over, it is cancelled, so that it does not take up room in the queue; a retry queues it again.
+    # If it is running, a retry waits for the same job (see submit_SESAMI).
+    job = submit_SESAMI()
     try:
-        return run_SESAMI()
-    finally:
-        RUN_SESAMI_LOCK.release()
+        results = job.result(timeout=RUN_SESAMI_TIMEOUT)
+        flask.g.job = job  # For the Server-Timing header.
+        return results
+    except FuturesTimeoutError:
+        if job.future.cancel():
+            flask.abort(503, "The calculation service is busy. Please retry shortly.")
+        flask.abort(503, f"The calculation is still running. Poll /jobs/{job.id} for its results.")
+
+
+@app.route("/uploads", methods=["POST"])
+def submit_upload():
+    # Starts the analysis of several isotherms, uploaded as the files "files" (a ZIP of isotherm files, or CSV and AIF files), with the calculation options as
+    # the JSON form field "options". Returns the progress right away; the frontend then polls /uploads/<upload_id>. No plots are made.
+    flask.request.max_content_length = UPLOAD_MAX_BYTES  # Larger than for other requests.
+    files = user_files()  # Makes sure the session is initialized.
+    try:
+        user_options = json.loads(flask.request.form.get("options", "{}"))
+        items = read_upload([(file.filename or "", file.read()) for file in flask.request.files.getlist("files")])
+    except ValueError as error:  # UploadError, or options that are not JSON.
+        flask.abort(400, str(error) if isinstance(error, UploadError) else "The options must be JSON.")
+    if not isinstance(user_options, dict):
+        flask.abort(400, "The options must be JSON.")
 
+    owner = session["ID"]
 
-def is_number(s):
-    """
-    is_number assesses whether the inputted string is a number; that it an be cast to a float.
-    It is used as a helper function in the run_SESAMI function.
+    def submit(item):  # Runs on the run's thread, outside of the request.
+        return JOB_QUEUE.submit(run_analysis, MAIN_PATH, user_options, item.isotherm.to_frame(), owner=owner)
 
-    :return: Boolean indicating whether the input string can be cast to a float.
-    """
     try:
-        float(s)
-        return True
-    except ValueError:
-        return False
+        run = UPLOAD_RUNS.start(items, submit, parallel=JOB_QUEUE.max_workers, owner=owner)
+    except QueueFull:
+        flask.abort(503, "Your previous upload is still being analyzed. Please wait for it to finish.")
+    return flask.jsonify(run.info()), 202
+
+
+def user_upload(upload_id):
+    # Returns the upload run of the user with ID upload_id. Users can only see their own uploads.
+    if not session.get("ID"):  # Without a session, there is no owner to check against.
+        flask.abort(404, "No such upload.")
+    run = UPLOAD_RUNS.get(upload_id, owner=session["ID"])
+    if run is None:
+        flask.abort(404, "No such upload.")
+    return run
+
+
+@app.route("/uploads/<upload_id>", methods=["GET"])
+def poll_upload(upload_id):
+    # Returns the progress of an upload, item by item, with the results of the items that are done.
+    return flask.jsonify(user_upload(upload_id).info())
+
+
+@app.route("/uploads/<upload_id>/summary.csv", methods=["GET"])
+def download_upload_summary(upload_id):
+    # The summary table of an upload: the BET, BET+ESW, and ML results and consistency criteria of each isotherm (see SESAMI/batch.py for the columns).
+    return flask.Response(
+        user_upload(upload_id).summary_csv(),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=SESAMI_summary_{upload_id[:8]}.csv"},
+    )
 
 
-def file_age_in_seconds(pathname):
-    """
-    file_age_in_seconds returns the age of the file/folder specified in pathname since the last modification.
-    It is used as a helper function in the set_ID function.
+@app.route("/uploads/<upload_id>/items/<int:index>/plots", methods=["POST"])
+def plot_upload_item(upload_id, index):
+    # Queues the website's calculation, with plots, on one isotherm of an upload, with the options sent by the frontend.
+    # Returns the job right away, as /jobs does; its results have the plot number of the figures in /generated_plots.
+    run = user_upload(upload_id)
+    if not 0 <= index < len(run.items) or not run.items[index].valid:
+        flask.abort(404, "No such isotherm in the upload.")
+    job = submit_SESAMI(isotherm=run.items[index].isotherm)
+    return flask.jsonify(job.info()), 202
 
-    :return: The age of the file/folder specified in pathname since the last modification, in seconds.
-    """
 
-    return (
-        time.time() - os.stat(pathname)[stat.ST_MTIME]
-    )  # time since last modification
+def api_error(status, message, retry_after=None):
+    # The JSON API answers errors in JSON, rather than the HTML of flask.abort.
+    response = flask.jsonify({"api_version": API_VERSION, "error": message})
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(retry_after)
+    return response
+
+
+@app.route("/api/v1/analyze", methods=["POST"])
+def api_analyze():
+    # The JSON API, for scripts and other programs: BET, BET+ESW, and ML results as numbers, with no session, no files, and no plots (see SESAMI/api.py).
+    # The body is JSON with an "isotherm" or a list of "isotherms", and the "options"; or the isotherm as CSV text (Content-Type text/csv), with the options in the query string.
+    # The isotherms are split into one job per free worker, and the response waits for them all.
+    flask.request.max_content_length = UPLOAD_MAX_BYTES  # As for uploads of several isotherms.
+    try:
+        if flask.request.mimetype in ("text/csv", "text/plain"):
+            items, user_options, single = [api_isotherm("isotherm", flask.request.get_data(as_text=True))], api_options(flask.request.args.to_dict()), True
+        else:
+            items, user_options, single = read_request(flask.request.get_json(silent=True))
+    except APIError as error:
+        return api_error(400, str(error))
+    if single and not items[0].valid:
+        return api_error(422, items[0].message)
+
+    valid = [item for item in items if item.valid]
+    rows = {}
+    if valid:
+        n_jobs = min(JOB_QUEUE.room(), JOB_QUEUE.max_workers, len(valid))
+        chunks = [valid[i::n_jobs] for i in range(n_jobs)] if n_jobs > 0 else []
+        jobs = []
+        try:
+            if not chunks:
+                raise QueueFull
+            with request_stage("submit"):
+                for chunk in chunks:
+                    jobs.append(JOB_QUEUE.submit(run_analyses, MAIN_PATH, user_options, [item.isotherm.to_frame() for item in chunk]))
+        except QueueFull:
+            for job in jobs:  # Not started yet, most likely.
+                job.future.cancel()
+            return api_error(503, "The calculation service is busy. Please retry shortly.", retry_after=5)
+        deadline = time.monotonic() + RUN_SESAMI_TIMEOUT
+        try:
+            for chunk, job in zip(chunks, jobs):
+                rows.update(zip(map(id, chunk), job.result(timeout=max(deadline - time.monotonic(), 0))))
+        except FuturesTimeoutError:
+            for job in jobs:  # So that retries do not wait behind the jobs of this request. Jobs that are already running finish, and are dropped.
+                job.future.cancel()
+            return api_error(503, "The calculation took too long. Please send fewer isotherms at a time.", retry_after=30)
+        except Exception as error:  # e.g. a worker process that crashed.
+            return api_error(500, f"The calculation failed: {type(error).__name__}: {error}")
+
+    results = [api_result(item, rows.get(id(item))) for item in items]
+    if single:
+        return flask.jsonify({"api_version": API_VERSION, "result": results[0]})
+    return flask.jsonify({"api_version": API_VERSION, "results": results})
+
+
+@app.route("/metrics", methods=["GET"])
+def serve_metrics():
+    # The stage times and counts of all calculations so far, in the Prometheus text format. Only there if SESAMI_METRICS is not "off".
+    if METRICS is None:
+        flask.abort(404)
+    return flask.Response(METRICS.prometheus(), mimetype="text/plain; version=0.0.4")
 
 
 # The two functions that follow handle user session creation and information passing
@@ -426,7 +473,7 @@ def set_ID():
     set_ID sets the session user ID.
     This is also used to generate unique folders, so that multiple users can use the website at a time.
         The user's folder is user_[ID]
-    This function also deletes user folders and files that have not been used for a while in order to reduce clutter.
+    The user's files are kept in WORKSPACE (see SESAMI/workspace.py). Sessions that have not been used for a while are deleted, in order to reduce clutter.
 
     :return: string, The session ID for this user.
     """
@@ -439,75 +486,17 @@ def set_ID():
     # Having unique names for all figures generated (as opposed to overwriting figures) prevents issues in the front end when displaying figures.
     session["raw_plot_number"] = 0  # the number identifier for the raw data figures
 
-    os.makedirs(f'user_{session["ID"]}')  # Making a folder for this user.
-
-    target_str = "user_"
-
-    # Delete all old user folders that haven't been used for a while, to prevent folder accumulation.
-    for root, dirs, files in os.walk(MAIN_PATH):
-        for dir in dirs:
-            # Note: the way this is set up, don't name folders with the phrase "user_" in them if you want them to be permanent.
-            if (
-                dir.startswith(target_str) and file_age_in_seconds(os.path.join(root, dir)) > 7200
-            ):  # 7200s is two hours
-                # target_str in dir to find all folders with user_ in them
-                shutil.rmtree(os.path.join(root, dir))
+    WORKSPACE.create(session["ID"])  # Making a folder (or its equivalent in the workspace) for this user.
 
     return str(session["ID"])
 
 
-# Function to check if a type is a number.
-def type_number(my_type):
-    return not (
-        my_type == "int64" or my_type == "float64"
-    )  # true if my_type is not a number
-
-
 @app.route("/check_csv", methods=["GET"])
 def check_csv():
     # This function checks the user uploaded CSV to make sure it is correctly formatted.
 
-    ### Checks
-
-    input_location = f'{MAIN_PATH}user_{session["ID"]}/input.txt'  # Looks in the user's folder. The input file is made by the function save_csv_txt.
-
-    data = pd.read_table(input_location, skiprows=1, sep="\t")
-
-    if data.shape[1] != 2:  # This is a problem.
-        return "Wrong number of columns in the CSV. There should be two. Please refer to the example CSV in the Source Code."
-
-    column_names = ["Pressure", "Loading"]
-    data = pd.read_table(input_location, skiprows=1, sep="\t", names=column_names)
-    dataTypeSeries = (
-        data.dtypes
-    )  # Series object containing the data type objects of each column of the DataFrame.
-
-    # For each column, check its type. If it is not of int64 or float64 type, raise an Exception.
-    for col in column_names:
-        if type_number(dataTypeSeries[col]):  # This is a problem.
-            # non numbers in this column
-            return "The CSV must contain numbers only. Please refer to the example CSV in the Source Code."
-
-    # Checking for NaN values
-    if data.isnull().values.any():  # This is a problem.
-        return "The CSV cannot have any empty cells (gaps), since they lead to NaN values. Please refer to the example CSV in the Source Code."
-
-    # Checking to ensure the first row of the CSV reads Pressure, Loading
-    data_header = pd.read_table(input_location, nrows=1, sep="\t", names=column_names)
-    if (data_header["Pressure"][0] != "Pressure (Pa)") or (
-        data_header["Loading"][0] != "Loading (mol/kg)"
-    ):  # This is a problem.
-        return "The CSV does not have the correct first row. The first entries of the two columns should be Pressure (Pa) and Loading (mol/kg), respectively. Please refer to the example CSV in the Source Code."
-
-    # Check to make sure the lowest loading divided by the highest loading is not less than 0.05
-    # If it is, the isotherm does not have enough low pressure data.
-    data = pd.read_table(input_location, skiprows=1, sep="\t", names=column_names)
-    loading_data = list(data["Loading"])
-    if loading_data[0] / loading_data[-1] >= 0.05:  # This is a problem.
-        return "Warning: Lacking data at low pressure region. The ratio of the lowest loading to the highest loading is not less than 0.05. You can still run calculations, though."
-
-    # If the code gets to this point, the CSV likely doesn't have any problems with it.
-    return "All good!"
+    # The checks are in Isotherm.check, since uploads of several isotherms check each of them the same way (see SESAMI/uploads.py).
+    return user_isotherm().check()  # Looks in the user's folder. The input file is made by the function save_csv_txt.
 
 
 ## Handle information storage
@@ -529,20 +518,15 @@ def process_info():
         )  # 204 no content response. Don't proceed with the rest of the function.
 
     # If the user is predicting on the example isotherm data, we don't store that.
-    with open(f'{MAIN_PATH}user_{session["ID"]}/input.txt', "r") as f:
-        isotherm_data = f.readlines()
+    isotherm_data = user_isotherm().lines()
     if isotherm_data == EXAMPLE_FILE_CONTENT:
         return (
             "",
             204,
         )  # 204 no content response. Don't proceed with the rest of the function.
 
-    if not MONGODB_URI:
+    if DONATIONS is None:
         flask.abort(503, "Data storage is not configured.")
-    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
-
-    db = client.data_isotherm
-    collection = db.BET  # The BET collection in isotherm_db database
 
     # The keys of this dictionary will be name, email, institution, adsorbent, isotherm_data, adsorbate, ip, and timestamp.
     final_dict = {}
@@ -578,8 +562,8 @@ def process_info():
     final_dict["ip"] = request.remote_addr
     final_dict["timestamp"] = datetime.now().isoformat()
 
-    # insert the dictionary into the mongodb collection
-    collection.insert_one(final_dict)
+    # queue the dictionary to be inserted into the mongodb collection. It is written in the background, so the request does not wait for the database.
+    DONATIONS.submit(final_dict)
     return ("", 204)  # 204 no content response
 
 
@@ -604,10 +588,10 @@ def change_permission():
 def copy_example():
     # This function copies over the example isotherm into the user's folder. This lets the user run the SESAMI calculations on the example isotherm.
 
-    shutil.copyfile(
-        f"{MAIN_PATH}example_input/example_input.txt",
-        f'{MAIN_PATH}user_{session["ID"]}/input.txt',
-    )
+    files = user_files()  # Makes sure the session is initialized.
+    ISOTHERM_CACHE.invalidate(session["ID"])  # input.txt is about to change.
+    with open(f"{MAIN_PATH}example_input/example_input.txt", "rb") as f:
+        files.write("input.txt", f.read())
 
     return "0"  # The return value does not really matter here.
 
@@ -616,13 +600,7 @@ def copy_example():
 def show_data():
     # This function generates a scatter plot of the user's isotherm data.
 
-    column_names = ["Pressure", "Loading"]
-    data = pd.read_table(
-        f'{MAIN_PATH}user_{session["ID"]}/input.txt',
-        skiprows=1,
-        sep="\t",
-        names=column_names,
-    )
+    data = user_isotherm().to_frame()
 
     plt.figure()
     ax = plt.gca()
@@ -639,17 +617,30 @@ def show_data():
     ax.set_ylabel("Loading (mol/kg)")
     ax.set_title("Your isotherm")
     ax.legend()
+    figure = io.BytesIO()
     plt.savefig(
-        f'{MAIN_PATH}user_{session["ID"]}/raw_data_{session["raw_plot_number"]}.png',
+        figure,
         format="png",
         dpi=300,
         bbox_inches="tight",
     )
+    user_files().write(f'raw_data_{session["raw_plot_number"]}.png', figure.getvalue())
 
     session["raw_plot_number"] += 1
 
     return str(session["raw_plot_number"] - 1)
 
 
+@app.route("/isotherm_data", methods=["GET"])
+def isotherm_data():
+    # This function sends the user's isotherm data, so that the front end can draw the scatter plot of show_data itself (interactive plots).
+
+    isotherm = user_isotherm()
+    if isotherm.pressure is None:  # This is a problem.
+        flask.abort(400, "The isotherm must contain numbers only.")
+
+    return flask.jsonify({"Pressure": isotherm.pressure.tolist(), "Loading": isotherm.loading.tolist()})
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000, debug=False)
@@ -1,9 +1,14 @@
 import os
+import sys
+import subprocess
 import pytest
 import shutil
 import math
+import json
+import numpy as np
 import pandas as pd
 from SESAMI.SESAMI_1.SESAMI_1 import calculation_runner
+from SESAMI.SESAMI_1.betan import BETAn
 
 MAIN_PATH = os.path.abspath(".") + "/"
 # MAIN_PATH = str(current_path.parent.absolute()) + "/" # the main directory
@@ -92,4 +97,277 @@ def test_SESAMI_1(MAIN_PATH, user_options, session_ID, session_plot_num, benchma
                 assert BET_ESW_dict[key] == benchmark_values[1][key]        
 
     # assert BET_dict == benchmark_values[0]    
-    # assert BET_ESW_dict == benchmark_values[1]
\ No newline at end of file
+    # assert BET_ESW_dict == benchmark_values[1]
+
+@pytest.mark.parametrize("MAIN_PATH, user_options, session_ID, session_plot_num, benchmark_values", inputs)
+def test_SESAMI_1_without_plots(MAIN_PATH, user_options, session_ID, session_plot_num, benchmark_values):
+    # Without plots, the calculation gives the same results as test_SESAMI_1.
+    BET_dict, BET_ESW_dict = calculation_runner(
+        MAIN_PATH, dict(user_options), session_ID, session_plot_num, makeplots='No'
+    )
+
+    for results, benchmark in ((BET_dict, benchmark_values[0]), (BET_ESW_dict, benchmark_values[1])):
+        if benchmark is None:
+            assert results is None
+            continue
+        assert results.keys() == benchmark.keys()
+        for key in results:
+            if type(results[key]) == int or type(results[key]) == float: # Comparing numbers (e.g. for qm)
+                assert math.isclose(results[key], benchmark[key])
+            else: # Comparing strings (e.g. for con3)
+                assert results[key] == benchmark[key]
+
+def test_getlocalextremum_slopes():
+    # The windowed slopes should match a least-squares line fit through each window of 2 * points + 1 points.
+    from SESAMI.SESAMI_1.betan import BETAn
+
+    b = BETAn("Argon", 87, 4, {"R2 cutoff": 0.9995, "R2 min": 0.998})
+    data = pd.read_table(
+        f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]
+    )
+    data = b.prepdata(data)
+    points = 3
+    minima, targetvalue, frame = b.getlocalextremum(data, column="phi", x="P_rel", how="Minima", points=points)
+
+    for i in range(points, data.shape[0] - points):
+        window = data.iloc[i - points : i + points + 1]
+        slope = np.polyfit(window["P_rel"], window["phi"], 1)[0]
+        assert math.isclose(frame["slopes"].iloc[i], slope, rel_tol=1e-8)
+    assert minima == b.eswminima
+    assert targetvalue == data.at[minima, "phi"]
+
+def test_getlocalextremum_missing_values():
+    # A point with a missing phi (here, a second row at zero pressure) is left out of the windows it is in, as smf.ols drops it,
+    # rather than making every later slope NaN.
+    b = BETAn("Argon", 87, 4, {"R2 cutoff": 0.9995, "R2 min": 0.998})
+    data = pd.read_table(
+        f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]
+    )
+    data = pd.concat([pd.DataFrame({"Pressure": [0.0, 0.0], "Loading": [0.0, 0.0]}), data], ignore_index=True)
+    data.loc[0, "Pressure"] = data["Pressure"].iloc[1] / 2 # As calculation_runner does for a zero pressure in the first row
+    data = b.prepdata(data)
+    assert data["phi"].isna().any()
+    points = 3
+    minima, targetvalue, frame = b.getlocalextremum(data, column="phi", x="P_rel", how="Minima", points=points)
+
+    for i in range(points, data.shape[0] - points):
+        window = data.iloc[i - points : i + points + 1].dropna(subset=["phi"])
+        slope = np.polyfit(window["P_rel"], window["phi"], 1)[0]
+        assert math.isclose(frame["slopes"].iloc[i], slope, rel_tol=1e-8)
+    assert b.eswminima == 29 # As found by the original, per-point smf.ols implementation.
+    assert b.picklen(data, method="BET+ESW") == (23, 32)
+
+def test_window_linregs_offset():
+    # Far from zero, sums over the whole array lose the spread of each window to cancellation. The windows are centered, so the fits
+    # match a two-pass fit and R² can be compared with R2 min as it is.
+    from SESAMI.SESAMI_1.regression import sliding_slopes, window_linregs
+
+    rng = np.random.default_rng(0)
+    x = 1e8 + np.cumsum(rng.random(40))
+    y = 3 * (x - 1e8) + 1e9 + rng.normal(scale=1e-2, size=40)
+    p = np.arange(0, 30)
+    q = p + 10
+    slope, intercept, r2 = window_linregs(x, y, p, q)
+    for k in range(len(p)):
+        dx = x[p[k]:q[k]] - x[p[k]:q[k]].mean()
+        dy = y[p[k]:q[k]] - y[p[k]:q[k]].mean()
+        assert math.isclose(slope[k], (dx * dy).sum() / (dx * dx).sum(), rel_tol=1e-9)
+        assert math.isclose(r2[k], (dx * dy).sum() ** 2 / ((dx * dx).sum() * (dy * dy).sum()), rel_tol=1e-12)
+        assert math.isclose(intercept[k] + slope[k] * x[p[k]:q[k]].mean(), y[p[k]:q[k]].mean(), rel_tol=1e-12) # The line goes through the means.
+    assert np.all(r2 <= 1)
+
+    slopes = sliding_slopes(x, y, 3)
+    for i in range(3, 37):
+        dx = x[i - 3 : i + 4] - x[i - 3 : i + 4].mean()
+        assert math.isclose(slopes[i], (dx * (y[i - 3 : i + 4] - y[i - 3 : i + 4].mean())).sum() / (dx * dx).sum(), rel_tol=1e-9)
+
+def test_picklen_r2():
+    # picklen only sends the regions whose vectorized R² passes R2 min to linregauto, without a tolerance, so the two must agree.
+    from SESAMI.SESAMI_1.betan import IsothermArrays
+
+    b = BETAn("Argon", 87, 4, {"R2 cutoff": 0.9995, "R2 min": 0.998})
+    data = b.prepdata(pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]))
+    isotherm = IsothermArrays.of(data)
+    p = np.arange(0, 30)
+    q = p + 8
+    kernel = b.linregwindows(p, q, isotherm)
+    for k in range(len(p)):
+        assert math.isclose(kernel["R2"][k], b.linregauto(p[k], q[k], isotherm).R2, rel_tol=1e-12)
+
+def test_linregauto_fit():
+    # linregauto returns a compact BETFit, works on read-only views of the isotherm, and does not change the isotherm.
+    from SESAMI.SESAMI_1.betan import BETFit, IsothermArrays
+
+    b = BETAn("Argon", 87, 4, {"R2 cutoff": 0.9995, "R2 min": 0.998})
+    data = b.prepdata(pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]))
+    before = data.copy()
+    isotherm = IsothermArrays.of(data)
+    assert not isotherm.P_rel.flags.writeable
+    assert np.shares_memory(isotherm.P_rel, data["P_rel"].to_numpy())
+
+    p, q = b.picklen(isotherm, method="BET")
+    assert (p, q) == b.picklen(data, method="BET")
+    fit = b.linregauto(p, q, isotherm)
+    assert isinstance(fit, BETFit) and not hasattr(fit, "__dict__")
+    assert fit.to_dict() == b.linregauto(p, q, data).to_dict()
+    assert math.isclose(fit.A_BET, 2430.9096636176737)
+    assert fit.f_pvalue < 0.99 and max(fit.t_pvalues) < 0.99 and fit.shapiro_pvalue > 0.01
+    pd.testing.assert_frame_equal(data, before)
+
+def test_qmbounds():
+    # The binary search over the points sorted by loading finds the same points as masks over all points.
+    from SESAMI.SESAMI_1.betan import IsothermArrays
+
+    rng = np.random.default_rng(0)
+    loading = np.round(rng.random(50) * 10, 1) # With ties.
+    loading[7] = np.nan
+    prel = rng.random(50)
+    isotherm = IsothermArrays(np.arange(50), prel, loading, prel, prel, prel, prel)
+    qm = np.concatenate([rng.random(30) * 12 - 1, [np.nan, np.inf, loading[0]]])
+
+    below = loading[None, :] <= qm[:, None]
+    above = loading[None, :] > qm[:, None]
+    def masked(values, mask, reduce, fill):
+        return np.where(mask.any(axis=1), reduce(np.where(mask, values, fill), axis=1), np.nan)
+    expected = [masked(loading, below, np.max, -np.inf), masked(loading, above, np.min, np.inf), masked(prel, below, np.max, -np.inf), masked(prel, above, np.min, np.inf)]
+    for bound, expected_bound in zip(isotherm.qmbounds(qm), expected):
+        assert np.array_equal(bound, expected_bound, equal_nan=True)
+
+def test_rendersummary():
+    # Plots made later from a summary computed without plots should give the same results as generatesummary with plots.
+    from SESAMI.SESAMI_1.betan import BETAn
+
+    user_options = dict(inputs[0][1], **{'font size': 10, 'dpi': 100.0, 'R2 cutoff': 0.9995, 'R2 min': 0.998})
+    b = BETAn("Argon", 87, 4, user_options)
+    data = pd.read_table(
+        f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]
+    )
+    data = b.prepdata(data)
+
+    BET_dict, BET_ESW_dict = b.generatesummary(data, user_options, MAIN_PATH, 'render', sumpath=f'{MAIN_PATH}user_test/', makeplots='No')
+    assert not os.path.exists(f'{MAIN_PATH}user_test/multiplot_render.png')
+    assert BET_dict == b.summary["BET_dict"]
+    assert BET_ESW_dict == b.summary["BET_ESW_dict"]
+
+    rendered_BET_dict, rendered_BET_ESW_dict = b.rendersummary(b.summary, user_options, MAIN_PATH, 'render', sumpath=f'{MAIN_PATH}user_test/')
+    assert rendered_BET_dict == BET_dict
+    assert rendered_BET_ESW_dict == BET_ESW_dict
+    for name in ['multiplot', 'isotherm', 'BETPlotLinear', 'BETPlot', 'ESWPlot', 'BETESWPlot']:
+        assert os.path.exists(f'{MAIN_PATH}user_test/{name}_render.png')
+        os.remove(f'{MAIN_PATH}user_test/{name}_render.png')
+
+def standalone_figures(b, summary, user_options):
+    # The individual figures as generatesummary used to save them: each drawn on its own pyplot figure at the default size, without a title.
+    import io
+    import matplotlib.pyplot as plt
+
+    bet_info, betesw_info, data = summary["bet_info"], summary["betesw_info"], summary["data"]
+    draw = {
+        'isotherm': lambda ax: b.makeisothermplot(user_options, ax, data, maketitle="No", with_fit="Yes", fit_data=[bet_info, betesw_info]),
+        'BETPlotLinear': lambda ax: b.makelinregplot(user_options, ax, bet_info[0][0], bet_info[0][1], data, maketitle="No"),
+        'BETPlot': lambda ax: b.makeconsistencyplot(user_options, ax, data, maketitle="No"),
+        'ESWPlot': lambda ax: b.makeeswplot(user_options, ax, data, maketitle="No", with_fit="Yes", fit_data=[bet_info, betesw_info]),
+        'BETESWPlot': lambda ax: b.makelinregplot(user_options, ax, betesw_info[0][0], betesw_info[0][1], data, maketitle="No"),
+    }
+    figures = {}
+    for name in ['isotherm', 'BETPlotLinear', 'BETPlot'] + (['ESWPlot', 'BETESWPlot'] if summary["scope"] != 'BET' else []):
+        fig = plt.figure()
+        draw[name](fig.add_subplot(111))
+        png = io.BytesIO()
+        fig.savefig(png, format="png", dpi=user_options["dpi"], bbox_inches="tight")
+        plt.close(fig)
+        png.seek(0)
+        figures[name] = plt.imread(png)
+    return figures
+
+@pytest.mark.parametrize("scope", ["BET and BET+ESW", "BET"])
+def test_rendersummary_uses_fits(monkeypatch, scope):
+    # The plots are drawn from the fits in the summary, without fitting the regions again.
+    # Each individual figure is drawn on a figure of its own, without a title, so nothing of the other panels of the multiplot shows in it,
+    # and nothing is cut off, even with the largest font size on the website and the legends on.
+    from SESAMI.SESAMI_1.betan import BETAn, useplotstyle
+    import matplotlib.pyplot as plt
+
+    user_options = dict(inputs[0][1], **{'font size': 20, 'legend': 'Yes', 'dpi': 72.0, 'R2 cutoff': 0.9995, 'R2 min': 0.998, 'scope': scope})
+    b = BETAn("Argon", 87, 4, user_options)
+    data = pd.read_table(
+        f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]
+    )
+    summary = b.computesummary(b.prepdata(data), user_options)
+    assert summary["bet_fit"].to_dict() == summary["BET_dict"]
+    useplotstyle(user_options)
+    expected = standalone_figures(b, summary, user_options)
+
+    def no_refit(*args):
+        raise AssertionError("The region was fit again.")
+    monkeypatch.setattr(b, "linregauto", no_refit)
+    b.rendersummary(summary, user_options, MAIN_PATH, 'fits', sumpath=f'{MAIN_PATH}user_test/')
+
+    os.remove(f'{MAIN_PATH}user_test/multiplot_fits.png')
+    for name, figure in expected.items():
+        panel = plt.imread(f'{MAIN_PATH}user_test/{name}_fits.png')
+        os.remove(f'{MAIN_PATH}user_test/{name}_fits.png')
+        assert np.array_equal(panel, figure), f"{name} differs from its own figure"
+
+def test_no_matplotlib_without_plots():
+    # Computing without plots should not import matplotlib at all.
+    code = (
+        "import sys\n"
+        "from SESAMI.SESAMI_1.SESAMI_1 import calculation_runner\n"
+        f"user_options = {inputs[0][1]!r}\n"
+        f"calculation_runner({MAIN_PATH!r}, user_options, 'test', 0, makeplots='No')\n"
+        "assert 'matplotlib' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=MAIN_PATH)
+
+def test_plotpayload():
+    # The plot data for interactive figures is strict JSON, matches the fits, and is made without matplotlib.
+    code = (
+        "import sys, json\n"
+        "from SESAMI.SESAMI_1.SESAMI_1 import calculation_summary\n"
+        f"user_options = {inputs[0][1]!r}\n"
+        f"b, summary = calculation_summary({MAIN_PATH!r}, user_options, 'test')\n"
+        "payload = b.plotpayload(summary)\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "print(json.dumps(payload, allow_nan=False))\n"
+        "print(json.dumps([summary['BET_dict'], summary['BET_ESW_dict'], summary['bet_info'][0]], default=int))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, cwd=MAIN_PATH, capture_output=True, text=True).stdout
+    payload, (BET_dict, BET_ESW_dict, rbet) = [json.loads(line) for line in output.splitlines()]
+
+    assert payload["scope"] == 'BET and BET+ESW'
+    n = len(payload["isotherm"]["P_rel"])
+    assert all(len(column) == n for column in payload["isotherm"].values())
+    assert payload["isotherm"]["P_rel"] == sorted(payload["isotherm"]["P_rel"])
+    assert payload["bet"]["indices"] == rbet
+    for region, results in [(payload["bet"], BET_dict), (payload["betesw"], BET_ESW_dict)]:
+        assert math.isclose(region["qm"], results["qm"]) and math.isclose(region["C"], results["C"])
+        assert len(region["linear"]["P_rel"]) == results["length_linear_region"]
+        assert len(region["fit_loading"]) == len(region["fit_phi"]) == n
+        assert region["P_rel"][0] < region["P_rel"][1]
+    assert payload["eswminima"] is not None and payload["con1limit"] is not None
+
+def test_figures_on_request():
+    # calculation_runner only saves the multiplot. The individual figures drawn on request match those generatesummary saves right away.
+    from SESAMI.SESAMI_1.figures import render_on_request
+    import matplotlib.pyplot as plt
+
+    names = ['isotherm', 'BETPlotLinear', 'BETPlot', 'ESWPlot', 'BETESWPlot']
+    user_options = dict(inputs[0][1], dpi='72')
+    calculation_runner(MAIN_PATH, dict(user_options), 'test', 'request')
+    assert os.path.exists(f'{MAIN_PATH}user_test/multiplot_request.png')
+    assert not any(os.path.exists(f'{MAIN_PATH}user_test/{name}_request.png') for name in names)
+    assert not render_on_request(f'{MAIN_PATH}user_test/input_request.png') # Not one of the figures.
+
+    b = BETAn("Argon", 87, 4, dict(user_options, **{'R2 cutoff': 0.9995, 'R2 min': 0.998, 'font size': 10, 'dpi': 72.0}))
+    data = b.prepdata(pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"]))
+    b.generatesummary(data, dict(user_options, **{'font size': 10, 'dpi': 72.0}), MAIN_PATH, 'foreground', sumpath=f'{MAIN_PATH}user_test/')
+
+    for name in names:
+        assert render_on_request(f'{MAIN_PATH}user_test/{name}_request.png')
+    for name in ['multiplot'] + names:
+        foreground = plt.imread(f'{MAIN_PATH}user_test/{name}_foreground.png')
+        assert np.array_equal(plt.imread(f'{MAIN_PATH}user_test/{name}_request.png'), foreground)
+        os.remove(f'{MAIN_PATH}user_test/{name}_request.png')
+        os.remove(f'{MAIN_PATH}user_test/{name}_foreground.png')
+    os.remove(f'{MAIN_PATH}user_test/panels_request.pickle')
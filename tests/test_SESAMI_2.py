@@ -1,6 +1,7 @@
 import os
 import pytest
 import shutil
+import pickle
 from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2_runner
 
 MAIN_PATH = os.path.abspath(".") + "/"
@@ -19,3 +20,117 @@ def test_SESAMI_2(MAIN_PATH, USER_ID):
 	prediction = calculation_v2_runner(MAIN_PATH, USER_ID)	
 
 	assert prediction == "2099.06" # Benchmark value on the right
+
+def test_model_registry(tmp_path):
+	from SESAMI.SESAMI_2.model_registry import ModelRegistry
+
+	model_path = tmp_path / "lasso_model.sav"
+	shutil.copyfile(f"{MAIN_PATH}SESAMI/SESAMI_2/lasso_model.sav", model_path)
+	registry = ModelRegistry(str(model_path))
+
+	# The model is loaded once, and reused.
+	lasso = registry.get()
+	assert registry.get() is lasso
+	assert registry.n_loads == 1
+
+	# A changed model file is picked up without restarting.
+	lasso.intercept_ += 1
+	with open(model_path, "wb") as f:
+		pickle.dump(lasso, f)
+	os.utime(model_path, ns=(0, 0))
+	reloaded = registry.get()
+	assert reloaded is not lasso
+	assert reloaded.intercept_ == lasso.intercept_
+	assert registry.n_loads == 2
+
+	# A broken model file is not used; the previous model is kept.
+	with open(model_path, "wb") as f:
+		f.write(b"not a model")
+	with pytest.warns(UserWarning, match="previous model is kept"):
+		assert registry.get() is reloaded
+
+	# Without a previous model to fall back on, the error is raised.
+	with open(model_path, "wb") as f:
+		pickle.dump({"not": "a model"}, f)
+	with pytest.raises(ValueError):
+		ModelRegistry(str(model_path)).get()
+
+def test_predict_many():
+	import numpy as np
+	import pandas as pd
+	from SESAMI.SESAMI_2.SESAMI_2 import ML, predict_many
+	from SESAMI.SESAMI_2.model_registry import get_lasso
+
+	data = pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"])
+	isotherms = pd.concat([
+		data.assign(name="example"),
+		data[data["Pressure"] > 1000].assign(name="no_low_pressure"), # Missing the low pressure bins
+	])
+
+	# The vectorized features match the ones made one column at a time.
+	my_ML = ML()
+	pressure_bins = my_ML.build_pressure_bins(5, 1e5, 7)
+	feature_list = ["c_%d" % i for i in range(7)]
+	col_list = feature_list + my_ML.generate_combine_feature_list(feature_list)
+	names, means, features = my_ML.feature_matrix(isotherms, pressure_bins)
+	expected = my_ML.add_features(pd.DataFrame({"name": ["example"]}), pressure_bins, feature_list, col_list, isotherm_data=data)
+	assert names == ["example", "no_low_pressure"]
+	assert np.allclose(features[0], expected[col_list].to_numpy()[0], rtol=1e-12)
+	assert np.isnan(features[1]).any()
+
+	predictions = predict_many(get_lasso(f"{MAIN_PATH}SESAMI/SESAMI_2/lasso_model.sav"), isotherms)
+	assert f"{predictions.loc['example', 'ML_prediction']:.2f}" == "2099.06"
+	assert np.isnan(predictions.loc["no_low_pressure", "ML_prediction"])
+	assert predictions.loc["no_low_pressure", "empty_bins"] == pressure_bins[1:4]
+
+def test_nitrogen_predictions():
+	# The website, the batch analysis, and predict_many scale the ML prediction for nitrogen the same way.
+	import pandas as pd
+	from SESAMI.SESAMI_2.SESAMI_2 import predict_many, scale_to_gas
+	from SESAMI.SESAMI_2.model_registry import get_lasso
+	from SESAMI.batch import analyze_isotherm
+	from SESAMI.calculation import run_calculation
+
+	data = pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"])
+	lasso = get_lasso(f"{MAIN_PATH}SESAMI/SESAMI_2/lasso_model.sav")
+	argon = predict_many(lasso, data.assign(name="example")).loc["example", "ML_prediction"]
+	nitrogen = predict_many(lasso, data.assign(name="example"), gas="Nitrogen").loc["example", "ML_prediction"]
+	assert nitrogen == scale_to_gas(argon, "Nitrogen") and scale_to_gas(argon, "Argon") == argon
+	assert f"{nitrogen:.2f}" == "2409.72"
+
+	options = {'R2 cutoff': '0.9995', 'R2 min': '0.998', 'gas': 'Nitrogen', 'scope': 'BET', 'ML': 'Yes', 'custom adsorbate': 'No', 'interactive plots': 'Yes'}
+	assert analyze_isotherm(data, options, lasso=lasso)["ML_prediction"] == pytest.approx(nitrogen, rel=1e-5) # calculation_v2 rounds to two decimals.
+	assert run_calculation(MAIN_PATH, options, 'test', 'nitrogen', isotherm_data=data)["ML_prediction"] == f"{nitrogen:.1f}"
+
+def test_named_features(tmp_path):
+	# A model fitted on a DataFrame gets the features as a DataFrame, so scikit-learn checks their names and order, and does not warn.
+	import warnings
+	import numpy as np
+	import pandas as pd
+	from sklearn.linear_model import Lasso
+	from SESAMI.SESAMI_2.SESAMI_2 import ML, calculation_v2, predict_many
+	from SESAMI.SESAMI_2.model_registry import FEATURE_NAMES, ModelRegistry
+
+	feature_list = ["c_%d" % i for i in range(7)]
+	assert FEATURE_NAMES == feature_list + ML().generate_combine_feature_list(feature_list)
+
+	rng = np.random.default_rng(0)
+	X = pd.DataFrame(rng.random((50, len(FEATURE_NAMES))), columns=FEATURE_NAMES)
+	lasso = Lasso(alpha=1e-3).fit(X, X.sum(axis=1))
+	model_path = tmp_path / "lasso_model.sav"
+	with open(model_path, "wb") as f:
+		pickle.dump(lasso, f)
+	lasso = ModelRegistry(str(model_path)).get()
+
+	data = pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"])
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		prediction = calculation_v2(lasso, isotherm_data=data)
+		assert f"{predict_many(lasso, data.assign(name='example')).loc['example', 'ML_prediction']:.2f}" == prediction
+
+	# A model whose features are in another order is not used.
+	lasso = Lasso(alpha=1e-3).fit(X[FEATURE_NAMES[::-1]], X.sum(axis=1))
+	with open(model_path, "wb") as f:
+		pickle.dump(lasso, f)
+	with pytest.raises(ValueError, match="features"):
+		ModelRegistry(str(model_path)).get()
@@ -0,0 +1,58 @@
+import io
+import os
+import numpy as np
+import pytest
+from SESAMI.aif import AIFError, read_aif
+from SESAMI.isotherm_cache import Isotherm
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def example_aif():
+	with open(f"{MAIN_PATH}example_input/example_loading_data.aif") as f:
+		return f.read()
+
+
+def test_read_aif():
+	with open(f"{MAIN_PATH}example_input/example_loading_data.aif") as f:
+		aif = read_aif(f)
+	assert len(aif.adsorption) == 51 and len(aif.desorption) == 3
+	assert aif.adsorptive == "Nitrogen" and aif.temperature == 77.3 and aif.p0 == 101860.98004799998
+	assert aif.items["_sample_material_id"] == "DUT-6"
+
+	pressure, loading = aif.isotherm()
+	assert pressure[:3].tolist() == [1.0, 5.0, 10.0]
+	assert loading[0] == 0.840516579 # mmol/g is mol/kg
+
+	# Units are converted to Pa and mol/kg.
+	content = example_aif().replace("_units_pressure Pa", "_units_pressure bar").replace("_units_loading mmol/g", "_units_loading 'cm³/g'")
+	converted_pressure, converted_loading = read_aif(io.StringIO(content)).isotherm()
+	assert np.array_equal(converted_pressure, pressure * 100000) and np.array_equal(converted_loading, loading * 0.044615)
+
+	# The isotherm can go to the isotherm cache without its text file being parsed: the text file has the same numbers.
+	isotherm = Isotherm.from_columns(["Pressure", "Loading"], converted_pressure, converted_loading)
+	parsed = Isotherm(isotherm.raw)
+	assert np.array_equal(parsed.pressure, isotherm.pressure) and np.array_equal(parsed.loading, isotherm.loading)
+	assert parsed.lines() == isotherm.lines() and parsed.header == isotherm.header
+
+
+@pytest.mark.parametrize("change, message", [
+	(("loop_", "lop_"), "Incorrectly formatted AIF file. Please"),
+	(("_adsorp_amount\n", "_adsorp_amount\n\n"), "Missing adsorption data"),
+	(("_units_loading mmol/g\n", ""), "Did not include units of loading"),
+	(("_units_pressure Pa", "_units_pressure psi"), "Invalid/unsupported pressure units"),
+	(("5 101860.98004799998 0.856914327", "5 101860.98004799998"), "Could not read line 21"),
+])
+def test_read_aif_errors(change, message):
+	aif = read_aif(io.StringIO(example_aif().replace(*change)))
+	with pytest.raises(AIFError, match=message):
+		aif.isotherm()
+
+
+def test_read_aif_many_loops():
+	# Loops of other data (and their order) do not matter. Only the branches are kept.
+	other_loop = "loop_\n_other_a\n_other_b\n" + "1 2\n" * 10000
+	content = example_aif().replace("loop_\n_adsorp_pressure\n_adsorp_p0\n_adsorp_amount", other_loop + "loop_\n_adsorp_amount\n_adsorp_p0\n_adsorp_pressure", 1)
+	aif = read_aif(io.StringIO(content))
+	assert len(aif.adsorption) == 51 and len(aif.desorption) == 3
+	assert aif.adsorption.pressure[0] == 0.840516579 # The columns are in the order the loop names them.
@@ -0,0 +1,65 @@
+import os
+import math
+import pytest
+from SESAMI.api import APIError, api_isotherm, api_options, api_result, read_request
+from SESAMI.calculation import run_analyses
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def example_arrays():
+	with open(f"{MAIN_PATH}example_input/example_input.txt") as f:
+		rows = [line.split("\t") for line in f.read().split("\n")[1:] if line]
+	return {"pressure": [float(row[0]) for row in rows], "loading": [float(row[1]) for row in rows]}
+
+
+def test_api_options():
+	options = api_options({"gas": "Nitrogen", "ML": False, "R2 cutoff": 0.999})
+	assert options["gas"] == "Nitrogen"
+	assert options["ML"] == "No"
+	assert options["R2 cutoff"] == 0.999
+	assert options["scope"] == "BET and BET+ESW"  # The default.
+
+	for options in ({"gas": "Helium"}, {"R2 min": "high"}, {"R2 min": True}, {"colour": "red"}, {"custom adsorbate": "Yes"}, []):
+		with pytest.raises(APIError):
+			api_options(options)
+
+
+def test_api_isotherm():
+	arrays = example_arrays()
+	item = api_isotherm("a", arrays)
+	assert item.valid
+	csv = "Pressure (Pa),Loading (mol/kg)\n" + "".join(f"{p},{q}\n" for p, q in zip(arrays["pressure"], arrays["loading"]))
+	assert api_isotherm("b", {"csv": csv}).isotherm.raw == item.isotherm.raw
+	assert api_isotherm("c", csv).valid
+
+	assert not api_isotherm("d", {"pressure": [1, 2, 3], "loading": [1, 2]}).valid
+	assert not api_isotherm("e", {"pressure": [1, math.nan], "loading": [1, 2]}).valid
+	assert not api_isotherm("f", {"pressure": [1, "2"], "loading": [1, 2]}).valid
+	with pytest.raises(APIError):
+		api_isotherm("g", {"pressure": [1, 2]})
+
+
+def test_read_request():
+	items, options, single = read_request({"isotherm": example_arrays(), "options": {"ML": "No"}})
+	assert single and len(items) == 1 and options["ML"] == "No"
+	items, options, single = read_request({"isotherms": [{"name": "x", **example_arrays()}, example_arrays()]})
+	assert not single and [item.name for item in items] == ["x", "1"]
+	for body in (None, [], {"isotherms": []}, {"options": {}}):
+		with pytest.raises(APIError):
+			read_request(body)
+
+
+def test_api_result():
+	items, options, single = read_request({"isotherms": [example_arrays(), {"pressure": [1], "loading": [1]}], "options": {"scope": "BET"}})
+	rows = run_analyses(MAIN_PATH, options, [items[0].isotherm.to_frame()])
+	result = api_result(items[0], rows[0])
+	assert result["status"] == "OK" and result["message"] is None
+	assert math.isclose(result["BET"]["A_BET"], 2430.9, abs_tol=0.1)
+	assert result["BET"]["con3"] in (True, False)
+	assert result["BET_ESW"] is None  # Only BET was asked for.
+	assert math.isclose(result["ML_prediction"], 2099.06, abs_tol=0.1)
+
+	result = api_result(items[1])
+	assert result["status"] == "invalid" and result["message"]
+	assert result["BET"] is None and result["ML_prediction"] is None
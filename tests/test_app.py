@@ -0,0 +1,156 @@
+import os
+import json
+import shutil
+import subprocess
+import time
+import pytest
+import app
+from SESAMI.jobs import JobQueue
+from SESAMI.SESAMI_1.figures import PanelRenderer
+from SESAMI.workspace import make_workspace
+
+MAIN_PATH = os.path.abspath(".") + "/"
+EXPERIMENTAL = f"{MAIN_PATH}paper/benchmarking/experimental isotherms/experimental_N2_77K_isotherms_SESAMI_web_format/"
+
+
+def page_function(name):
+	# The source of the JavaScript function name in index.html, so that the website's own code is tested.
+	with open(f"{MAIN_PATH}index.html") as f:
+		page = f.read()
+	start = page.index(f"function {name}(")
+	depth = 0
+	for end in range(page.index("{", start), len(page)):
+		depth += {"{": 1, "}": -1}.get(page[end], 0)
+		if depth == 0:
+			return page[start:end + 1]
+
+
+def run_page(script):
+	# Runs script in node, after the functions of index.html it uses, and returns what it prints as JSON.
+	functions = "\n".join(page_function(name) for name in ("CSVToArray", "check_passed"))
+	output = subprocess.run(["node", "-e", f"{functions}\n{script}"], capture_output=True, text=True, check=True).stdout
+	return json.loads(output)
+
+
+@pytest.fixture
+def client(monkeypatch):
+	monkeypatch.setattr(app, "WORKSPACE", make_workspace("memory", None, on_expire=app.ISOTHERM_CACHE.invalidate))
+	monkeypatch.setitem(app.app.config, "SESSION_COOKIE_SECURE", False) # The test client does not use HTTPS.
+	client = app.app.test_client()
+	client.get("/new_user")
+	return client
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is needed to run the JavaScript of index.html")
+@pytest.mark.parametrize("name", ["HKUST-1.csv", "Mg-MOF-74.csv"])
+def test_csv_upload_warning(client, name):
+	# As the website uploads a CSV: the file is read into rows by CSVToArray, the rows are saved, and the data are shown if the check passes.
+	with open(f"{EXPERIMENTAL}{name}") as f:
+		content = f.read()
+	rows = run_page(f"console.log(JSON.stringify(CSVToArray({json.dumps(content)}, ',')))")
+	assert client.post("/save_csv_txt", json={"my_content": rows}).status_code == 200
+
+	response = client.get("/check_csv").get_data(as_text=True)
+	assert response.startswith("Warning: ")
+	assert "do not always increase" in response
+	assert run_page(f"console.log(JSON.stringify(check_passed({json.dumps(response)})))")
+	assert client.get("/show_data").status_code == 200
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is needed to run the JavaScript of index.html")
+def test_check_passed(client):
+	header = ["Pressure (Pa)", "Loading (mol/kg)"]
+	cases = [
+		[header, ["1", "0.01"], ["10", "0.5"], ["100", "1"]], # All good
+		[header, ["1", "0.5"], ["10", "0.8"], ["5", "1"]], # Both the low pressure and the order warnings
+		[header, ["1", "0.01"], ["10", "abc"]], # Not a number
+	]
+	responses = []
+	for rows in cases:
+		client.post("/save_csv_txt", json={"my_content": rows})
+		responses.append(client.get("/check_csv").get_data(as_text=True))
+	assert responses[0] == "All good!"
+	assert responses[1].startswith("Warning: Lacking data at low pressure region.")
+	assert "do not always increase" in responses[1]
+	assert responses[1].count("You can still run calculations") == 1
+	assert run_page(f"console.log(JSON.stringify({json.dumps(responses)}.map(check_passed)))") == [True, True, False]
+
+
+@pytest.mark.parametrize("method, route, body", [
+	("post", "/save_csv_txt", {"my_content": [["Pressure", "Loading"], ["1", "0.01"]]}),
+	("post", "/save_aif_txt", {"my_content": ""}),
+	("get", "/copy_example", None),
+])
+def test_no_session(monkeypatch, method, route, body):
+	# A request without a session (e.g. from a page loaded before the server restarted) is turned away, and nothing is written.
+	monkeypatch.setattr(app, "WORKSPACE", make_workspace("memory", None, on_expire=app.ISOTHERM_CACHE.invalidate))
+	client = app.app.test_client()
+	response = getattr(client, method)(route, json=body)
+	assert response.status_code == 400
+	assert "Session is not initialized" in response.get_data(as_text=True)
+
+
+def test_api_timeout_cancels_jobs(monkeypatch):
+	# When the JSON API gives up waiting, the jobs of the request that have not started yet are cancelled, so that a retry does not wait behind them.
+	job_queue = JobQueue(max_workers=1, max_pending=4)
+	monkeypatch.setattr(app, "JOB_QUEUE", job_queue)
+	monkeypatch.setattr(app, "RUN_SESAMI_TIMEOUT", 0.1)
+	try:
+		busy = [job_queue.submit(time.sleep, 2) for _ in range(2)] # One running, and one waiting to be sent to the worker.
+		with open(f"{MAIN_PATH}example_input/example_input.txt") as f:
+			response = app.app.test_client().post("/api/v1/analyze", data=f.read().replace("\t", ","), content_type="text/csv")
+		assert response.status_code == 503 and response.headers["Retry-After"] == "30"
+		api_job = [job for job in job_queue.jobs.values() if job not in busy][0]
+		assert api_job.future.cancelled()
+		assert job_queue.room() == 2
+	finally:
+		job_queue.shutdown()
+
+
+def test_run_SESAMI_timeout(client, monkeypatch):
+	# When /run_SESAMI gives up waiting for a calculation that has not started, the calculation is cancelled, so that it does not take up room in the queue.
+	# A calculation that is asked for again while it is still queued or running is not queued twice.
+	job_queue = JobQueue(max_workers=1, max_pending=4)
+	monkeypatch.setattr(app, "JOB_QUEUE", job_queue)
+	monkeypatch.setattr(app, "RUN_SESAMI_TIMEOUT", 0.1)
+	options = {'dpi': '100', 'font size': '10', 'font type': 'sans-serif', 'legend': 'Yes', 'R2 cutoff': '0.9995', 'R2 min': '0.998',
+		'gas': 'Argon', 'scope': 'BET', 'ML': 'No', 'custom adsorbate': 'No'}
+	try:
+		busy = [job_queue.submit(time.sleep, 2) for _ in range(2)] # One running, and one waiting to be sent to the worker.
+		assert client.get("/copy_example").status_code == 200
+		response = client.post("/run_SESAMI", json=options)
+		assert response.status_code == 503 and "busy" in response.get_data(as_text=True)
+		cancelled = [job for job in job_queue.jobs.values() if job not in busy]
+		assert len(cancelled) == 1 and cancelled[0].future.cancelled()
+		assert job_queue.room() == 2
+
+		first = client.post("/jobs", json=options).get_json()
+		assert client.post("/jobs", json=options).get_json()["job_id"] == first["job_id"]
+		assert client.post("/jobs", json={**options, 'scope': 'BET and BET+ESW'}).get_json()["job_id"] != first["job_id"]
+		assert job_queue.room() == 0
+	finally:
+		job_queue.shutdown()
+
+
+def test_run_SESAMI_figures(client, monkeypatch):
+	# /run_SESAMI returns once the multiplot is saved. The individual figures are then drawn in the background, without being asked for.
+	job_queue = JobQueue(max_workers=1)
+	renderer = PanelRenderer(max_workers=2)
+	monkeypatch.setattr(app, "JOB_QUEUE", job_queue)
+	monkeypatch.setattr(app, "PANEL_RENDERER", renderer)
+	options = {'dpi': '72', 'font size': '10', 'font type': 'sans-serif', 'legend': 'Yes', 'R2 cutoff': '0.9995', 'R2 min': '0.998',
+		'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'No', 'custom adsorbate': 'No'}
+	try:
+		assert client.get("/copy_example").status_code == 200
+		assert client.post("/run_SESAMI", json=options).status_code == 200
+		assert client.get("/generated_plots/multiplot_0.png").status_code == 200
+	finally:
+		job_queue.shutdown()
+		renderer.shutdown()  # Waits for the figures that are being drawn.
+
+	def not_drawn_on_request(*args):
+		raise AssertionError("The figure was not drawn in the background.")
+	monkeypatch.setattr(renderer, "_submit", not_drawn_on_request)
+	for name in ["isotherm", "BETPlotLinear", "BETPlot", "ESWPlot", "BETESWPlot"]:
+		response = client.get(f"/generated_plots/{name}_0.png")
+		assert response.status_code == 200 and response.data.startswith(b"\x89PNG")
@@ -0,0 +1,106 @@
+import os
+import math
+import shutil
+import pytest
+import pandas as pd
+from SESAMI.batch import run_batch
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def test_run_batch(tmp_path):
+	source = tmp_path / "isotherms"
+	source.mkdir()
+	shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", source / "example.txt")
+	output = str(tmp_path / "results.csv")
+
+	n_done = run_batch(str(source), output, options={'gas': 'Argon', 'scope': 'BET and BET+ESW'}, processes=1)
+	assert n_done == 1
+
+	results = pd.read_csv(output)
+	row = results.iloc[0]
+	assert row['name'] == 'example.txt'
+	assert row['status'] == 'OK'
+	# Same values as the first test case of test_SESAMI_1.py, and the benchmark of test_SESAMI_2.py
+	assert math.isclose(row['BET_A_BET'], 2430.9096636176737, rel_tol=1e-6)
+	assert math.isclose(row['BETESW_A_BET'], 2346.7348679715333, rel_tol=1e-6)
+	assert row['BET_length_linear_region'] == 9
+	assert f"{row['ML_prediction']:.2f}" == "2099.06"
+
+	# A second run resumes from the output, and only analyzes the new isotherm.
+	shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", source / "example_2.txt")
+	n_done = run_batch(str(source), output, options={'gas': 'Argon', 'scope': 'BET', 'ML': 'No'}, processes=1)
+	assert n_done == 1
+
+	results = pd.read_csv(output)
+	assert list(results['name']) == ['example.txt', 'example_2.txt']
+	assert math.isnan(results.iloc[1]['BETESW_A_BET'])
+	assert math.isnan(results.iloc[1]['ML_prediction'])
+
+
+def test_run_batch_names(tmp_path):
+	# Files with the same name in different folders are different isotherms.
+	for folder in ("a", "b"):
+		(tmp_path / folder).mkdir()
+		shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", tmp_path / folder / "x.txt")
+	output = str(tmp_path / "results.csv")
+	options = {'gas': 'Argon', 'scope': 'BET', 'ML': 'No'}
+	assert run_batch(str(tmp_path / "a" / "x.txt"), output, options=options, processes=1) == 1
+	assert run_batch(str(tmp_path / "*" / "x.txt"), output, options=options, processes=1) == 2
+	assert list(pd.read_csv(output)['name']) == ['x.txt', 'a/x.txt', 'b/x.txt']
+	assert run_batch(str(tmp_path / "*" / "x.txt"), output, options=options, processes=1) == 0
+
+
+def test_run_batch_partial_row(tmp_path):
+	# A run that was stopped while writing a row leaves it partly written. The next run drops it and analyzes that isotherm again.
+	source = tmp_path / "isotherms"
+	source.mkdir()
+	for name in ("example", "example_2"):
+		shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", source / f"{name}.txt")
+	output = tmp_path / "results.csv"
+	options = {'gas': 'Argon', 'scope': 'BET', 'ML': 'No'}
+	assert run_batch(str(source), str(output), options=options, processes=1) == 2
+	complete = output.read_bytes()
+	output.write_bytes(complete[:-20])
+
+	assert run_batch(str(source), str(output), options=options, processes=1) == 1
+	results = pd.read_csv(output)
+	assert list(results['name']) == ['example.txt', 'example_2.txt']
+	assert list(results['status']) == ['OK', 'OK']
+	assert output.read_bytes() == complete
+
+	# A header that was cut off is written again.
+	output.write_bytes(complete[:10])
+	assert run_batch(str(source), str(output), options=options, processes=1) == 2
+	assert list(pd.read_csv(output)['name']) == ['example.txt', 'example_2.txt']
+
+
+def test_run_batch_parquet(tmp_path):
+	# Parquet input and output, on a pool of worker processes.
+	pytest.importorskip("pyarrow")
+	example = pd.read_csv(f"{MAIN_PATH}example_input/example_input.txt", sep="\t")
+	example.columns = ["Pressure", "Loading"]
+	source = str(tmp_path / "isotherms.parquet")
+	pd.concat([example.assign(name="example"), example.assign(name="example_2")]).to_parquet(source, index=False)
+	output = str(tmp_path / "results.parquet")
+
+	n_done = run_batch(source, output, options={'gas': 'Argon', 'scope': 'BET', 'ML': 'No'}, processes=2, flush_every=1)
+	assert n_done == 2
+
+	results = pd.read_parquet(output).sort_values("name")
+	assert list(results['name']) == ['example', 'example_2']
+	assert list(results['status']) == ['OK', 'OK']
+	assert all(math.isclose(area, 2430.9096636176737, rel_tol=1e-6) for area in results['BET_A_BET'])
+
+	# Nothing is left to analyze when the run is repeated.
+	assert run_batch(source, output, options={'gas': 'Argon', 'scope': 'BET', 'ML': 'No'}, processes=2) == 0
+
+
+def test_run_batch_without_parquet(tmp_path, monkeypatch):
+	# Without a Parquet engine, the batch stops before any isotherm is analyzed.
+	def no_engine(engine):
+		raise ImportError("no engine")
+	monkeypatch.setattr(pd.io.parquet, "get_engine", no_engine)
+	with pytest.raises(ImportError, match="pyarrow"):
+		run_batch(f"{MAIN_PATH}example_input/example_input.txt", str(tmp_path / "results.parquet"), processes=1)
+	assert not (tmp_path / "results.parquet").exists()
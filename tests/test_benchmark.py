@@ -0,0 +1,24 @@
+import copy
+from SESAMI.benchmark import STAGES, benchmark_isotherms, run_benchmarks, compare, format_report
+
+
+def test_benchmark():
+	isotherms = benchmark_isotherms(sizes=[200], pattern="synthetic/*")
+	assert [(name, len(data)) for name, gas, data in isotherms] == [("synthetic/200", 200)]
+
+	run = run_benchmarks(isotherms, repeat=1, makeplots=False)
+	stages = run["results"]["synthetic/200"]
+	assert list(stages) == [stage for stage in STAGES if stage != "saveimgsummary"]
+	for result in stages.values():
+		assert result["time"] > 0 and result["peak_memory"] > 0
+
+	# Compared to itself, nothing regressed.
+	assert not any(row["regression"] for row in compare(run, run))
+
+	# A baseline in which picklen was twice as fast and used half the memory.
+	baseline = copy.deepcopy(run)
+	baseline["results"]["synthetic/200"]["picklen"]["time"] /= 2
+	baseline["results"]["synthetic/200"]["picklen"]["peak_memory"] //= 2
+	rows = compare(run, baseline, min_time=0, min_memory=0)
+	assert [(row["stage"], row["regression"]) for row in rows if row["regression"]] == [("picklen", ["time", "memory"])]
+	assert "REGRESSION (time, memory)" in format_report(run, rows)
@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from bson import json_util
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+from SESAMI.donations import DonationWriter, DUPLICATE_KEY
+
+
+class StandInCollection:
+	# Stores documents like a MongoDB collection with insert_many. While down is set, writes fail as if the server could not be reached.
+	def __init__(self):
+		self.documents = {}
+		self.batches = []
+		self.down = False
+		self.invalid = set() # Names of documents that fail validation, which are never stored.
+		self.release = threading.Event()
+		self.release.set()
+
+	def insert_many(self, documents, ordered=True):
+		self.release.wait()
+		if self.down:
+			raise ServerSelectionTimeoutError("No servers found")
+		errors = []
+		for i, document in enumerate(documents):
+			if document.get("name") in self.invalid:
+				errors.append({"index": i, "code": 121, "errmsg": "Document failed validation"})
+			elif document["_id"] in self.documents:
+				errors.append({"index": i, "code": DUPLICATE_KEY})
+			else:
+				self.documents[document["_id"]] = dict(document)
+		self.batches.append(len(documents))
+		if errors:
+			raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+
+
+def test_donation_writer_batches(tmp_path):
+	collection = StandInCollection()
+	writer = DonationWriter(collection, str(tmp_path), batch_wait=0.2)
+	collection.release.clear() # submit must not wait for the database.
+	for i in range(5):
+		writer.submit({"name": f"user {i}"})
+	collection.release.set()
+	assert writer.flush(timeout=10)
+	assert sorted(document["name"] for document in collection.documents.values()) == [f"user {i}" for i in range(5)]
+	assert sum(collection.batches) == 5 and len(collection.batches) <= 2
+
+	# A document written again (e.g. when the reply to an earlier write was lost) is not stored twice.
+	document = next(iter(collection.documents.values()))
+	writer.submit(dict(document))
+	writer.submit({"name": "user 5"})
+	assert writer.flush(timeout=10)
+	assert len(collection.documents) == 6
+	writer.close()
+
+
+def test_donation_writer_spool(tmp_path):
+	collection = StandInCollection()
+	collection.down = True
+	writer = DonationWriter(collection, str(tmp_path), batch_wait=0.05, retries=2, backoff=0.01, spool_retry=0.2)
+	writer.submit({"name": "user 0"})
+	writer.submit({"name": "user 1"})
+	assert writer.flush(timeout=10)
+	assert writer.spooled == 2 and collection.documents == {}
+	assert len([name for name in os.listdir(tmp_path) if name.endswith(".json")]) == 1
+
+	# Once the database is back (and spool_retry has passed), the spooled documents are written along with the new ones.
+	collection.down = False
+	time.sleep(0.3)
+	writer.submit({"name": "user 2"})
+	assert writer.flush(timeout=10)
+	writer.close()
+	assert os.listdir(tmp_path) == []
+	assert sorted(document["name"] for document in collection.documents.values()) == ["user 0", "user 1", "user 2"]
+
+	# Documents that could not be written before a restart are written by the next DonationWriter.
+	collection.down = True
+	writer = DonationWriter(collection, str(tmp_path), batch_wait=0.05, retries=0, spool_retry=0.2)
+	writer.submit({"name": "user 3"})
+	writer.close()
+	collection.down = False
+	DonationWriter(collection, str(tmp_path)).close()
+	assert os.listdir(tmp_path) == []
+	assert len(collection.documents) == 4
+
+
+def test_donation_writer_rejected(tmp_path):
+	# A document the database rejects is set aside, and does not hold up the documents written with it or after it, also when spooled.
+	collection = StandInCollection()
+	collection.invalid.add("bad")
+	collection.down = True
+	writer = DonationWriter(collection, str(tmp_path), batch_wait=0.05, retries=0, spool_retry=0.2)
+	writer.submit({"name": "bad"})
+	writer.submit({"name": "user 0"})
+	assert writer.flush(timeout=10)
+	assert writer.spooled == 2
+
+	collection.down = False
+	time.sleep(0.3)
+	writer.submit({"name": "user 1"})
+	assert writer.flush(timeout=10)
+	writer.submit({"name": "bad"})
+	writer.submit({"name": "user 2"})
+	assert writer.flush(timeout=10)
+	writer.close()
+	assert sorted(document["name"] for document in collection.documents.values()) == ["user 0", "user 1", "user 2"]
+	assert writer.written == 3 and writer.rejected == 2
+	assert os.listdir(tmp_path) == ["rejected"] # Nothing is left to write.
+
+	rejected = []
+	for name in os.listdir(tmp_path / "rejected"):
+		with open(tmp_path / "rejected" / name) as f:
+			rejected += json_util.loads(f.read())
+	assert [entry["document"]["name"] for entry in rejected] == ["bad", "bad"]
+	assert all(entry["error"]["code"] == 121 for entry in rejected)
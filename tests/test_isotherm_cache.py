@@ -0,0 +1,92 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from SESAMI.isotherm_cache import Isotherm, IsothermCache
+from SESAMI.SESAMI_1.SESAMI_1 import read_isotherm
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def test_isotherm_cache(tmp_path):
+	path = tmp_path / "input.txt"
+	shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", path)
+	cache = IsothermCache()
+
+	isotherm = cache.get('user', path)
+	assert cache.get('user', path) is isotherm # Parsed once
+	assert (cache.hits, cache.misses) == (1, 1)
+
+	pd.testing.assert_frame_equal(isotherm.to_frame(), read_isotherm(path).astype(float)) # The numbers are always read as floats.
+	assert isotherm.header == ["Pressure (Pa)", "Loading (mol/kg)"]
+	assert isotherm.n_columns == 2 and isotherm.numeric and not isotherm.has_nan
+	with open(path) as f:
+		assert isotherm.lines() == f.readlines()
+
+	# A changed file is parsed again.
+	with open(path, "a") as f:
+		f.write("100000\tabc\n")
+	changed = cache.get('user', path)
+	assert changed is not isotherm
+	assert not changed.numeric and changed.loading is None
+
+
+def test_isotherm_cache_memory_cap(tmp_path):
+	paths = []
+	for i in range(3):
+		paths.append(tmp_path / f"input_{i}.txt")
+		shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", paths[-1])
+
+	one_size = IsothermCache().get('user', paths[0]).nbytes
+	cache = IsothermCache(max_bytes=2 * one_size)
+	for i, path in enumerate(paths):
+		cache.get(i, path)
+	assert list(cache.entries) == [1, 2] # The least recently used isotherm was evicted.
+	assert cache.nbytes == 2 * one_size
+
+	cache.invalidate(1)
+	assert list(cache.entries) == [2]
+	assert np.array_equal(cache.get(2, paths[2]).pressure, read_isotherm(paths[2])["Pressure"])
+
+
+def test_isotherm_from_rows():
+	with open(f"{MAIN_PATH}example_input/example_input.txt") as f:
+		rows = [line.split("\t") for line in f.read().split("\n")]
+	rows[0] = ["Pressure (Pa)", "Loading (mol/kg)"]
+	header = rows[0]
+	# The rows, and the pressures and loadings they hold, or what check reports.
+	cases = [
+		([header, ["1", "2"], ["10", "3"]], [[1.0, 10.0], [2.0, 3.0]]),
+		([["Pressure", "Loading"], ["1e3", "-2.5E-1"], [" 7 ", "+8."], ["1_000", "\u0661"]], [[1e3, 7.0, 1e3], [-0.25, 8.0, 1.0]]), # As float() reads them
+		([header, ["1", "2"], [], ["", " "], ["10", "3"]], [[1.0, 10.0], [2.0, 3.0]]), # Empty rows are skipped.
+		([header, ["1", "2"], ["10", ""]], "The CSV cannot have any empty cells"),
+		([header, ["1", "2"], ["10"]], "The CSV cannot have any empty cells"), # A short row
+		([header, ["1", "2", "3"], ["10", "3", "4"]], "Wrong number of columns"),
+		([header, ["1", "2"], ["10", "NA"]], "The CSV must contain numbers only"),
+		([header, ["1", "2"], ["10", "abc"]], "The CSV must contain numbers only"),
+		([header, ["1", "2"], ["10", "nan"]], "The CSV must contain numbers only"), # Only finite numbers
+		([header, ["1", "2"], ["1e999", "3"]], "The CSV must contain numbers only"),
+		([header, ["1", "2"], ["0x10", "3"]], "The CSV must contain numbers only"),
+	]
+	for case, expected in cases:
+		isotherm = Isotherm.from_rows(case)
+		parsed = Isotherm(isotherm.raw) # As read from input.txt
+		assert isotherm.digest == parsed.digest
+		for name in ("header", "n_columns", "numeric", "has_nan", "nbytes"):
+			assert getattr(isotherm, name) == getattr(parsed, name), (case, name)
+		if isinstance(expected, str):
+			assert isotherm.check().startswith(expected), case
+			continue
+		for result in (isotherm, parsed):
+			assert result.pressure.dtype == result.loading.dtype == np.float64
+			assert result.pressure.tolist() == expected[0] and result.loading.tolist() == expected[1], case
+
+	example = Isotherm.from_rows(rows) # The example, with the blank last line.
+	assert example.check() == "All good!"
+	np.testing.assert_array_equal(example.to_frame(), read_isotherm(f"{MAIN_PATH}example_input/example_input.txt"))
+	assert Isotherm(b"\xef\xbb\xbfPressure (Pa)\tLoading (mol/kg)\r\n1\t2\r\n").header == header # A byte order mark, and \r\n
+	assert Isotherm(b"Pressure (Pa)\tLoading (mol/kg)\n1\t\xff\n").check().startswith("The CSV must contain numbers only")
+
+	assert Isotherm.from_rows([rows[0]]).check().startswith("Wrong number of columns")
+	assert Isotherm.from_rows([header, ["1", "0.01"], ["1", "0.5"], ["10", "1"]]).check().startswith("Warning: Some pressures appear more than once")
+	assert Isotherm.from_rows([header, ["1", "0.01"], ["10", "0.5"], ["5", "1"]]).check().startswith("Warning: The pressures in the CSV do not always increase")
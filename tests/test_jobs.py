@@ -0,0 +1,125 @@
+import os
+import math
+import time
+import shutil
+import pytest
+from concurrent.futures import CancelledError
+from SESAMI.jobs import JobQueue, QueueFull
+from SESAMI.metrics import Registry
+from SESAMI.calculation import run_calculation, warm_up
+from SESAMI.SESAMI_1.SESAMI_1 import read_isotherm
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+@pytest.fixture
+def job_queue():
+	job_queue = JobQueue(max_workers=1, max_pending=2)
+	yield job_queue
+	job_queue.shutdown()
+
+
+def test_job_queue(job_queue):
+	job = job_queue.submit(pow, 2, 10, owner='user')
+	assert job.result(timeout=60) == 1024
+
+	info = job.info()
+	assert info['status'] == 'done'
+	assert info['result'] == 1024
+	assert info['queue_time'] >= 0 and info['run_time'] >= 0
+	assert job_queue.get(job.id, owner='user') is job
+	assert job_queue.get(job.id, owner='someone else') is None
+
+	# Errors in the calculation are reported, not raised.
+	job = job_queue.submit(math.sqrt, -1)
+	with pytest.raises(ValueError):
+		job.result(timeout=60)
+	assert job.info()['status'] == 'failed'
+	assert 'math domain error' in job.info()['error']
+
+
+def test_job_queue_bounded(job_queue):
+	jobs = [job_queue.submit(time.sleep, 1) for _ in range(2)]
+	with pytest.raises(QueueFull):
+		job_queue.submit(time.sleep, 1)
+	assert jobs[1].info()['status'] in ('queued', 'running')
+
+	for job in jobs:
+		job.result(timeout=60)
+	job_queue.submit(pow, 2, 2).result(timeout=60) # There is room again.
+
+
+def test_run_calculation_job(job_queue):
+	if not os.path.exists(f'{MAIN_PATH}user_test'):
+		os.mkdir(f'{MAIN_PATH}user_test')
+	shutil.copyfile(f"{MAIN_PATH}example_input/example_input.txt", f'{MAIN_PATH}user_test/input.txt')
+	user_options = {'dpi': '100', 'font size': '10', 'font type': 'sans-serif', 'legend': 'Yes', 'R2 cutoff': '0.9995', 'R2 min': '0.998',
+		'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'Yes', 'custom adsorbate': 'No'}
+
+	job = job_queue.submit(run_calculation, MAIN_PATH, user_options, 'test', 'job', owner='test')
+	results = job.result(timeout=120)
+
+	assert results['ML_prediction'] == '2099.1'
+	assert 'BET area = 2430.9 m2sup/g' in results['BET_analysis']
+	assert results['plot_number'] == 'job'
+	assert os.path.exists(f'{MAIN_PATH}user_test/multiplot_job.png')
+
+
+def test_job_on_result(job_queue):
+	# on_result runs once, in this process, and its return value is the job's result.
+	calls = []
+	job = job_queue.submit(pow, 2, 10, on_result=lambda value: calls.append(value) or value + 1)
+	assert job.result(timeout=60) == 1025
+	assert job.info()['result'] == 1025
+	assert calls == [1024]
+
+
+def test_job_on_result_fails(job_queue):
+	# If on_result fails, it is not run again (e.g. storing the files twice) when the job is polled; the job reports the error as failed.
+	calls = []
+	def store(value):
+		calls.append(value)
+		raise OSError("disk full")
+	job = job_queue.submit(pow, 2, 10, on_result=store)
+	for _ in range(3):
+		with pytest.raises(OSError, match="disk full"):
+			job.result(timeout=60)
+		info = job.info()
+		assert info['status'] == 'failed' and info['error'] == 'OSError: disk full' and 'result' not in info
+	assert calls == [1024]
+
+
+def test_job_cancelled():
+	registry = Registry()
+	job_queue = JobQueue(max_workers=1, max_pending=4, metrics=registry)
+	try:
+		jobs = [job_queue.submit(time.sleep, 0.5) for _ in range(4)]
+		assert jobs[-1].future.cancel() # Still waiting behind the others.
+		info = jobs[-1].info()
+		assert info['status'] == 'cancelled' and 'cancelled' in info['error']
+		assert jobs[-1].recording() is None
+		with pytest.raises(CancelledError):
+			jobs[-1].result()
+		for job in jobs[:-1]:
+			job.result(timeout=60)
+		assert 'sesami_cancelled_calculations_total 1' in registry.prometheus()
+	finally:
+		job_queue.shutdown()
+
+
+def test_shared_result_cache(tmp_path):
+	# The workers share the result cache set up by warm_up, so a rerun finds the results whichever worker it lands on. The hits and misses reach /metrics.
+	registry = Registry()
+	job_queue = JobQueue(max_workers=2, max_pending=4, initializer=warm_up, initargs=(MAIN_PATH, f"sqlite:{tmp_path}/results.sqlite"), metrics=registry)
+	data = read_isotherm(f"{MAIN_PATH}example_input/example_input.txt")
+	user_options = {'R2 cutoff': '0.9995', 'R2 min': '0.998', 'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'Yes', 'custom adsorbate': 'No',
+		'interactive plots': 'Yes'}
+	try:
+		for i in range(4):
+			results = job_queue.submit(run_calculation, MAIN_PATH, user_options, 'test', f'shared_{i}', data).result(timeout=120)
+			assert results['ML_prediction'] == '2099.1'
+	finally:
+		job_queue.shutdown()
+	metrics = registry.prometheus()
+	assert 'sesami_result_cache_misses_total 2' in metrics # SESAMI 1 and SESAMI 2, the first time only.
+	assert 'sesami_result_cache_hits_total 6' in metrics
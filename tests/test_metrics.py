@@ -0,0 +1,67 @@
+import os
+import pickle
+import pandas as pd
+from SESAMI.metrics import NO_STAGE, Recording, Registry, count, recording, stage
+from SESAMI.jobs import JobQueue
+from SESAMI.SESAMI_1.SESAMI_1 import calculation_summary
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def test_nothing_recorded():
+	# Outside of recording, stage and count do nothing.
+	assert stage("prepdata") is NO_STAGE
+	count("candidate_windows", 10)
+	with recording() as stages:
+		pass
+	assert stages.stages == {} and stages.counts == {}
+
+
+def test_calculation_stages():
+	user_options = {'R2 cutoff': '0.9995', 'R2 min': '0.998', 'gas': 'Argon', 'scope': 'BET and BET+ESW', 'custom adsorbate': 'No'}
+	data = pd.read_table(f"{MAIN_PATH}example_input/example_input.txt", skiprows=1, sep="\t", names=["Pressure", "Loading"])
+	with recording() as stages:
+		b, summary = calculation_summary(MAIN_PATH, user_options, 'test', isotherm_data=data)
+	assert summary["status"] == "OK"
+	assert list(stages.stages) == ["con1limit", "eswminima", "prepdata", "picklen_bet", "picklen_betesw", "computesummary"]
+	assert stages.stages["prepdata"] >= stages.stages["con1limit"] + stages.stages["eswminima"]
+	assert stages.counts["candidate_windows"] >= stages.counts["candidate_fits"] > 0
+
+	# A Recording goes back from the worker process with the result.
+	copy = pickle.loads(pickle.dumps(stages))
+	assert copy.stages == stages.stages and copy.counts == stages.counts
+	assert copy.server_timing().startswith("con1limit;dur=")
+
+
+def test_registry():
+	registry = Registry(buckets=(0.1, 1))
+	registry.observe(Recording({"queue": 0.05, "run": 2.0}, {"figure_bytes": 100}))
+	registry.observe(Recording({"queue": 0.5}, {"figure_bytes": 50}))
+	text = registry.prometheus()
+	assert 'sesami_stage_seconds_bucket{stage="queue",le="0.1"} 1\n' in text
+	assert 'sesami_stage_seconds_bucket{stage="queue",le="1"} 2\n' in text
+	assert 'sesami_stage_seconds_bucket{stage="run",le="+Inf"} 1\n' in text
+	assert 'sesami_stage_seconds_sum{stage="queue"} 0.55\n' in text
+	assert 'sesami_stage_seconds_count{stage="queue"} 2\n' in text
+	assert "sesami_figure_bytes_total 150\n" in text
+
+
+def test_job_queue_metrics():
+	registry = Registry()
+	job_queue = JobQueue(max_workers=1, metrics=registry)
+	try:
+		job = job_queue.submit(pow, 2, 10, on_result=lambda value: value + 1)
+		assert job.result(timeout=60) == 1025
+		assert list(job.recording().stages) == ["queue", "run", "on_result"]
+		job.info()
+	finally:
+		job_queue.shutdown()
+	assert 'sesami_stage_seconds_count{stage="run"} 1\n' in registry.prometheus()
+
+	# Without a registry, nothing is recorded.
+	job_queue = JobQueue(max_workers=1)
+	try:
+		job = job_queue.submit(pow, 2, 10)
+		assert job.result(timeout=60) == 1024 and job.recording() is None
+	finally:
+		job_queue.shutdown()
@@ -0,0 +1,57 @@
+import os
+import json
+import time
+import pstats
+import pytest
+from SESAMI.profiling import Profiler, make_profiler
+
+
+def busy(seconds):
+	# Keeps the interpreter busy for a while, so that the sampler sees this function.
+	total = 0
+	deadline = time.perf_counter() + seconds
+	while time.perf_counter() < deadline:
+		for i in range(1000):
+			total += i
+	return total
+
+
+def test_slow_calculations_are_saved(tmp_path):
+	profiler = Profiler(str(tmp_path), threshold=0.05, keep=2)
+	assert profiler.call({"isotherm": "fast"}, None, pow, 2, 10) == 1024
+	assert profiler.profiles() == [] # Not slow enough.
+
+	assert profiler.call({"isotherm": "abc", "options": {"gas": "Argon"}}, b"Pressure\tLoading\n1\t2\n", busy, 0.2) > 0
+	[path] = profiler.profiles()
+	with open(path) as f:
+		info = json.load(f)
+	assert info["options"] == {"gas": "Argon"} and info["seconds"] > 0.05 and info["error"] is None and info["profiler"] == "sample"
+	stem = path[:-len(".json")]
+	assert os.path.basename(stem).endswith("_abc")
+	with open(f"{stem}.txt", "rb") as f:
+		assert f.read() == b"Pressure\tLoading\n1\t2\n"
+	with open(f"{stem}.folded") as f:
+		folded = f.read()
+	assert "busy (test_profiling.py:" in folded
+	assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.splitlines())
+
+	# Failed calculations are saved too. Only the newest profiles are kept.
+	with pytest.raises(ZeroDivisionError):
+		profiler.call({"isotherm": "failed"}, None, lambda: busy(0.1) / 0)
+	profiler.call({"isotherm": "newest"}, None, busy, 0.1)
+	paths = profiler.profiles()
+	assert [os.path.basename(path).split("_")[1] for path in paths] == ["failed.json", "newest.json"]
+	assert len(os.listdir(tmp_path)) == 4 # The .txt of the oldest profile is gone as well.
+	with open(paths[0]) as f:
+		assert json.load(f)["error"].startswith("ZeroDivisionError")
+
+
+def test_cprofile(tmp_path):
+	profiler = make_profiler("cprofile:0", str(tmp_path))
+	profiler.call({"isotherm": "abc"}, None, busy, 0.01)
+	[path] = profiler.profiles()
+	stats = pstats.Stats(path[:-len(".json")] + ".prof")
+	assert any(function == "busy" for _, _, function in stats.stats)
+
+	assert make_profiler("off", str(tmp_path)) is None
+	assert make_profiler("sample", str(tmp_path)).threshold == 10
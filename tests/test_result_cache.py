@@ -0,0 +1,73 @@
+import os
+import pytest
+from SESAMI.result_cache import MemoryBackend, SQLiteBackend, ResultCache, COMPUTE_OPTIONS, canonical_options, isotherm_digest, result_key
+from SESAMI.SESAMI_1.SESAMI_1 import calculation_runner, read_isotherm
+from SESAMI.SESAMI_1.figures import render_on_request
+from SESAMI.SESAMI_2.SESAMI_2 import calculation_v2_runner
+from SESAMI.metrics import recording
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+OPTIONS = {'dpi': '72', 'font size': '12', 'font type': 'DejaVu Sans', 'legend': 'Yes', 'R2 cutoff': '0.9995', 'R2 min': '0.998', 'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'Yes', 'custom adsorbate': 'No'}
+
+
+@pytest.mark.parametrize("make_backend", [lambda tmp_path: MemoryBackend(max_entries=2), lambda tmp_path: SQLiteBackend(str(tmp_path / "results.sqlite"), max_entries=2)])
+def test_result_cache_backends(tmp_path, make_backend):
+	cache = ResultCache(make_backend(tmp_path))
+	assert cache.get('a') is None
+	cache.set('a', {'A_BET': 1.0})
+	cache.set('b', {'A_BET': 2.0})
+	assert cache.get('a') == {'A_BET': 1.0}
+	assert cache.get('a') is not cache.get('a') # Every hit is a new copy.
+	assert (cache.hits, cache.misses) == (3, 1)
+
+	cache.set('c', {'A_BET': 3.0}) # Evicts b, the least recently used result.
+	assert len(cache.backend) == 2
+	assert cache.get('b') is None and cache.get('c') == {'A_BET': 3.0}
+
+
+def test_result_key():
+	data = read_isotherm(f"{MAIN_PATH}example_input/example_input.txt")
+	digest = isotherm_digest(data)
+	assert isotherm_digest(data.astype(float)) == digest # Same numbers, same isotherm.
+
+	key = result_key("SESAMI 1", digest, canonical_options(OPTIONS, COMPUTE_OPTIONS))
+	assert key == result_key("SESAMI 1", digest, canonical_options(dict(OPTIONS, dpi='300', **{'R2 cutoff': 0.9995}), COMPUTE_OPTIONS))
+	assert key != result_key("SESAMI 1", digest, canonical_options(dict(OPTIONS, scope='BET'), COMPUTE_OPTIONS))
+	assert key != result_key("SESAMI 2", digest, canonical_options(OPTIONS, COMPUTE_OPTIONS))
+
+
+def test_calculation_runner_cache():
+	os.makedirs(f"{MAIN_PATH}user_test", exist_ok=True)
+	if os.path.exists(f"{MAIN_PATH}user_test/rendered.json"):
+		os.remove(f"{MAIN_PATH}user_test/rendered.json")
+	data = read_isotherm(f"{MAIN_PATH}example_input/example_input.txt")
+	cache = ResultCache()
+
+	first = calculation_runner(MAIN_PATH, dict(OPTIONS), 'test', 'cache_0', isotherm_data=data, result_cache=cache)
+	second = calculation_runner(MAIN_PATH, dict(OPTIONS), 'test', 'cache_1', isotherm_data=data, result_cache=cache)
+	assert (cache.hits, cache.misses) == (1, 1)
+	assert first == second
+	assert first[0]['A_BET'] == pytest.approx(2430.9096636176737)
+
+	# The same figures were copied to the new plot number, instead of drawn again.
+	for name in ["multiplot", "isotherm", "BETPlotLinear", "BETPlot", "ESWPlot", "BETESWPlot"]:
+		assert render_on_request(f"{MAIN_PATH}user_test/{name}_cache_0.png") and render_on_request(f"{MAIN_PATH}user_test/{name}_cache_1.png")
+		with open(f"{MAIN_PATH}user_test/{name}_cache_0.png", "rb") as f0, open(f"{MAIN_PATH}user_test/{name}_cache_1.png", "rb") as f1:
+			assert f0.read() == f1.read()
+
+	# The ML prediction is cached too.
+	prediction = calculation_v2_runner(MAIN_PATH, 'test', isotherm_data=data, result_cache=cache)
+	assert calculation_v2_runner(MAIN_PATH, 'test', isotherm_data=data, result_cache=cache) == prediction
+	assert (cache.hits, cache.misses) == (2, 2)
+	assert prediction == "2099.06"
+
+
+def test_result_cache_metrics():
+	# Hits and misses are counted in the Recording of the calculation, which the web server adds to /metrics.
+	cache = ResultCache()
+	with recording() as stages:
+		cache.get('a')
+		cache.set('a', 1)
+		cache.get('a')
+	assert stages.counts == {'result_cache_misses': 1, 'result_cache_hits': 1}
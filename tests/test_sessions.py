@@ -0,0 +1,30 @@
+import os
+import time
+from SESAMI.sessions import SessionStore
+
+
+def test_session_expiry(tmp_path):
+	# A folder from before a restart is picked up by the janitor, with its modification time as last use.
+	os.makedirs(tmp_path / "user_old")
+	os.utime(tmp_path / "user_old", (time.time() - 100, time.time() - 100))
+	expired = []
+	store = SessionStore(str(tmp_path), max_age=50, interval=3600, batch_size=2, on_expire=expired.append)
+	for _ in range(100):
+		if expired:
+			break
+		time.sleep(0.05)
+	assert expired == ["old"] and not os.path.exists(tmp_path / "user_old")
+
+	now = time.time()
+	for i in range(5):
+		assert store.create(str(i)) == store.path(str(i))
+	store.touch("0", when=now + 40) # Used since; kept for another max_age.
+	assert store.expire(now=now + 30) == 0
+	# Expired sessions are removed at most batch_size at a time.
+	assert store.expire(now=now + 60) == 2
+	assert store.expire(now=now + 60) == 2
+	assert store.expire(now=now + 60) == 0
+	assert sorted(os.listdir(tmp_path)) == ["user_0"]
+	assert store.expire(now=now + 100) == 1
+	assert os.listdir(tmp_path) == [] and store.removed == 6
+	store.close()
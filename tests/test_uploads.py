@@ -0,0 +1,80 @@
+import io
+import os
+import csv
+import math
+import zipfile
+import pytest
+from SESAMI.uploads import MAX_ITEMS, UploadError, UploadRuns, read_upload
+from SESAMI.jobs import JobQueue, QueueFull
+from SESAMI.calculation import run_analysis
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+def example_csv():
+	with open(f"{MAIN_PATH}example_input/example_input.txt") as f:
+		lines = f.read().split("\n")[1:]
+	return "Pressure (Pa),Loading (mol/kg)\n" + "".join(line.replace("\t", ",") + "\n" for line in lines if line)
+
+
+def zipped(files):
+	content = io.BytesIO()
+	with zipfile.ZipFile(content, "w") as archive:
+		for name, data in files.items():
+			archive.writestr(name, data)
+	return content.getvalue()
+
+
+def test_read_upload():
+	with open(f"{MAIN_PATH}example_input/example_loading_data.aif", "rb") as f:
+		aif = f.read()
+	content = zipped({
+		"series/a.csv": example_csv(),
+		"series/b.aif": aif,
+		"series/bad.csv": "Pressure (Pa),Loading (mol/kg)\n1,a\n",
+		"__MACOSX/series/._a.csv": "not an isotherm",
+		"notes.md": "not an isotherm either",
+	})
+	items = read_upload([("isotherms.zip", content), ("c.txt", example_csv().replace(",", "\t").encode())])
+	assert [item.name for item in items] == ["series/a", "series/b", "series/bad", "notes", "c"]
+	assert [item.valid for item in items] == [True, True, False, False, True]
+	assert items[2].message.startswith("The CSV must contain numbers only.")
+	assert items[3].message.startswith("Unsupported file type.")
+	assert items[0].isotherm.loading.tolist() == items[4].isotherm.loading.tolist()
+	assert items[1].isotherm.pressure[:3].tolist() == [1.0, 5.0, 10.0] # In Pa, from the AIF.
+
+	with pytest.raises(UploadError, match="could not be read as a ZIP"):
+		read_upload([("isotherms.zip", b"not a zip")])
+	with pytest.raises(UploadError, match="No isotherms"):
+		read_upload([("isotherms.zip", zipped({"__MACOSX/._a.csv": ""}))])
+	with pytest.raises(UploadError, match=f"At most {MAX_ITEMS}"):
+		read_upload([(f"{i}.csv", b"") for i in range(MAX_ITEMS + 1)])
+
+
+def test_upload_run():
+	items = read_upload([("a.csv", example_csv().encode()), ("bad.csv", b"Pressure (Pa)\n1\n"), ("b.csv", example_csv().encode())])
+	options = {'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'Yes'}
+	job_queue = JobQueue(max_workers=1, max_pending=1)
+	runs = UploadRuns()
+	try:
+		run = runs.start(items, lambda item: job_queue.submit(run_analysis, MAIN_PATH, options, item.isotherm.to_frame(), owner='user'), owner='user')
+		with pytest.raises(QueueFull): # One unfinished upload per user.
+			runs.start(items, None, owner='user')
+		run.join(timeout=120)
+	finally:
+		job_queue.shutdown()
+
+	info = run.info()
+	assert info["finished"] and info["n_items"] == info["n_finished"] == 3
+	assert [item["status"] for item in info["items"]] == ["done", "invalid", "done"]
+	results = info["items"][0]["results"]
+	assert results["status"] == "OK" and type(results["BET_length_linear_region"]) == int # Plain numbers, to be sent as JSON.
+	# Same values as the first test case of test_SESAMI_1.py, and the benchmark of test_SESAMI_2.py
+	assert math.isclose(results["BET_A_BET"], 2430.9096636176737, rel_tol=1e-6)
+	assert f"{results['ML_prediction']:.2f}" == "2099.06"
+
+	rows = list(csv.DictReader(io.StringIO(run.summary_csv())))
+	assert [row["name"] for row in rows] == ["a", "bad", "b"]
+	assert rows[1]["status"].startswith("Wrong number of columns")
+	assert rows[0]["BETESW_A_BET"] == rows[2]["BETESW_A_BET"] != ""
+	assert runs.get(run.id, owner='user') is run and runs.get(run.id, owner='someone else') is None
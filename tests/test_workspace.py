@@ -0,0 +1,111 @@
+import os
+import pickle
+import time
+import pytest
+from SESAMI.calculation import run_calculation_batch
+from SESAMI.SESAMI_1.figures import PanelRenderer, render_on_request
+from SESAMI.workspace import FileBatch, MemoryWorkspace, SQLiteWorkspace, make_workspace
+
+MAIN_PATH = os.path.abspath(".") + "/"
+
+
+@pytest.fixture(params=["disk", "memory", "sqlite"])
+def workspace(request, tmp_path):
+	setting = f"sqlite:{tmp_path}/workspace.sqlite" if request.param == "sqlite" else request.param
+	workspace = make_workspace(setting, str(tmp_path / "sessions"))
+	yield workspace
+	workspace.close()
+
+
+def test_workspace_files(workspace):
+	files = workspace.create("user")
+	assert files.read("input.txt") is None and files.version("input.txt") is None
+	files.write("input.txt", b"Pressure\tLoading\n")
+	version = files.version("input.txt")
+	assert files.read("input.txt") == b"Pressure\tLoading\n" and files.exists("input.txt")
+	files.write("input.txt", b"Pressure\tLoading\n1\t2\n")
+	assert files.version("input.txt") != version
+	files.copy("input.txt", "copy.txt")
+	assert sorted(workspace.files("user").names()) == ["copy.txt", "input.txt"]
+	assert workspace.files("someone else").names() == []
+
+	# Only plain file names are allowed, so a session's files can not reach outside of it.
+	assert files.read("../input.txt") is None
+	with pytest.raises(ValueError):
+		files.write("../input.txt", b"")
+
+
+def test_calculation_batch(workspace):
+	# A calculation in a worker process writes its figures to a FileBatch, which is then stored in the workspace.
+	files = workspace.create("user")
+	with open(f"{MAIN_PATH}example_input/example_input.txt", "rb") as f:
+		files.write("input.txt", f.read())
+	user_options = {'dpi': '72', 'font size': '10', 'font type': 'sans-serif', 'legend': 'Yes', 'R2 cutoff': '0.9995', 'R2 min': '0.998',
+		'gas': 'Argon', 'scope': 'BET and BET+ESW', 'ML': 'No', 'custom adsorbate': 'No'}
+	batch = pickle.loads(pickle.dumps(FileBatch.of(files, read=["input.txt"]))) # As sent to a worker process.
+	results, batch = run_calculation_batch(MAIN_PATH, user_options, "user", 0, None, batch)
+	assert 'BET area = 2430.9 m2sup/g' in results['BET_analysis']
+	assert not files.exists("multiplot_0.png")
+	pickle.loads(pickle.dumps(batch)).apply(files)
+	assert files.exists("multiplot_0.png") and files.exists("panels_0.pickle")
+
+	# The individual figures are drawn in the workspace.
+	assert render_on_request("BETPlot_0.png", files=files)
+	assert files.read("BETPlot_0.png").startswith(b"\x89PNG")
+	assert not render_on_request("input_0.png", files=files)
+
+	# Asking for one figure through a PanelRenderer draws the others of its multiplot as well, in the background, each once.
+	renderer = PanelRenderer(max_workers=2)
+	saved = []
+	write = files.write
+	files.write = lambda name, data: saved.append(name) or write(name, data)
+	try:
+		assert renderer.render("user", "ESWPlot_0.png", files)
+		assert "ESWPlot_0.png" in saved
+		assert not renderer.render("user", "input_0.png", files)
+		assert not renderer.render("user", "isotherm_9.png", files) # No such calculation.
+	finally:
+		renderer.shutdown()
+	assert sorted(saved) == ["BETESWPlot_0.png", "BETPlotLinear_0.png", "ESWPlot_0.png", "isotherm_0.png"] # BETPlot_0.png was already saved.
+	assert not renderer.pending
+	assert files.read("isotherm_0.png").startswith(b"\x89PNG")
+
+	# Once a calculation is done, start draws all of its figures in the background, as the same PNGs.
+	other = workspace.create("other")
+	for name in ("multiplot_0.png", "panels_0.pickle"):
+		other.write(name, files.read(name))
+	renderer = PanelRenderer(max_workers=2)
+	try:
+		renderer.start("other", other, 0)
+		renderer.start("other", other, 9) # No such calculation.
+		assert renderer.render("other", "BETPlotLinear_0.png", other)
+	finally:
+		renderer.shutdown()
+	for name in ["isotherm", "BETPlotLinear", "BETPlot", "ESWPlot", "BETESWPlot"]:
+		assert other.read(f"{name}_0.png") == files.read(f"{name}_0.png")
+
+
+def test_memory_workspace_limits():
+	expired = []
+	workspace = MemoryWorkspace(max_bytes=250, max_age=10, on_expire=expired.append)
+	for i in range(3):
+		workspace.create(str(i)).write("input.txt", b"x" * 100)
+	assert list(workspace.sessions) == ["1", "2"] and workspace.nbytes == 200 # The least recently used session was dropped.
+	workspace.files("1")
+	workspace.used["2"] -= 20
+	assert workspace.expire() == 1 and list(workspace.sessions) == ["1"]
+	assert expired == ["0", "2"]
+
+
+def test_sqlite_workspace_expiry(tmp_path):
+	expired = []
+	workspace = SQLiteWorkspace(str(tmp_path / "workspace.sqlite"), max_age=10, on_expire=expired.append)
+	workspace.create("old").write("input.txt", b"old")
+	workspace.create("new").write("input.txt", b"new")
+	assert workspace.expire(now=time.time() + 100) == 2
+	assert expired == ["old", "new"] and workspace.files("old").read("input.txt") is None
+
+	# Sent to other processes (e.g. the job queue's workers) along with the files.
+	files = pickle.loads(pickle.dumps(workspace.files("new")))
+	files.write("input.txt", b"from a worker")
+	assert workspace.files("new").read("input.txt") == b"from a worker"